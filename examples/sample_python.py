@@ -2,6 +2,12 @@
 Example source files for testing the MDTD system
 """
 
+import math
+import re
+from bisect import bisect_right
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 # Example Python functions to test
 def add(a, b):
     """Add two numbers together"""
@@ -25,14 +31,37 @@ def is_prime(n):
             return False
     return True
 
+def is_prime_batch(numbers):
+    """Check a batch of integers for primality with one shared sieve"""
+    numbers = list(numbers)
+    if any(not isinstance(n, int) for n in numbers):
+        raise TypeError("Inputs must be integers")
+    if not numbers:
+        return []
+
+    limit = max(math.isqrt(max(max(numbers), 0)), 1)
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[:2] = b'\x00\x00'[:limit + 1]
+    for i in range(2, math.isqrt(limit) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    primes = [i for i in range(2, limit + 1) if sieve[i]]
+
+    results = []
+    for n in numbers:
+        if n < 2:
+            results.append(False)
+            continue
+        candidates = primes[:bisect_right(primes, math.isqrt(n))]
+        results.append(all(n % p for p in candidates))
+    return results
+
 def validate_email(email):
     """Validate email address format"""
-    import re
     if not isinstance(email, str):
         raise TypeError("Email must be a string")
 
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return EMAIL_PATTERN.match(email) is not None
 
 class Calculator:
     """Simple calculator class"""
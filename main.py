@@ -6,17 +6,33 @@ Main application entry point for multi-language source analysis and test generat
 
 import asyncio
 import argparse
-import json
+import atexit
+import functools
+import hashlib
 import logging
+import os
+import pickle
+import queue
+import sys
+import time
+from collections import OrderedDict, deque
+from itertools import chain
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Optional
+from stat import S_ISREG
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
 
-from src.file_analyzer import FileAnalyzer
+from src.file_analyzer import FileAnalyzer, FunctionInfo
 from src.llm_controller import LLMController
+from src.llm_cache import GenerationCache
 from src.test_generator import TestGenerator
 from src.web_interface import WebInterface
 from src.report_generator import ReportGenerator
+from src.scenarios import ScenarioColumns
 from src.config import Config
+from src.registry import get_shared
+from src.serialization import dumps_compact, write_analysis_json, write_json, write_json_stream
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +41,97 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bump when the shape of analysis results changes to invalidate cached entries
+ANALYSIS_CACHE_VERSION = 2
+ANALYSIS_MEMORY_CACHE_SIZE = 8
+
+# Functions per worker-thread task when building MDTD scenarios
+SCENARIO_CHUNK_SIZE = 256
+SCENARIO_PREFETCH_CHUNKS = 4
+# Distinct function signatures whose scenarios are memoized
+SCENARIO_CACHE_SIZE = 4096
+
+# Parameter type names that select the numeric/string MDTD scenario templates
+# (dispatch goes through the *_TEMPLATES_BY_TYPE tables below)
+NUMERIC_TYPES: FrozenSet[str] = frozenset({'int', 'float', 'number'})
+STRING_TYPES: FrozenSet[str] = frozenset({'string', 'str'})
+
+# Shared read-only scenario skeletons; 'function' and 'parameter' are filled in per call
+# (the placeholders keep the key order of the emitted scenarios stable)
+NUMERIC_PARTITION_TEMPLATES: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
+        'type': 'equivalence_partition',
+        'category': 'positive_numbers',
+        'function': None,
+        'parameter': None,
+        'test_values': (1, 10, 100, 1.5, 3.14),
+        'expected_behavior': 'normal_operation'
+    }),
+    MappingProxyType({
+        'type': 'equivalence_partition',
+        'category': 'negative_numbers',
+        'function': None,
+        'parameter': None,
+        'test_values': (-1, -10, -100, -1.5, -3.14),
+        'expected_behavior': 'normal_operation'
+    }),
+    MappingProxyType({
+        'type': 'equivalence_partition',
+        'category': 'zero',
+        'function': None,
+        'parameter': None,
+        'test_values': (0, 0.0),
+        'expected_behavior': 'edge_case'
+    })
+)
+STRING_PARTITION_TEMPLATES: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
+        'type': 'equivalence_partition',
+        'category': 'valid_strings',
+        'function': None,
+        'parameter': None,
+        'test_values': ('hello', 'test123', 'valid_input'),
+        'expected_behavior': 'normal_operation'
+    }),
+    MappingProxyType({
+        'type': 'equivalence_partition',
+        'category': 'empty_strings',
+        'function': None,
+        'parameter': None,
+        'test_values': ('', '   ', None),
+        'expected_behavior': 'edge_case'
+    })
+)
+NUMERIC_BOUNDARY_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    'type': 'boundary_value',
+    'category': 'numeric_boundaries',
+    'function': None,
+    'parameter': None,
+    'test_values': (float('-inf'), -1000000, -1, 0, 1, 1000000, float('inf')),
+    'expected_behavior': 'boundary_testing'
+})
+PARTITION_TEMPLATES_BY_TYPE: Dict[str, Tuple[Mapping[str, Any], ...]] = {
+    **dict.fromkeys(NUMERIC_TYPES, NUMERIC_PARTITION_TEMPLATES),
+    **dict.fromkeys(STRING_TYPES, STRING_PARTITION_TEMPLATES)
+}
+BOUNDARY_TEMPLATES_BY_TYPE: Dict[str, Tuple[Mapping[str, Any], ...]] = dict.fromkeys(
+    NUMERIC_TYPES, (NUMERIC_BOUNDARY_TEMPLATE,)
+)
+TYPE_ERROR_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    'type': 'error_condition',
+    'category': 'type_errors',
+    'function': None,
+    'test_values': (None, (), {}, 'invalid_type'),
+    'expected_behavior': 'error_handling'
+})
+STATE_TRANSITION_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    'type': 'state_transition',
+    'category': 'state_changes',
+    'function': None,
+    'test_sequence': ('init', 'action1', 'action2', 'verify'),
+    'expected_behavior': 'state_verification'
+})
+
 
 class MDTDTestEngine:
     """
@@ -34,11 +141,16 @@ class MDTDTestEngine:
 
     def __init__(self, config: Config):
         self.config = config
-        self.file_analyzer = FileAnalyzer(config)
+        # Stateless subsystems are shared by every engine with an equal config;
+        # the LLM controller holds per-run state and loop-bound clients
+        self.file_analyzer = get_shared(FileAnalyzer, config)
         self.llm_controller = LLMController(config)
-        self.test_generator = TestGenerator(config)
-        self.web_interface = WebInterface(config)
-        self.report_generator = ReportGenerator(config)
+        self.test_generator = get_shared(TestGenerator, config)
+        self.web_interface = get_shared(WebInterface, config)
+        self.report_generator = get_shared(ReportGenerator, config)
+        self._cache_dir = Path(config.cache_dir) if config.cache_dir else None
+        self._analysis_cache: OrderedDict = OrderedDict()
+        self.llm_cache = GenerationCache(config)
 
     async def analyze_and_generate_tests(
         self,
@@ -57,36 +169,63 @@ class MDTDTestEngine:
         """
         try:
             logger.info("Starting analysis of: {}".format(source_path))
+            timings = {}
+            checkpoints = [time.perf_counter_ns()]
+
+            def mark(stage):
+                checkpoints.append(time.perf_counter_ns())
+                timings[stage] = (checkpoints[-1] - checkpoints[-2]) // 1_000_000
 
             # Step 1: Analyze source files
-            analysis_result = await self.file_analyzer.analyze(source_path)
-            logger.info("Analysis completed. Found {} functions".format(len(analysis_result.get('functions', []))))
+            analysis_result = await self.analyze_source(source_path)
+            mark('analysis_ms')
 
             # Step 2: Extract test scenarios using MDTD principles
             test_scenarios = await self.extract_test_scenarios(analysis_result)
-            logger.info("Generated {} test scenarios".format(len(test_scenarios)))
+            mark('scenarios_ms')
 
             # Step 3: Generate tests using LLM
-            generated_tests = await self.llm_controller.generate_comprehensive_tests(
-                analysis_result, test_scenarios
+            # Batch API jobs have a 24h completion window, so the stage timeout
+            # only bounds direct requests
+            stage_timeout = None if self.config.batch_mode else (self.config.llm_timeout or None)
+            # Transient errors are retried per request by the controller
+            generated_tests = await asyncio.wait_for(
+                self.generate_llm_tests(analysis_result, test_scenarios),
+                timeout=stage_timeout
             )
-            logger.info("AI test generation completed")
-
-            # Step 4: Create test cases for web interface
-            web_test_cases = await self.test_generator.create_web_test_cases(
-                generated_tests, output_format
+            mark('llm_ms')
+
+            async def build_interface():
+                # Step 4: Create test cases for web interface
+                web_test_cases = await self.test_generator.create_web_test_cases(
+                    generated_tests, output_format
+                )
+
+                # Step 5: Generate HTML interface (plain CPU-bound string building)
+                return self.web_interface.create_test_interface(web_test_cases)
+
+            # Step 6: Generate comprehensive report (it does not depend on the
+            # HTML interface, so it runs alongside steps 4 and 5)
+            html_interface, report = await asyncio.gather(
+                build_interface(),
+                self.report_generator.generate_report({
+                    'source_analysis': analysis_result,
+                    'test_scenarios': test_scenarios,
+                    'generated_tests': generated_tests
+                })
             )
-
-            # Step 5: Generate HTML interface
-            html_interface = await self.web_interface.create_test_interface(web_test_cases)
-
-            # Step 6: Generate comprehensive report
-            report = await self.report_generator.generate_report({
-                'source_analysis': analysis_result,
-                'test_scenarios': test_scenarios,
-                'generated_tests': generated_tests,
-                'web_interface': html_interface
-            })
+            mark('output_ms')
+            timings['total_ms'] = (checkpoints[-1] - checkpoints[0]) // 1_000_000
+
+            if logger.isEnabledFor(logging.INFO):
+                counts = {
+                    'functions': len(analysis_result.get('functions', [])),
+                    'scenarios': len(test_scenarios)
+                }
+                logger.info(
+                    "Pipeline completed: counts=%s timings=%s", counts, timings,
+                    extra={'counts': counts, 'timings': timings}
+                )
 
             return {
                 'analysis': analysis_result,
@@ -97,6 +236,12 @@ class MDTDTestEngine:
                 'success': True
             }
 
+        except asyncio.TimeoutError:
+            logger.error(f"LLM test generation timed out after {self.config.llm_timeout}s")
+            return {
+                'error': f"LLM test generation timed out after {self.config.llm_timeout}s",
+                'success': False
+            }
         except Exception as e:
             logger.error("Error in test generation: {}".format(str(e)))
             return {
@@ -104,6 +249,164 @@ class MDTDTestEngine:
                 'success': False
             }
 
+    async def analyze_source(self, source_path: Path) -> Dict:
+        """
+        Analyze source files, reusing cached results for unchanged inputs
+
+        Results are cached in memory and, when ``cache_dir`` is configured,
+        pickled to disk keyed by a hash of the source content (or, for
+        directories, of every supported file's path, mtime and size).
+
+        Args:
+            source_path: Path to source file or directory
+
+        Returns:
+            Analysis results as returned by FileAnalyzer.analyze
+        """
+        key = self._analysis_cache_key(source_path)
+
+        analysis_result = self._analysis_cache.get(key)
+        if analysis_result is not None:
+            self._analysis_cache.move_to_end(key)
+            return analysis_result
+
+        analysis_result = self._load_cached_analysis(key)
+        if analysis_result is None:
+            analysis_result = await self.file_analyzer.analyze(source_path)
+            self._store_cached_analysis(key, analysis_result)
+        else:
+            logger.info("Using cached analysis for: {}".format(source_path))
+
+        self._analysis_cache[key] = analysis_result
+        if len(self._analysis_cache) > ANALYSIS_MEMORY_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+
+        return analysis_result
+
+    def _analysis_cache_key(self, source_path: Path) -> str:
+        """Build the cache key for a source file or directory"""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"v{ANALYSIS_CACHE_VERSION}:{source_path.resolve()}".encode('utf-8'))
+
+        if S_ISREG(source_path.stat().st_mode):
+            digest.update(source_path.read_bytes())
+        else:
+            for file_path in sorted(self.file_analyzer.iter_source_files(source_path)):
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                if S_ISREG(stat.st_mode):
+                    digest.update(f"\0{file_path}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def _load_cached_analysis(self, key: str) -> Optional[Dict]:
+        """Load a pickled analysis result from the on-disk cache"""
+        if self._cache_dir is None:
+            return None
+
+        try:
+            return pickle.loads((self._cache_dir / f'{key}.pkl').read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable analysis cache entry {key}: {str(e)}")
+            return None
+
+    def _store_cached_analysis(self, key: str, analysis_result: Dict):
+        """Atomically write an analysis result to the on-disk cache"""
+        if self._cache_dir is None:
+            return
+
+        cache_file = self._cache_dir / f'{key}.pkl'
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(pickle.dumps(analysis_result, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Could not write analysis cache entry {key}: {str(e)}")
+
+    async def generate_llm_tests(self, analysis_result: Dict, test_scenarios: List[Dict]) -> Dict:
+        """
+        Generate LLM tests with per-function requests fanned out concurrently
+
+        Each function gets its own request; at most ``max_concurrency``
+        requests are in flight at once. With
+        ``llm_continuous_batching`` enabled, functions are instead packed
+        several to a request.
+        In ``batch_mode`` all requests go through the provider's Batch API.
+        Results are looked up in and stored to the exact-match LLM cache; runs
+        where any request fell back to placeholder output are not cached.
+
+        Args:
+            analysis_result: Results from source code analysis
+            test_scenarios: MDTD test scenarios
+
+        Returns:
+            Generated tests as returned by LLMController.generate_comprehensive_tests
+        """
+        functions = analysis_result.get('functions', [])
+        columns = ScenarioColumns.from_records(test_scenarios)
+
+        cache_prompt = self._llm_cache_prompt(functions, columns)
+        cached_tests = await self.llm_cache.get(cache_prompt)
+        if cached_tests is not None:
+            logger.info("Using cached LLM tests")
+            return cached_tests
+
+        # Requests completed before an interruption are reused when the same run is repeated
+        await self.llm_controller.begin_run(
+            hashlib.blake2b(cache_prompt.encode('utf-8'), digest_size=16).hexdigest()
+        )
+        if self.config.batch_mode:
+            function_tests = await self.llm_controller.submit_batch_file(functions, test_scenarios)
+        elif self.config.llm_continuous_batching:
+            # Every function is known up front, so pack requests directly
+            function_tests = await self.llm_controller.generate_batched_function_tests(
+                functions, test_scenarios
+            )
+        else:
+            # The controller fans requests out under its own concurrency limit
+            function_tests = await self.llm_controller.generate_function_tests(functions, test_scenarios)
+
+        generated_tests = await self.llm_controller.generate_comprehensive_tests(
+            analysis_result, test_scenarios, function_tests=function_tests
+        )
+        await self.llm_controller.end_run()
+
+        if self.llm_controller.failed_requests == 0:
+            await self.llm_cache.put(cache_prompt, generated_tests)
+
+        return generated_tests
+
+    def _llm_cache_prompt(self, functions: List[FunctionInfo], columns: ScenarioColumns) -> str:
+        """Build a canonical description of an LLM generation request for the cache"""
+        request = {
+            'model': self.config.openai_model,
+            'performance': self.config.include_performance_tests,
+            'security': self.config.include_security_tests,
+            'functions': [
+                {
+                    'language': f.language,
+                    'name': f.name,
+                    'parameters': [f"{p.get('name')}:{p.get('type')}" for p in f.parameters],
+                    'return_type': f.return_type,
+                    'complexity': f.complexity,
+                    'has_state': f.has_state,
+                    'error_conditions': f.error_conditions,
+                    'docstring': f.docstring
+                }
+                for f in functions
+            ],
+            'scenarios': [
+                f"{function}:{scenario_type}:{category}"
+                for function, scenario_type, category in zip(columns.functions, columns.types, columns.categories)
+            ]
+        }
+        return dumps_compact(request, sort_keys=True)
+
     async def extract_test_scenarios(self, analysis_result: Dict) -> List[Dict]:
         """
         Extract test scenarios based on MDTD principles
@@ -114,133 +417,164 @@ class MDTDTestEngine:
         Returns:
             List of test scenarios following MDTD methodology
         """
-        scenarios = []
+        return [scenario async for scenario in self.iter_test_scenarios(analysis_result)]
 
-        for function in analysis_result.get('functions', []):
-            # Equivalence partitioning
-            scenarios.extend(self._create_equivalence_partition_tests(function))
+    async def iter_test_scenarios(self, analysis_result: Dict) -> AsyncIterator[Dict]:
+        """
+        Yield test scenarios function by function without materializing them all
 
-            # Boundary value analysis
-            scenarios.extend(self._create_boundary_value_tests(function))
+        Functions are processed in chunks of ``SCENARIO_CHUNK_SIZE`` in worker
+        threads, with up to ``SCENARIO_PREFETCH_CHUNKS`` chunks built ahead of
+        the consumer. Scenarios are yielded in function order.
 
-            # Error condition testing
-            scenarios.extend(self._create_error_condition_tests(function))
+        Args:
+            analysis_result: Results from source code analysis
 
-            # State transition testing (if applicable)
-            if function.has_state:
-                scenarios.extend(self._create_state_transition_tests(function))
+        Yields:
+            Test scenarios following MDTD methodology
+        """
+        functions = analysis_result.get('functions', [])
+        chunks = (
+            functions[i:i + SCENARIO_CHUNK_SIZE]
+            for i in range(0, len(functions), SCENARIO_CHUNK_SIZE)
+        )
+
+        # Builders are synchronous; run each chunk of functions in a worker thread
+        pending: deque = deque()
+        try:
+            for chunk in chunks:
+                pending.append(asyncio.ensure_future(
+                    asyncio.to_thread(self._scenarios_for_functions, chunk)
+                ))
+                if len(pending) >= SCENARIO_PREFETCH_CHUNKS:
+                    for scenario in await pending.popleft():
+                        yield scenario
+
+            while pending:
+                for scenario in await pending.popleft():
+                    yield scenario
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _scenarios_for_functions(self, functions: List[FunctionInfo]) -> List[Dict]:
+        """Build the scenarios for a chunk of functions, in order"""
+        per_function = [self._scenarios_for_function(f) for f in functions]
+
+        # Size the output once instead of growing it function by function
+        scenarios: List[Any] = [None] * sum(map(len, per_function))
+        index = 0
+        for function_scenarios in per_function:
+            scenarios[index:index + len(function_scenarios)] = function_scenarios
+            index += len(function_scenarios)
 
         return scenarios
 
-    def _create_equivalence_partition_tests(self, function) -> List[Dict]:
-        """Create tests based on equivalence partitioning"""
-        tests = []
-
-        for param in function.parameters:
-            param_type = param.get('type', 'unknown')
-
-            if param_type in ['int', 'float', 'number']:
-                tests.extend([
-                    {
-                        'type': 'equivalence_partition',
-                        'category': 'positive_numbers',
-                        'function': function.name,
-                        'parameter': param['name'],
-                        'test_values': [1, 10, 100, 1.5, 3.14],
-                        'expected_behavior': 'normal_operation'
-                    },
-                    {
-                        'type': 'equivalence_partition',
-                        'category': 'negative_numbers',
-                        'function': function.name,
-                        'parameter': param['name'],
-                        'test_values': [-1, -10, -100, -1.5, -3.14],
-                        'expected_behavior': 'normal_operation'
-                    },
-                    {
-                        'type': 'equivalence_partition',
-                        'category': 'zero',
-                        'function': function.name,
-                        'parameter': param['name'],
-                        'test_values': [0, 0.0],
-                        'expected_behavior': 'edge_case'
-                    }
-                ])
-
-            elif param_type in ['string', 'str']:
-                tests.extend([
-                    {
-                        'type': 'equivalence_partition',
-                        'category': 'valid_strings',
-                        'function': function.name,
-                        'parameter': param['name'],
-                        'test_values': ['hello', 'test123', 'valid_input'],
-                        'expected_behavior': 'normal_operation'
-                    },
-                    {
-                        'type': 'equivalence_partition',
-                        'category': 'empty_strings',
-                        'function': function.name,
-                        'parameter': param['name'],
-                        'test_values': ['', '   ', None],
-                        'expected_behavior': 'edge_case'
-                    }
-                ])
-
-        return tests
+    def _scenarios_for_function(self, function: FunctionInfo) -> List[Dict]:
+        """Run every applicable MDTD scenario builder for a single function"""
+        # Interned names let every scenario (and the memo key) share one string object
+        params = tuple(
+            (_intern(p['name']), _intern(p.get('type', 'unknown'))) for p in function.parameters
+        )
+        cached = self._scenarios_for_signature(_intern(function.name), function.has_state, params)
+
+        # Hand out fresh dicts so callers can't modify the cached scenarios
+        return [dict(scenario) for scenario in cached]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=SCENARIO_CACHE_SIZE)
+    def _scenarios_for_signature(
+        name: str,
+        has_state: bool,
+        params: Tuple[Tuple[str, str], ...]
+    ) -> Tuple[Mapping[str, Any], ...]:
+        """Build the scenarios for a function signature, memoized across calls"""
+        function = FunctionInfo(
+            name=name,
+            parameters=[{'name': param_name, 'type': param_type} for param_name, param_type in params],
+            return_type=None,
+            docstring=None,
+            complexity=0,
+            line_number=0,
+            language='',
+            has_state=has_state
+        )
+
+        scenarios = (
+            # Equivalence partitioning
+            MDTDTestEngine._create_equivalence_partition_tests(function)
+            # Boundary value analysis
+            + MDTDTestEngine._create_boundary_value_tests(function)
+            # Error condition testing
+            + MDTDTestEngine._create_error_condition_tests(function)
+        )
 
-    def _create_boundary_value_tests(self, function) -> List[Dict]:
-        """Create boundary value analysis tests"""
-        tests = []
-
-        for param in function.parameters:
-            param_type = param.get('type', 'unknown')
-
-            if param_type in ['int', 'float', 'number']:
-                tests.append({
-                    'type': 'boundary_value',
-                    'category': 'numeric_boundaries',
-                    'function': function.name,
-                    'parameter': param['name'],
-                    'test_values': [
-                        float('-inf'), -1000000, -1, 0, 1, 1000000, float('inf')
-                    ],
-                    'expected_behavior': 'boundary_testing'
-                })
+        # State transition testing (if applicable)
+        if function.has_state:
+            scenarios += MDTDTestEngine._create_state_transition_tests(function)
 
-        return tests
+        return tuple(MappingProxyType(scenario) for scenario in scenarios)
 
-    def _create_error_condition_tests(self, function) -> List[Dict]:
+    @staticmethod
+    def _create_equivalence_partition_tests(function: FunctionInfo) -> List[Dict]:
+        """Create tests based on equivalence partitioning"""
+        return list(chain.from_iterable(
+            MDTDTestEngine._partition_scenarios_for_param(param, function.name)
+            for param in function.parameters
+        ))
+
+    @staticmethod
+    def _partition_scenarios_for_param(param: Dict[str, Any], function_name: str) -> Iterator[Dict]:
+        """Yield the equivalence partition scenarios for one parameter"""
+        templates = PARTITION_TEMPLATES_BY_TYPE.get(param.get('type', 'unknown'), ())
+        fields = {'function': function_name, 'parameter': param['name']}
+        return (template | fields for template in templates)
+
+    @staticmethod
+    def _create_boundary_value_tests(function: FunctionInfo) -> List[Dict]:
+        """Create boundary value analysis tests"""
+        return [
+            template | {'function': function.name, 'parameter': param['name']}
+            for param in function.parameters
+            for template in BOUNDARY_TEMPLATES_BY_TYPE.get(param.get('type', 'unknown'), ())
+        ]
+
+    @staticmethod
+    def _create_error_condition_tests(function: FunctionInfo) -> List[Dict]:
         """Create error condition tests"""
-        tests = []
+        tests: List[Dict] = []
 
         # Type error tests
-        tests.append({
-            'type': 'error_condition',
-            'category': 'type_errors',
-            'function': function.name,
-            'test_values': [None, [], {}, 'invalid_type'],
-            'expected_behavior': 'error_handling'
-        })
+        tests.append(TYPE_ERROR_TEMPLATE | {'function': function.name})
 
         return tests
 
-    def _create_state_transition_tests(self, function) -> List[Dict]:
+    @staticmethod
+    def _create_state_transition_tests(function: FunctionInfo) -> List[Dict]:
         """Create state transition tests for stateful functions"""
-        tests = []
+        tests: List[Dict] = []
 
         # This would be expanded based on state analysis
-        tests.append({
-            'type': 'state_transition',
-            'category': 'state_changes',
-            'function': function.name,
-            'test_sequence': ['init', 'action1', 'action2', 'verify'],
-            'expected_behavior': 'state_verification'
-        })
+        tests.append(STATE_TRANSITION_TEMPLATE | {'function': function.name})
 
         return tests
 
 
+def _intern(value):
+    """Intern strings (analyzers may report None for unknown names/types)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+async def _write_bytes(path: Path, data: bytes):
+    """Write an already-encoded file without blocking the event loop"""
+    await asyncio.to_thread(path.write_bytes, data)
+
+
+async def _write_json(path: Path, obj):
+    """Serialize and write a JSON file without blocking the event loop"""
+    await asyncio.to_thread(write_json, path, obj)
+
+
 async def main():
     """Main application entry point"""
     parser = argparse.ArgumentParser(description='AI-Assisted MDTD Test Generator')
@@ -250,6 +584,8 @@ async def main():
                        help='Output format')
     parser.add_argument('--config', '-c', help='Configuration file path')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--batch', action='store_true',
+                       help='Use the provider Batch API (cheaper, higher latency)')
 
     args = parser.parse_args()
 
@@ -258,17 +594,24 @@ async def main():
 
     # Load configuration
     config = Config.load(args.config) if args.config else Config()
+    if args.batch:
+        config.batch_mode = True
 
     # Initialize test engine
     engine = MDTDTestEngine(config)
 
     # Run analysis and generation
     source_path = Path(args.source)
-    if not source_path.exists():
+    try:
+        source_path.stat()
+    except FileNotFoundError:
         logger.error(f"Source path does not exist: {source_path}")
         return 1
 
-    result = await engine.analyze_and_generate_tests(source_path, args.format)
+    try:
+        result = await engine.analyze_and_generate_tests(source_path, args.format)
+    finally:
+        await engine.llm_controller.aclose()
 
     if result['success']:
         # Create timestamped output directory if not specified
@@ -279,88 +622,57 @@ async def main():
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_dir = Path(f"generated_{timestamp}")
 
-        output_dir.mkdir(exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"Creating output directory: {output_dir}")
 
-        # Save HTML interface
         html_file = output_dir / 'test_interface.html'
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(result['web_interface'])
-
-        # Save analysis results
         analysis_file = output_dir / 'source_analysis.json'
-        with open(analysis_file, 'w', encoding='utf-8') as f:
-            # Convert dataclass objects to dict for JSON serialization
-            analysis = result['analysis']
-            serializable_analysis = {}
-            for key, value in analysis.items():
-                if key == 'functions':
-                    serializable_analysis[key] = [
-                        {
-                            'name': f.name,
-                            'parameters': f.parameters,
-                            'return_type': f.return_type,
-                            'docstring': f.docstring,
-                            'complexity': f.complexity,
-                            'line_number': f.line_number,
-                            'language': f.language,
-                            'visibility': f.visibility,
-                            'is_static': f.is_static,
-                            'has_state': f.has_state,
-                            'error_conditions': f.error_conditions
-                        } for f in value
-                    ]
-                elif key == 'classes':
-                    serializable_analysis[key] = [
-                        {
-                            'name': c.name,
-                            'methods': [m.name for m in c.methods],
-                            'attributes': c.attributes,
-                            'inheritance': c.inheritance,
-                            'language': c.language,
-                            'line_number': c.line_number
-                        } for c in value
-                    ]
-                else:
-                    serializable_analysis[key] = value
-
-            json.dump(serializable_analysis, f, indent=2, default=str)
-
-        # Save test scenarios
         scenarios_file = output_dir / 'test_scenarios.json'
-        with open(scenarios_file, 'w', encoding='utf-8') as f:
-            json.dump(result.get('scenarios', []), f, indent=2, default=str)
-
-        # Save generated tests
         tests_file = output_dir / 'generated_tests.json'
-        with open(tests_file, 'w', encoding='utf-8') as f:
-            json.dump(result.get('tests', {}), f, indent=2, default=str)
 
-        # Save report (with error handling)
-        try:
-            if result.get('report'):
-                report_file = output_dir / 'detailed_report.json'
-                with open(report_file, 'w', encoding='utf-8') as f:
-                    json.dump(result['report'], f, indent=2, default=str)
-        except Exception as e:
-            logger.warning(f"Could not save detailed report: {str(e)}")
-            # Create simple summary instead
-            summary_file = output_dir / 'summary_report.json'
-            simple_report = {
-                'timestamp': datetime.now().isoformat(),
-                'source_file': str(source_path),
-                'functions_analyzed': len(result['analysis'].get('functions', [])),
-                'test_scenarios_generated': len(result.get('scenarios', [])),
-                'files_generated': [
-                    html_file.name,
-                    analysis_file.name,
-                    scenarios_file.name,
-                    tests_file.name
-                ]
-            }
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(simple_report, f, indent=2, default=str)
+        # Stream analysis results (dataclass objects converted per item)
+        analysis_task = asyncio.ensure_future(
+            asyncio.to_thread(write_analysis_json, analysis_file, result['analysis'])
+        )
+
+        async def save_report():
+            """Save report (with error handling)"""
+            try:
+                report = result.get('report')
+                if report:
+                    report_file = output_dir / 'detailed_report.json'
+                    # Appendices are lazy; stream them rather than encoding the report in one buffer
+                    await asyncio.to_thread(write_json_stream, report_file, report)
+            except Exception as e:
+                logger.warning(f"Could not save detailed report: {str(e)}")
+                # Create simple summary instead
+                from datetime import datetime
+                function_count, _ = await analysis_task
+                summary_file = output_dir / 'summary_report.json'
+                simple_report = {
+                    'timestamp': datetime.now().isoformat(),
+                    'source_file': str(source_path),
+                    'functions_analyzed': function_count,
+                    'test_scenarios_generated': len(result.get('scenarios', [])),
+                    'files_generated': [
+                        html_file.name,
+                        analysis_file.name,
+                        scenarios_file.name,
+                        tests_file.name
+                    ]
+                }
+                await _write_json(summary_file, simple_report)
+
+        # Save HTML interface, analysis results, scenarios, tests and report concurrently
+        await asyncio.gather(
+            _write_bytes(html_file, result['web_interface']),
+            asyncio.to_thread(engine.web_interface.copy_static_assets, output_dir),
+            analysis_task,
+            _write_json(scenarios_file, result.get('scenarios', [])),
+            _write_json(tests_file, result.get('tests', {})),
+            save_report()
+        )
 
         logger.info(f"Test generation completed successfully!")
         logger.info(f"Output directory: {output_dir}")
@@ -375,6 +687,40 @@ async def main():
         return 1
 
 
+def install_event_loop():
+    """Use uvloop's faster event loop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
+def install_queue_logging() -> QueueListener:
+    """
+    Route log records through a queue drained by a single background thread
+
+    Analyzer worker threads then only enqueue records instead of contending
+    for the handler lock and writing to the stream themselves.
+
+    Returns:
+        The started listener (stopped automatically at exit)
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
 if __name__ == "__main__":
+    install_queue_logging()
+    install_event_loop()
     exit_code = asyncio.run(main())
     exit(exit_code)
@@ -12,8 +12,9 @@ from datetime import datetime
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from main import MDTDTestEngine
+from main import MDTDTestEngine, install_event_loop, install_queue_logging
 from src.config import Config
+from src.serialization import write_analysis_json, write_json, write_json_stream
 
 async def setup_demo():
     """Set up and run a demonstration of the MDTD system"""
@@ -41,7 +42,10 @@ async def setup_demo():
         print("-" * 40)
 
         # Run the analysis and test generation
-        result = await engine.analyze_and_generate_tests(example_file, "html")
+        try:
+            result = await engine.analyze_and_generate_tests(example_file, "html")
+        finally:
+            await engine.llm_controller.aclose()
 
         if result['success']:
             print("Analysis and test generation completed successfully!")
@@ -49,10 +53,13 @@ async def setup_demo():
 
             # Display summary
             analysis = result['analysis']
+            function_count = len(analysis.get('functions', []))
+            class_count = len(analysis.get('classes', []))
+            scenario_count = len(result.get('scenarios', []))
             print("SUMMARY:")
-            print(f"   - Functions analyzed: {len(analysis.get('functions', []))}")
-            print(f"   - Classes found: {len(analysis.get('classes', []))}")
-            print(f"   - Test scenarios generated: {len(result.get('scenarios', []))}")
+            print(f"   - Functions analyzed: {function_count}")
+            print(f"   - Classes found: {class_count}")
+            print(f"   - Test scenarios generated: {scenario_count}")
             print(f"   - Language distribution: {analysis.get('language_distribution', {})}")
 
             # Create timestamped output directory
@@ -62,62 +69,22 @@ async def setup_demo():
 
             print(f"\nCreating output directory: {output_dir}")
 
-            # Save HTML interface
             html_file = output_dir / "test_interface.html"
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(result['web_interface'])
-
-            # Save analysis results
-            import json
             analysis_file = output_dir / "source_analysis.json"
-            with open(analysis_file, 'w', encoding='utf-8') as f:
-                # Convert dataclass objects to dict for JSON serialization
-                serializable_analysis = {}
-                for key, value in analysis.items():
-                    if key == 'functions':
-                        serializable_analysis[key] = [
-                            {
-                                'name': f.name,
-                                'parameters': f.parameters,
-                                'return_type': f.return_type,
-                                'docstring': f.docstring,
-                                'complexity': f.complexity,
-                                'line_number': f.line_number,
-                                'language': f.language,
-                                'visibility': f.visibility,
-                                'is_static': f.is_static,
-                                'has_state': f.has_state,
-                                'error_conditions': f.error_conditions
-                            } for f in value
-                        ]
-                    elif key == 'classes':
-                        serializable_analysis[key] = [
-                            {
-                                'name': c.name,
-                                'methods': [m.name for m in c.methods],
-                                'attributes': c.attributes,
-                                'inheritance': c.inheritance,
-                                'language': c.language,
-                                'line_number': c.line_number
-                            } for c in value
-                        ]
-                    else:
-                        serializable_analysis[key] = value
-
-                json.dump(serializable_analysis, f, indent=2, default=str)
-
-            # Save test scenarios
             scenarios_file = output_dir / "test_scenarios.json"
-            with open(scenarios_file, 'w', encoding='utf-8') as f:
-                json.dump(result.get('scenarios', []), f, indent=2, default=str)
-
-            # Save generated tests
             tests_file = output_dir / "generated_tests.json"
-            with open(tests_file, 'w', encoding='utf-8') as f:
-                json.dump(result.get('tests', {}), f, indent=2, default=str)
+            web_tests_file = output_dir / "web_test_cases.json"
+
+            # Save analysis results, HTML interface, scenarios and generated tests
+            tasks = [
+                asyncio.to_thread(write_analysis_json, analysis_file, analysis),
+                asyncio.to_thread(html_file.write_bytes, result['web_interface']),
+                asyncio.to_thread(engine.web_interface.copy_static_assets, output_dir),
+                asyncio.to_thread(write_json, scenarios_file, result.get('scenarios', [])),
+                asyncio.to_thread(write_json, tests_file, result.get('tests', {})),
+            ]
 
             # Save web test cases separately
-            web_tests_file = output_dir / "web_test_cases.json"
             if 'tests' in result and 'function_tests' in result['tests']:
                 web_test_data = {}
                 for func_test in result['tests']['function_tests']:
@@ -128,40 +95,44 @@ async def setup_demo():
                         'language': func_test.get('language', 'unknown')
                     }
 
-                with open(web_tests_file, 'w', encoding='utf-8') as f:
-                    json.dump(web_test_data, f, indent=2, default=str)
-
-            # Create a simple report even if detailed report fails
-            try:
-                if result.get('report'):
-                    report_file = output_dir / "detailed_report.json"
-                    with open(report_file, 'w', encoding='utf-8') as f:
-                        json.dump(result['report'], f, indent=2, default=str)
-            except Exception as e:
-                print(f"Warning: Could not save detailed report: {str(e)}")
-
-                # Create a simple summary report
-                simple_report = {
-                    'timestamp': datetime.now().isoformat(),
-                    'summary': {
-                        'functions_analyzed': len(analysis.get('functions', [])),
-                        'classes_found': len(analysis.get('classes', [])),
-                        'test_scenarios_generated': len(result.get('scenarios', [])),
-                        'language_distribution': analysis.get('language_distribution', {}),
-                        'complexity_metrics': analysis.get('complexity_metrics', {})
-                    },
-                    'files_generated': [
-                        str(html_file.name),
-                        str(analysis_file.name),
-                        str(scenarios_file.name),
-                        str(tests_file.name),
-                        str(web_tests_file.name)
-                    ]
-                }
-
-                summary_file = output_dir / "summary_report.json"
-                with open(summary_file, 'w', encoding='utf-8') as f:
-                    json.dump(simple_report, f, indent=2, default=str)
+                tasks.append(asyncio.to_thread(write_json, web_tests_file, web_test_data))
+
+            async def save_report():
+                """Save the detailed report, falling back to a simple summary"""
+                # Create a simple report even if detailed report fails
+                try:
+                    if result.get('report'):
+                        report_file = output_dir / "detailed_report.json"
+                        await asyncio.to_thread(write_json_stream, report_file, result['report'])
+                except Exception as e:
+                    print(f"Warning: Could not save detailed report: {str(e)}")
+
+                    # Create a simple summary report
+                    simple_report = {
+                        'timestamp': datetime.now().isoformat(),
+                        'summary': {
+                            'functions_analyzed': function_count,
+                            'classes_found': class_count,
+                            'test_scenarios_generated': scenario_count,
+                            'language_distribution': analysis.get('language_distribution', {}),
+                            'complexity_metrics': analysis.get('complexity_metrics', {})
+                        },
+                        'files_generated': [
+                            str(html_file.name),
+                            str(analysis_file.name),
+                            str(scenarios_file.name),
+                            str(tests_file.name),
+                            str(web_tests_file.name)
+                        ]
+                    }
+
+                    summary_file = output_dir / "summary_report.json"
+                    await asyncio.to_thread(write_json, summary_file, simple_report)
+
+            tasks.append(save_report())
+
+            # Disk writes are independent, so overlap them
+            await asyncio.gather(*tasks)
 
             print()
             print(f"Test interface saved to: {html_file}")
@@ -184,6 +155,8 @@ def main():
     print("Setting up the MDTD Test Engineering system...")
 
     try:
+        install_queue_logging()
+        install_event_loop()
         asyncio.run(setup_demo())
     except KeyboardInterrupt:
         print("\nSetup interrupted by user")
@@ -2,12 +2,27 @@
 Configuration management for MDTD Test Engine
 """
 
+import copy
+import functools
 import os
-import json
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+from .serialization import dumps_compact, loads_json, write_json
+
+
+def _default_cache_dir() -> str:
+    """Per-user cache directory (``$XDG_CACHE_HOME/mdtd``, else ``~/.cache/mdtd``)"""
+    base = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'mdtd')
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_file(config_path: str, mtime_ns: int) -> Dict:
+    """Parse a JSON config file, cached per path and modification time"""
+    return loads_json(Path(config_path).read_bytes())
+
 
 @dataclass
 class Config:
@@ -18,6 +33,28 @@ class Config:
     openai_model: str = field(default_factory=lambda: os.getenv('OPENAI_MODEL', 'gpt-4'))
     openai_max_tokens: int = 2000
     openai_temperature: float = 0.3
+    # Request JSON object mode; needs a model that supports it (e.g. gpt-4o,
+    # gpt-4-turbo, gpt-3.5-turbo-1106 or later), which the default gpt-4 does not
+    openai_json_mode: bool = False
+    # Overall LLM stage timeout in seconds (0 disables; not applied in batch_mode)
+    # and attempts per request on transient errors
+    llm_timeout: float = 600.0
+    llm_retries: int = 3
+
+    # LLM request fan-out
+    max_concurrency: int = 4
+    # Provider rate limits for proactive throttling (0 disables each limit)
+    max_requests_per_minute: int = 0
+    max_tokens_per_minute: int = 0
+    # Continuous batching packs several functions into one request (see LLMController);
+    # max_batch_tokens bounds each request's estimated prompt plus output tokens
+    llm_continuous_batching: bool = False
+    max_batch_tokens: int = 6000
+    # Use the template test for trivial functions instead of calling the LLM
+    template_trivial_functions: bool = True
+    # Provider Batch API for non-interactive runs (cheaper, higher latency)
+    batch_mode: bool = False
+    batch_poll_interval: float = 30.0
 
     # Supported file extensions and languages
     supported_languages: Dict[str, List[str]] = field(default_factory=lambda: {
@@ -50,12 +87,19 @@ class Config:
     max_tests_per_function: int = 20
     include_performance_tests: bool = True
     include_security_tests: bool = True
+    # Store report metrics as integer hundredths instead of 2-decimal floats
+    report_fixed_point_metrics: bool = False
 
     # Web Interface Configuration
     web_port: int = 8080
     web_host: str = '127.0.0.1'
     enable_live_editing: bool = True
 
+    # Cache Configuration (empty cache_dir disables the on-disk cache). Cached
+    # analyses are unpickled from this directory, so it must only be writable by
+    # trusted users; the default is per-user rather than inside the analyzed checkout
+    cache_dir: str = field(default_factory=_default_cache_dir)
+
     # Logging Configuration
     log_level: str = 'INFO'
     log_file: Optional[str] = None
@@ -65,12 +109,17 @@ class Config:
         """Load configuration from file or environment"""
         config = cls()
 
-        if config_path and Path(config_path).exists():
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
-                for key, value in config_data.items():
-                    if hasattr(config, key):
-                        setattr(config, key, value)
+        if config_path:
+            path = Path(config_path).resolve()
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                return config
+
+            for key, value in _read_config_file(str(path), mtime_ns).items():
+                if hasattr(config, key):
+                    # Copy so callers can't mutate the cached file contents
+                    setattr(config, key, copy.deepcopy(value))
 
         return config
 
@@ -81,8 +130,11 @@ class Config:
             if not key.startswith('_')
         }
 
-        with open(config_path, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        write_json(Path(config_path), config_dict)
+
+    def cache_key(self) -> str:
+        """Stable key identifying this configuration's values"""
+        return dumps_compact(asdict(self), sort_keys=True)
 
     def get_language_for_extension(self, extension: str) -> Optional[str]:
         """Get language name for file extension"""
@@ -91,10 +143,28 @@ class Config:
                 return language
         return None
 
-    def validate(self) -> bool:
-        """Validate configuration"""
+    def extension_map(self) -> Dict[str, str]:
+        """
+        Snapshot of extension -> language for repeated lookups
+
+        Look up ``extension.lower()`` to match get_language_for_extension;
+        the first language listing an extension wins.
+        """
+        mapping = {}
+        for language, extensions in self.supported_languages.items():
+            for extension in extensions:
+                mapping.setdefault(extension, language)
+        return mapping
+
+    def validate(self) -> Tuple[bool, List[str]]:
+        """
+        Validate configuration
+
+        Returns:
+            Tuple of (valid, reasons); callers decide whether to report the reasons
+        """
+        reasons = []
         if not self.openai_api_key:
-            print("Warning: OpenAI API key not configured")
-            return False
+            reasons.append("OpenAI API key not configured")
 
-        return True
+        return not reasons, reasons
@@ -4,19 +4,130 @@ Analyzes source code in various programming languages to extract testable compon
 """
 
 import ast
+import asyncio
+import hashlib
+import inspect
+import os
+import pickle
 import re
+import sqlite3
+import threading
 import javalang
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from collections import Counter
+from itertools import chain, compress
+from operator import attrgetter, itemgetter
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
 
 from .config import Config
 
-logger = logging.getLogger(__name__)
+try:
+    # Compiled Java grammar; much faster than javalang's pure-Python parser
+    import tree_sitter_java
+    from tree_sitter import Language, Parser
+    _JAVA_LANGUAGE = Language(tree_sitter_java.language())
+except ImportError:  # pragma: no cover - tree-sitter is optional
+    _JAVA_LANGUAGE = None
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Bump when the per-file analysis shape changes to invalidate persisted entries
+FILE_ANALYSIS_VERSION = 1
+
+# Characters str.splitlines() treats as line boundaries
+_LINE_BREAKS = '\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+_LINE_BREAK_RE = re.compile(f'\r\n|[{_LINE_BREAKS}]')
+
+
+def _line_pattern(pattern: str, anchored: bool = False) -> 're.Pattern[str]':
+    """Compile a per-line pattern so that whole-buffer matches cannot cross line breaks
+
+    ``\\s``, ``.`` and negated character classes are narrowed to exclude line
+    breaks; ``anchored`` patterns only match at the start of a line, like re.match.
+    """
+    pattern = pattern.replace('[^', f'[^{_LINE_BREAKS}').replace(r'\s', f'[^\\S{_LINE_BREAKS}]')
+    pattern = re.sub(r'(?<!\\)\.', f'[^{_LINE_BREAKS}]', pattern)
+    if anchored:
+        pattern = f'(?<![^{_LINE_BREAKS}])' + pattern
+    return re.compile(pattern)
+
+
+# Regex analyzers: (function|method, class) patterns per language
+_CPP_FUNC_RE = _line_pattern(r'(?:(\w+)\s+)?(\w+)\s*\([^)]*\)\s*{')
+_CPP_CLASS_RE = _line_pattern(r'class\s+(\w+)(?:\s*:\s*[^{]+)?\s*{')
+_JS_FUNC_RES = tuple(_line_pattern(pattern) for pattern in (
+    r'function\s+(\w+)\s*\([^)]*\)\s*{',  # function name() {}
+    r'(\w+)\s*=\s*function\s*\([^)]*\)\s*{',  # name = function() {}
+    r'(\w+)\s*:\s*function\s*\([^)]*\)\s*{',  # name: function() {}
+    r'(\w+)\s*=\s*\([^)]*\)\s*=>\s*{',  # name = () => {}
+))
+_CS_METHOD_RE = _line_pattern(
+    r'(?:public|private|protected|internal)?\s*(?:static)?\s*(\w+)\s+(\w+)\s*\([^)]*\)\s*{'
+)
+_CS_CLASS_RE = _line_pattern(r'(?:public|private|protected|internal)?\s*class\s+(\w+)(?:\s*:\s*[^{]+)?\s*{')
+
+# Dependency patterns: includes, imports and usings
+_CPP_INCLUDE_RE = _line_pattern(r'#include\s*[<"]([^>"]+)[>"]', anchored=True)
+_JS_IMPORT_RES = tuple(_line_pattern(pattern) for pattern in (
+    r'import\s+.*\s+from\s+["\']([^"\']+)["\']',
+    r'require\s*\(\s*["\']([^"\']+)["\']\s*\)'
+))
+_CS_USING_RE = _line_pattern(r'using\s+([^;]+);', anchored=True)
+
+
+def _count_lines(content: str) -> int:
+    """Number of lines in ``content``, as len(content.splitlines()) would report"""
+    if not content:
+        return 0
+    if content.isascii() and not any(char in content for char in '\x0b\x0c\x1c\x1d\x1e'):
+        # Only '\n' can break lines here; count it without building the list of lines
+        return content.count('\n') + (not content.endswith('\n'))
+    return len(content.splitlines())
+
+
+def _line_starts(content: str) -> List[int]:
+    """Offsets at which each line of ``content`` starts"""
+    return [0] + [match.end() for match in _LINE_BREAK_RE.finditer(content)]
+
+
+def _first_match_per_line(pattern: 're.Pattern[str]', content: str,
+                          line_starts: List[int]) -> Iterator[Tuple[int, 're.Match[str]']]:
+    """Yield (line number, match) for the leftmost match of each line, as a per-line re.search would"""
+    last_line = 0
+    for match in pattern.finditer(content):
+        line_number = bisect_right(line_starts, match.start())
+        if line_number != last_line:
+            last_line = line_number
+            yield line_number, match
+
+
+def _fast_unparse(node: ast.AST) -> str:
+    """``ast.unparse`` with direct paths for names, dotted names, subscripts and simple constants
+
+    Type hints, defaults and base classes are almost always one of these shapes,
+    so the full unparser only runs for more complex expressions.
+    """
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Attribute and type(node.value) in (ast.Name, ast.Attribute):
+        return f"{_fast_unparse(node.value)}.{node.attr}"
+    if node_type is ast.Subscript and type(node.value) in (ast.Name, ast.Attribute):
+        index = node.slice
+        if type(index) is ast.Tuple and len(index.elts) > 1:
+            return f"{_fast_unparse(node.value)}[{', '.join(map(_fast_unparse, index.elts))}]"
+        if type(index) is not ast.Tuple:
+            return f"{_fast_unparse(node.value)}[{_fast_unparse(index)}]"
+    if node_type is ast.Constant and (node.value is None or type(node.value) in (bool, int)):
+        return repr(node.value)
+    return ast.unparse(node)
+
+
+@dataclass(slots=True)
 class FunctionInfo:
     """Information about a function extracted from source code"""
     name: str
@@ -36,7 +147,7 @@ class FunctionInfo:
             self.error_conditions = []
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """Information about a class extracted from source code"""
     name: str
@@ -60,11 +171,25 @@ class FileAnalyzer:
             'javascript': self._analyze_javascript,
             'csharp': self._analyze_csharp
         }
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._ext_to_lang = config.extension_map()
+
+        # Per-file results keyed by path: (mtime_ns, size, content digest, analysis)
+        self._file_cache: Optional[Dict[str, Tuple[int, int, str, Dict[str, Any]]]] = None
+        self._dirty_files: Set[str] = set()
+        self._file_cache_lock = threading.Lock()
+        self._file_cache_path = (
+            Path(config.cache_dir) / 'file_analysis.sqlite3' if config.cache_dir else None
+        )
 
     async def analyze(self, source_path: Path) -> Dict[str, Any]:
         """
         Analyze source file(s) and extract testable components
 
+        Analysis is incremental: a file whose mtime and size are unchanged, or
+        whose content hashes the same as last time, reuses its previous result
+        instead of being parsed again.
+
         Args:
             source_path: Path to source file or directory
 
@@ -81,21 +206,22 @@ class FileAnalyzer:
         }
 
         if source_path.is_file():
-            file_results = await self._analyze_file(source_path)
-            if file_results:
-                results['files'].append(file_results)
-                self._merge_results(results, file_results)
+            file_paths = [source_path]
         else:
             # Analyze directory recursively
-            for file_path in source_path.rglob('*'):
-                if file_path.is_file():
-                    extension = file_path.suffix
-                    language = self.config.get_language_for_extension(extension)
-                    if language:
-                        file_results = await self._analyze_file(file_path)
-                        if file_results:
-                            results['files'].append(file_results)
-                            self._merge_results(results, file_results)
+            file_paths = list(self.iter_source_files(source_path))
+
+        # Read and analyze files concurrently on the thread pool, merging in discovery order
+        loop = asyncio.get_running_loop()
+        executor = self._get_io_executor()
+        await loop.run_in_executor(executor, self._load_file_cache)
+        file_results_list = await asyncio.gather(*(
+            loop.run_in_executor(executor, self._analyze_file, file_path)
+            for file_path in file_paths
+        ))
+
+        self._merge_results(results, [file_results for file_results in file_results_list if file_results])
+        await loop.run_in_executor(executor, self._flush_file_cache)
 
         # Calculate additional metrics
         results['complexity_metrics'] = self._calculate_complexity_metrics(results)
@@ -103,28 +229,162 @@ class FileAnalyzer:
 
         return results
 
-    async def _analyze_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Analyze a single source file"""
+    def iter_source_files(self, root: Path) -> Iterator[Path]:
+        """
+        Recursively yield supported source files below a directory
+
+        Uses os.scandir so file types come from the directory listing rather
+        than a stat per entry. Order matches Path.rglob: a directory's files in
+        listing order, then its subdirectories depth-first; symlinked
+        directories are not followed.
+
+        Args:
+            root: Directory to walk
+
+        Returns:
+            Iterator over source file paths
+        """
+        ext_to_lang = self._ext_to_lang
+        stack = [str(root)]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir() and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            elif (os.path.splitext(entry.name)[1].lower() in ext_to_lang
+                                  and entry.is_file()):
+                                yield Path(entry.path)
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.warning(f"Skipping unreadable directory: {str(e)}")
+                continue
+            stack.extend(reversed(subdirs))
+
+    def _analyze_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Analyze a single source file (blocking; runs on the analyzer thread pool)"""
+        key = str(file_path)
+        cached = self._file_cache.get(key) if self._file_cache is not None else None
+
         try:
-            extension = file_path.suffix
-            language = self.config.get_language_for_extension(extension)
+            stat = file_path.stat()
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[3]
+
+            content = self._read_source(file_path)
+        except Exception as e:
+            logger.error(f"Error analyzing file {file_path}: {str(e)}")
+            return None
+
+        digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+        if cached and cached[2] == digest:
+            # Touched but unchanged: refresh the stat fields only
+            analysis = cached[3]
+        else:
+            analysis = self._analyze_content(file_path, content)
+            if analysis is None:
+                return None
+
+        if self._file_cache is not None:
+            self._file_cache[key] = (stat.st_mtime_ns, stat.st_size, digest, analysis)
+            self._dirty_files.add(key)
+        return analysis
+
+    def _load_file_cache(self):
+        """Load persisted per-file results once per analyzer"""
+        with self._file_cache_lock:
+            if self._file_cache is not None:
+                return
+
+            self._file_cache = {}
+            if self._file_cache_path is None or not self._file_cache_path.exists():
+                return
+
+            try:
+                conn = sqlite3.connect(self._file_cache_path)
+                try:
+                    rows = conn.execute(
+                        'SELECT path, mtime_ns, size, digest, analysis FROM files WHERE version = ?',
+                        (FILE_ANALYSIS_VERSION,)
+                    ).fetchall()
+                finally:
+                    conn.close()
+
+                for path, mtime_ns, size, digest, blob in rows:
+                    self._file_cache[path] = (mtime_ns, size, digest, pickle.loads(blob))
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable file analysis cache: {str(e)}")
+                self._file_cache = {}
+
+    def _flush_file_cache(self):
+        """Persist per-file results that changed since the last flush"""
+        with self._file_cache_lock:
+            dirty, self._dirty_files = self._dirty_files, set()
+            if self._file_cache_path is None or not dirty:
+                return
+
+            rows = [
+                (path, FILE_ANALYSIS_VERSION, mtime_ns, size, digest,
+                 pickle.dumps(analysis, protocol=pickle.HIGHEST_PROTOCOL))
+                for path in dirty
+                for mtime_ns, size, digest, analysis in (self._file_cache[path],)
+            ]
+            try:
+                self._file_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self._file_cache_path)
+                try:
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    conn.execute(
+                        'CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, version INTEGER NOT NULL, '
+                        'mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, digest TEXT NOT NULL, '
+                        'analysis BLOB NOT NULL)'
+                    )
+                    with conn:
+                        conn.executemany('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)', rows)
+                finally:
+                    conn.close()
+            except Exception as e:
+                logger.warning(f"Could not write file analysis cache: {str(e)}")
+
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """Thread pool used for concurrent source file reads and analysis"""
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 4) * 4),
+                thread_name_prefix='mdtd-io'
+            )
+        return self._io_executor
+
+    @staticmethod
+    def _read_source(file_path: Path) -> str:
+        """Read a source file as text, with universal newlines like text-mode open()"""
+        content = file_path.read_bytes().decode('utf-8', errors='ignore')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+
+    def _analyze_content(self, file_path: Path, content: str) -> Optional[Dict[str, Any]]:
+        """Analyze the already-read content of a single source file"""
+        try:
+            language = self._ext_to_lang.get(file_path.suffix.lower())
 
             if not language or language not in self.analyzers:
                 logger.warning(f"Unsupported language for file: {file_path}")
                 return None
 
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
             analyzer = self.analyzers[language]
             analysis = analyzer(content, str(file_path))
 
             analysis['file_path'] = str(file_path)
             analysis['language'] = language
             analysis['file_size'] = len(content)
-            analysis['line_count'] = len(content.splitlines())
+            analysis['line_count'] = _count_lines(content)
 
-            logger.info(f"Analyzed {language} file: {file_path}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Analyzed {language} file: {file_path}")
             return analysis
 
         except Exception as e:
@@ -134,31 +394,18 @@ class FileAnalyzer:
     def _analyze_python(self, content: str, file_path: str) -> Dict[str, Any]:
         """Analyze Python source code"""
         try:
-            tree = ast.parse(content)
-            functions = []
-            classes = []
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    func_info = self._extract_python_function(node, content)
-                    functions.append(func_info)
-                elif isinstance(node, ast.ClassDef):
-                    class_info = self._extract_python_class(node, content)
-                    classes.append(class_info)
-
-            return {
-                'functions': functions,
-                'classes': classes,
-                'imports': self._extract_python_imports(tree),
-                'global_variables': self._extract_python_globals(tree)
-            }
+            tree = ast.parse(content, filename=file_path, type_comments=False)
+            visitor = _PythonVisitor(self)
+            visitor.visit(tree)
+            return visitor.results()
 
         except SyntaxError as e:
             logger.error(f"Python syntax error in {file_path}: {str(e)}")
             return {'functions': [], 'classes': [], 'imports': [], 'global_variables': []}
 
-    def _extract_python_function(self, node: ast.FunctionDef, content: str) -> FunctionInfo:
-        """Extract function information from Python AST node"""
+    def _extract_python_function(self, node: ast.FunctionDef, complexity: int,
+                                 error_conditions: List[str], has_state: bool) -> FunctionInfo:
+        """Build function information from a Python AST node and its body statistics"""
         parameters = []
 
         for arg in node.args.args:
@@ -176,18 +423,14 @@ class FileAnalyzer:
             for i, default in enumerate(defaults):
                 param_index = len(parameters) - len(defaults) + i
                 if param_index >= 0:
-                    parameters[param_index]['default'] = ast.unparse(default)
+                    parameters[param_index]['default'] = _fast_unparse(default)
                     parameters[param_index]['required'] = False
 
         return_type = None
         if node.returns:
-            return_type = ast.unparse(node.returns)
-
-        docstring = ast.get_docstring(node)
-        complexity = self._calculate_cyclomatic_complexity(node)
+            return_type = _fast_unparse(node.returns)
 
-        # Check for error handling
-        error_conditions = self._extract_error_conditions(node)
+        docstring = _python_docstring(node)
 
         return FunctionInfo(
             name=node.name,
@@ -198,28 +441,24 @@ class FileAnalyzer:
             line_number=node.lineno,
             language='python',
             error_conditions=error_conditions,
-            has_state=self._has_state_modifications(node)
+            has_state=has_state
         )
 
-    def _extract_python_class(self, node: ast.ClassDef, content: str) -> ClassInfo:
-        """Extract class information from Python AST node"""
-        methods = []
+    def _extract_python_class(self, node: ast.ClassDef, methods: List[FunctionInfo]) -> ClassInfo:
+        """Build class information from a Python AST node and its already-extracted methods"""
         attributes = []
 
         for item in node.body:
-            if isinstance(item, ast.FunctionDef):
-                method_info = self._extract_python_function(item, content)
-                methods.append(method_info)
-            elif isinstance(item, ast.Assign):
+            if type(item) is ast.Assign:
                 for target in item.targets:
-                    if isinstance(target, ast.Name):
+                    if type(target) is ast.Name:
                         attributes.append({
                             'name': target.id,
                             'type': 'unknown',
                             'line_number': item.lineno
                         })
 
-        inheritance = [ast.unparse(base) for base in node.bases]
+        inheritance = [_fast_unparse(base) for base in node.bases]
 
         return ClassInfo(
             name=node.name,
@@ -232,6 +471,9 @@ class FileAnalyzer:
 
     def _analyze_java(self, content: str, file_path: str) -> Dict[str, Any]:
         """Analyze Java source code"""
+        if _JAVA_LANGUAGE is not None:
+            return self._analyze_java_tree_sitter(content, file_path)
+
         try:
             tree = javalang.parse.parse(content)
             functions = []
@@ -245,11 +487,15 @@ class FileAnalyzer:
                 class_info = self._extract_java_class(node)
                 classes.append(class_info)
 
+            package_name = ''
+            if tree.package is not None:
+                package_name = tree.package.name
+
             return {
                 'functions': functions,
                 'classes': classes,
                 'imports': self._extract_java_imports(tree),
-                'package': getattr(tree.package, 'name', '') if tree.package else ''
+                'package': package_name
             }
 
         except Exception as e:
@@ -271,8 +517,8 @@ class FileAnalyzer:
 
         return_type = str(node.return_type.name) if node.return_type and hasattr(node.return_type, 'name') else 'void'
 
-        # Fix position attribute access
-        line_number = node.position.line if hasattr(node, 'position') else 0
+        # javalang nodes always have a position property, which is None when unknown
+        line_number = node.position.line if node.position else 0
 
         return FunctionInfo(
             name=node.name,
@@ -302,7 +548,7 @@ class FileAnalyzer:
                 attributes.append({
                     'name': declarator.name,
                     'type': str(field.type.name) if hasattr(field.type, 'name') else str(field.type),
-                    'line_number': field.position.line if hasattr(field, 'position') else 0
+                    'line_number': field.position.line if field.position else 0
                 })
 
         inheritance = []
@@ -311,8 +557,7 @@ class FileAnalyzer:
         if node.implements:
             inheritance.extend([str(impl.name) for impl in node.implements])
 
-        # Fix position attribute access
-        line_number = node.position.line if hasattr(node, 'position') else 0
+        line_number = node.position.line if node.position else 0
 
         return ClassInfo(
             name=node.name,
@@ -323,49 +568,163 @@ class FileAnalyzer:
             line_number=line_number
         )
 
+    def _analyze_java_tree_sitter(self, content: str, file_path: str) -> Dict[str, Any]:
+        """Analyze Java source code with tree-sitter, producing the same results as javalang"""
+        try:
+            tree = Parser(_JAVA_LANGUAGE).parse(content.encode('utf-8'))
+            root = tree.root_node
+            if root.has_error:
+                # javalang rejects files with syntax errors outright; do the same
+                raise ValueError(f"syntax error at line {_ts_first_error_line(root)}")
+
+            functions = []
+            classes = []
+            imports = []
+            package = ''
+
+            # Pre-order walk, matching the order of javalang's tree.filter
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                node_type = node.type
+                if node_type == 'method_declaration':
+                    functions.append(self._extract_ts_java_function(node))
+                elif node_type == 'class_declaration':
+                    classes.append(self._extract_ts_java_class(node))
+                elif node_type == 'import_declaration':
+                    imports.append(_ts_text(next(
+                        child for child in node.named_children
+                        if child.type in ('identifier', 'scoped_identifier')
+                    )))
+                elif node_type == 'package_declaration':
+                    package = _ts_text(node.named_children[-1])
+                stack.extend(reversed(node.named_children))
+
+            return {
+                'functions': functions,
+                'classes': classes,
+                'imports': imports,
+                'package': package
+            }
+
+        except Exception as e:
+            logger.error(f"Java parsing error in {file_path}: {str(e)}")
+            return {'functions': [], 'classes': [], 'imports': [], 'package': ''}
+
+    def _extract_ts_java_function(self, node) -> FunctionInfo:
+        """Extract function information from a tree-sitter method_declaration node"""
+        parameters = []
+
+        for param in node.child_by_field_name('parameters').named_children:
+            if param.type == 'formal_parameter':
+                param_type = param.child_by_field_name('type')
+                param_name = param.child_by_field_name('name')
+            elif param.type == 'spread_parameter':
+                param_type = next(child for child in param.named_children if child.type != 'modifiers')
+                param_name = next(
+                    child for child in param.named_children if child.type == 'variable_declarator'
+                ).child_by_field_name('name')
+            else:
+                continue
+            parameters.append({
+                'name': _ts_text(param_name),
+                'type': _ts_type_name(param_type),
+                'required': True
+            })
+
+        return_node = node.child_by_field_name('type')
+        return_type = _ts_type_name(return_node) if return_node.type != 'void_type' else 'void'
+        modifiers = _ts_modifiers(node)
+
+        # javalang positions a method at its type parameters or, failing that, its return type
+        position_node = node.child_by_field_name('type_parameters') or return_node
+
+        return FunctionInfo(
+            name=_ts_text(node.child_by_field_name('name')),
+            parameters=parameters,
+            return_type=return_type,
+            docstring=None,  # Java doesn't have docstrings like Python
+            complexity=1,  # Simplified for now
+            line_number=position_node.start_point[0] + 1,
+            language='java',
+            visibility='public' if 'public' in modifiers else 'private',
+            is_static='static' in modifiers
+        )
+
+    def _extract_ts_java_class(self, node) -> ClassInfo:
+        """Extract class information from a tree-sitter class_declaration node"""
+        methods = []
+        attributes = []
+
+        for member in node.child_by_field_name('body').named_children:
+            if member.type == 'method_declaration':
+                methods.append(self._extract_ts_java_function(member))
+            elif member.type == 'field_declaration':
+                field_type = member.child_by_field_name('type')
+                for declarator in member.children_by_field_name('declarator'):
+                    attributes.append({
+                        'name': _ts_text(declarator.child_by_field_name('name')),
+                        'type': _ts_type_name(field_type),
+                        'line_number': field_type.start_point[0] + 1
+                    })
+
+        inheritance = []
+        superclass = node.child_by_field_name('superclass')
+        if superclass is not None:
+            inheritance.append(_ts_type_name(superclass.named_children[-1]))
+        interfaces = node.child_by_field_name('interfaces')
+        if interfaces is not None:
+            type_list = next(child for child in interfaces.named_children if child.type == 'type_list')
+            inheritance.extend(_ts_type_name(impl) for impl in type_list.named_children)
+
+        class_keyword = next(child for child in node.children if child.type == 'class')
+
+        return ClassInfo(
+            name=_ts_text(node.child_by_field_name('name')),
+            methods=methods,
+            attributes=attributes,
+            inheritance=inheritance,
+            language='java',
+            line_number=class_keyword.start_point[0] + 1
+        )
+
     def _analyze_cpp(self, content: str, file_path: str) -> Dict[str, Any]:
         """Analyze C++ source code using regex patterns"""
         functions = []
         classes = []
 
-        # Simple regex-based analysis for C++
-        function_pattern = r'(?:(\w+)\s+)?(\w+)\s*\([^)]*\)\s*{'
-        class_pattern = r'class\s+(\w+)(?:\s*:\s*[^{]+)?\s*{'
-
-        lines = content.splitlines()
-
-        for i, line in enumerate(lines, 1):
-            # Find functions
-            func_match = re.search(function_pattern, line)
-            if func_match:
-                return_type = func_match.group(1) or 'void'
-                func_name = func_match.group(2)
-
-                if func_name not in ['if', 'while', 'for', 'switch']:  # Filter out control structures
-                    func_info = FunctionInfo(
-                        name=func_name,
-                        parameters=[],  # Simplified - would need proper parser
-                        return_type=return_type,
-                        docstring=None,
-                        complexity=1,
-                        line_number=i,
-                        language='cpp'
-                    )
-                    functions.append(func_info)
-
-            # Find classes
-            class_match = re.search(class_pattern, line)
-            if class_match:
-                class_name = class_match.group(1)
-                class_info = ClassInfo(
-                    name=class_name,
-                    methods=[],
-                    attributes=[],
-                    inheritance=[],
-                    language='cpp',
-                    line_number=i
+        # Simple regex-based analysis for C++, scanning the whole buffer once per pattern
+        line_starts = _line_starts(content)
+
+        # Find functions
+        for i, func_match in _first_match_per_line(_CPP_FUNC_RE, content, line_starts):
+            return_type = func_match.group(1) or 'void'
+            func_name = func_match.group(2)
+
+            if func_name not in ['if', 'while', 'for', 'switch']:  # Filter out control structures
+                func_info = FunctionInfo(
+                    name=func_name,
+                    parameters=[],  # Simplified - would need proper parser
+                    return_type=return_type,
+                    docstring=None,
+                    complexity=1,
+                    line_number=i,
+                    language='cpp'
                 )
-                classes.append(class_info)
+                functions.append(func_info)
+
+        # Find classes
+        for i, class_match in _first_match_per_line(_CPP_CLASS_RE, content, line_starts):
+            class_name = class_match.group(1)
+            class_info = ClassInfo(
+                name=class_name,
+                methods=[],
+                attributes=[],
+                inheritance=[],
+                language='cpp',
+                line_number=i
+            )
+            classes.append(class_info)
 
         return {
             'functions': functions,
@@ -380,35 +739,27 @@ class FileAnalyzer:
 
     def _analyze_javascript(self, content: str, file_path: str) -> Dict[str, Any]:
         """Analyze JavaScript source code using regex patterns"""
-        functions = []
-
-        # Regex patterns for different function declarations
-        patterns = [
-            r'function\s+(\w+)\s*\([^)]*\)\s*{',  # function name() {}
-            r'(\w+)\s*=\s*function\s*\([^)]*\)\s*{',  # name = function() {}
-            r'(\w+)\s*:\s*function\s*\([^)]*\)\s*{',  # name: function() {}
-            r'(\w+)\s*=\s*\([^)]*\)\s*=>\s*{',  # name = () => {}
+        line_starts = _line_starts(content)
+
+        # The first declaration pattern (in _JS_FUNC_RES order) that matches a line wins
+        names_by_line: Dict[int, str] = {}
+        for pattern in _JS_FUNC_RES:
+            for i, match in _first_match_per_line(pattern, content, line_starts):
+                names_by_line.setdefault(i, match.group(1))
+
+        functions = [
+            FunctionInfo(
+                name=func_name,
+                parameters=[],  # Simplified
+                return_type='unknown',
+                docstring=None,
+                complexity=1,
+                line_number=i,
+                language='javascript'
+            )
+            for i, func_name in sorted(names_by_line.items())
         ]
 
-        lines = content.splitlines()
-
-        for i, line in enumerate(lines, 1):
-            for pattern in patterns:
-                match = re.search(pattern, line)
-                if match:
-                    func_name = match.group(1)
-                    func_info = FunctionInfo(
-                        name=func_name,
-                        parameters=[],  # Simplified
-                        return_type='unknown',
-                        docstring=None,
-                        complexity=1,
-                        line_number=i,
-                        language='javascript'
-                    )
-                    functions.append(func_info)
-                    break
-
         return {
             'functions': functions,
             'classes': [],
@@ -420,43 +771,36 @@ class FileAnalyzer:
         functions = []
         classes = []
 
-        # C# method pattern
-        method_pattern = r'(?:public|private|protected|internal)?\s*(?:static)?\s*(\w+)\s+(\w+)\s*\([^)]*\)\s*{'
-        class_pattern = r'(?:public|private|protected|internal)?\s*class\s+(\w+)(?:\s*:\s*[^{]+)?\s*{'
-
-        lines = content.splitlines()
-
-        for i, line in enumerate(lines, 1):
-            # Find methods
-            method_match = re.search(method_pattern, line)
-            if method_match:
-                return_type = method_match.group(1)
-                method_name = method_match.group(2)
-
-                func_info = FunctionInfo(
-                    name=method_name,
-                    parameters=[],
-                    return_type=return_type,
-                    docstring=None,
-                    complexity=1,
-                    line_number=i,
-                    language='csharp'
-                )
-                functions.append(func_info)
-
-            # Find classes
-            class_match = re.search(class_pattern, line)
-            if class_match:
-                class_name = class_match.group(1)
-                class_info = ClassInfo(
-                    name=class_name,
-                    methods=[],
-                    attributes=[],
-                    inheritance=[],
-                    language='csharp',
-                    line_number=i
-                )
-                classes.append(class_info)
+        line_starts = _line_starts(content)
+
+        # Find methods
+        for i, method_match in _first_match_per_line(_CS_METHOD_RE, content, line_starts):
+            return_type = method_match.group(1)
+            method_name = method_match.group(2)
+
+            func_info = FunctionInfo(
+                name=method_name,
+                parameters=[],
+                return_type=return_type,
+                docstring=None,
+                complexity=1,
+                line_number=i,
+                language='csharp'
+            )
+            functions.append(func_info)
+
+        # Find classes
+        for i, class_match in _first_match_per_line(_CS_CLASS_RE, content, line_starts):
+            class_name = class_match.group(1)
+            class_info = ClassInfo(
+                name=class_name,
+                methods=[],
+                attributes=[],
+                inheritance=[],
+                language='csharp',
+                line_number=i
+            )
+            classes.append(class_info)
 
         return {
             'functions': functions,
@@ -468,61 +812,9 @@ class FileAnalyzer:
     def _get_python_type_hint(self, arg) -> Optional[str]:
         """Extract type hint from Python function argument"""
         if hasattr(arg, 'annotation') and arg.annotation:
-            return ast.unparse(arg.annotation)
+            return _fast_unparse(arg.annotation)
         return None
 
-    def _calculate_cyclomatic_complexity(self, node) -> int:
-        """Calculate cyclomatic complexity for a function"""
-        complexity = 1
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.With, ast.Try)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-        return complexity
-
-    def _extract_error_conditions(self, node) -> List[str]:
-        """Extract potential error conditions from function"""
-        conditions = []
-        for child in ast.walk(node):
-            if isinstance(child, ast.Raise):
-                if child.exc and isinstance(child.exc, ast.Call):
-                    if hasattr(child.exc.func, 'id'):
-                        conditions.append(child.exc.func.id)
-        return conditions
-
-    def _has_state_modifications(self, node) -> bool:
-        """Check if function modifies state"""
-        for child in ast.walk(node):
-            if isinstance(child, ast.Assign):
-                for target in child.targets:
-                    if isinstance(target, ast.Attribute):
-                        return True
-        return False
-
-    def _extract_python_imports(self, tree) -> List[str]:
-        """Extract import statements"""
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ''
-                for alias in node.names:
-                    imports.append(f"{module}.{alias.name}")
-        return imports
-
-    def _extract_python_globals(self, tree) -> List[str]:
-        """Extract global variables"""
-        globals_vars = []
-        for node in tree.body:
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        globals_vars.append(target.id)
-        return globals_vars
-
     def _extract_java_imports(self, tree) -> List[str]:
         """Extract Java imports"""
         imports = []
@@ -533,46 +825,33 @@ class FileAnalyzer:
 
     def _extract_cpp_includes(self, content: str) -> List[str]:
         """Extract C++ includes"""
-        includes = []
-        for line in content.splitlines():
-            match = re.match(r'#include\s*[<"]([^>"]+)[>"]', line)
-            if match:
-                includes.append(match.group(1))
-        return includes
+        return _CPP_INCLUDE_RE.findall(content)
 
     def _extract_js_imports(self, content: str) -> List[str]:
         """Extract JavaScript imports"""
-        imports = []
-        patterns = [
-            r'import\s+.*\s+from\s+["\']([^"\']+)["\']',
-            r'require\s*\(\s*["\']([^"\']+)["\']\s*\)'
-        ]
+        line_starts = _line_starts(content)
 
-        for line in content.splitlines():
-            for pattern in patterns:
-                match = re.search(pattern, line)
-                if match:
-                    imports.append(match.group(1))
-        return imports
+        # Each pattern contributes at most one import per line, in pattern order
+        imports = [
+            (i, index, match.group(1))
+            for index, pattern in enumerate(_JS_IMPORT_RES)
+            for i, match in _first_match_per_line(pattern, content, line_starts)
+        ]
+        imports.sort(key=itemgetter(0, 1))
+        return [name for _, _, name in imports]
 
     def _extract_csharp_usings(self, content: str) -> List[str]:
         """Extract C# using statements"""
-        usings = []
-        for line in content.splitlines():
-            match = re.match(r'using\s+([^;]+);', line)
-            if match:
-                usings.append(match.group(1))
-        return usings
-
-    def _merge_results(self, main_results: Dict, file_results: Dict):
-        """Merge file analysis results into main results"""
-        main_results['functions'].extend(file_results.get('functions', []))
-        main_results['classes'].extend(file_results.get('classes', []))
-
-        # Update language distribution
-        language = file_results.get('language', 'unknown')
-        main_results['language_distribution'][language] = \
-            main_results['language_distribution'].get(language, 0) + 1
+        return _CS_USING_RE.findall(content)
+
+    def _merge_results(self, main_results: Dict, files: List[Dict]):
+        """Merge per-file analysis results into main results, building each list once"""
+        main_results['files'] = files
+        main_results['functions'] = list(chain.from_iterable(f.get('functions', []) for f in files))
+        main_results['classes'] = list(chain.from_iterable(f.get('classes', []) for f in files))
+
+        # Language distribution, in order of first appearance
+        main_results['language_distribution'] = dict(Counter(f.get('language', 'unknown') for f in files))
 
     def _calculate_complexity_metrics(self, results: Dict) -> Dict:
         """Calculate overall complexity metrics"""
@@ -580,15 +859,15 @@ class FileAnalyzer:
         if not functions:
             return {}
 
-        complexities = [f.complexity for f in functions]
+        # map/compress keep the per-function loop in C rather than the interpreter
+        complexities = list(map(attrgetter('complexity'), functions))
+        high_complexity = map((10).__lt__, complexities)
 
         return {
             'total_functions': len(functions),
             'average_complexity': sum(complexities) / len(complexities),
             'max_complexity': max(complexities),
-            'high_complexity_functions': [
-                f.name for f in functions if f.complexity > 10
-            ]
+            'high_complexity_functions': list(compress(map(attrgetter('name'), functions), high_complexity))
         }
 
     def _identify_test_opportunities(self, results: Dict) -> List[Dict]:
@@ -624,3 +903,183 @@ class FileAnalyzer:
                 })
 
         return opportunities
+
+
+def _python_docstring(node: ast.FunctionDef) -> Optional[str]:
+    """Same result as ast.get_docstring, only running inspect.cleandoc for multi-line docstrings"""
+    body = node.body
+    if not body or type(body[0]) is not ast.Expr:
+        return None
+    value = body[0].value
+    if type(value) is not ast.Constant or type(value.value) is not str:
+        return None
+
+    docstring = value.value
+    if '\n' not in docstring:
+        # What cleandoc reduces a single line to
+        return docstring.expandtabs().lstrip()
+    return inspect.cleandoc(docstring)
+
+
+def _ts_text(node) -> str:
+    """Source text of a tree-sitter node"""
+    return node.text.decode('utf-8')
+
+
+def _ts_type_name(node) -> str:
+    """Type name as javalang reports it: no generics or array dimensions, first segment of qualified names"""
+    while node.type in ('array_type', 'generic_type', 'scoped_type_identifier', 'annotated_type'):
+        node = node.child_by_field_name('element') if node.type == 'array_type' else next(
+            child for child in node.named_children
+            if child.type not in ('marker_annotation', 'annotation')
+        )
+    return _ts_text(node)
+
+
+def _ts_modifiers(node) -> Set[str]:
+    """Modifier keywords (annotations excluded) of a tree-sitter declaration node"""
+    for child in node.children:
+        if child.type == 'modifiers':
+            return {modifier.type for modifier in child.children if not modifier.is_named}
+    return set()
+
+
+def _ts_first_error_line(node) -> int:
+    """Line number of the first syntax error below a tree-sitter node"""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.type == 'ERROR' or node.is_missing:
+            return node.start_point[0] + 1
+        stack.extend(reversed([child for child in node.children if child.has_error or child.is_missing]))
+    return 0
+
+
+# AST node types with no children the Python visitor cares about
+_LEAF_NODE_TYPES = frozenset({
+    ast.Name, ast.Constant, ast.alias, ast.Pass, ast.Break, ast.Continue, ast.Global, ast.Nonlocal,
+    *ast.expr_context.__subclasses__(), *ast.operator.__subclasses__(), *ast.boolop.__subclasses__(),
+    *ast.unaryop.__subclasses__(), *ast.cmpop.__subclasses__(),
+})
+
+# Statements that add one to cyclomatic complexity (AST node types are never subclassed)
+_BRANCH_NODE_TYPES = frozenset({ast.If, ast.While, ast.For, ast.With, ast.Try})
+
+
+class _PythonVisitor(ast.NodeVisitor):
+    """Single-pass collector of functions, classes, imports and globals in a Python module
+
+    Every function on the stack accumulates the statistics of its whole subtree,
+    nested definitions included. Results are reported in breadth-first order,
+    keyed by (depth, pre-order index), so they match an ``ast.walk`` scan.
+    """
+
+    def __init__(self, analyzer: 'FileAnalyzer'):
+        self._analyzer = analyzer
+        self._depth = 0
+        self._order = 0
+        self._func_stack: List[Dict[str, Any]] = []
+        self._function_infos: Dict[ast.FunctionDef, FunctionInfo] = {}
+        self._functions: List[Tuple[Tuple[int, int], FunctionInfo]] = []
+        self._classes: List[Tuple[Tuple[int, int], ClassInfo]] = []
+        self._imports: List[Tuple[Tuple[int, int], List[str]]] = []
+        self._globals: List[str] = []
+
+    def results(self) -> Dict[str, Any]:
+        """Analysis results in the shape returned by ``FileAnalyzer._analyze_python``"""
+        return {
+            'functions': [info for _, info in sorted(self._functions, key=itemgetter(0))],
+            'classes': [info for _, info in sorted(self._classes, key=itemgetter(0))],
+            'imports': [name for _, names in sorted(self._imports, key=itemgetter(0)) for name in names],
+            'global_variables': self._globals
+        }
+
+    def visit(self, node: ast.AST):
+        # One dict lookup on the exact node type instead of NodeVisitor's
+        # 'visit_' + class name string building and getattr per node
+        self._order += 1
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            return self.generic_visit(node)
+        return handler(self, node)
+
+    def generic_visit(self, node: ast.AST):
+        self._depth += 1
+        for child in ast.iter_child_nodes(node):
+            # Leaves can't contain anything collected here; skip the visit dispatch for them
+            if type(child) not in _LEAF_NODE_TYPES:
+                self.visit(child)
+        self._depth -= 1
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        key = (self._depth, self._order)
+        frame = {'complexity': 1, 'errors': [], 'has_state': False}
+        self._func_stack.append(frame)
+        self.generic_visit(node)
+        self._func_stack.pop()
+
+        errors = [name for _, name in sorted(frame['errors'], key=itemgetter(0))]
+        info = self._analyzer._extract_python_function(
+            node, frame['complexity'], errors, frame['has_state']
+        )
+        self._function_infos[node] = info
+        self._functions.append((key, info))
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        key = (self._depth, self._order)
+        self.generic_visit(node)
+
+        methods = [
+            self._function_infos[item] for item in node.body
+            if type(item) is ast.FunctionDef
+        ]
+        self._classes.append((key, self._analyzer._extract_python_class(node, methods)))
+
+    def _branch(self, node: ast.AST, weight: int = 1):
+        for frame in self._func_stack:
+            frame['complexity'] += weight
+        self.generic_visit(node)
+
+    def visit_BoolOp(self, node: ast.BoolOp):
+        self._branch(node, len(node.values) - 1)
+
+    def visit_Raise(self, node: ast.Raise):
+        if type(node.exc) is ast.Call and type(node.exc.func) is ast.Name:
+            key = (self._depth, self._order)
+            for frame in self._func_stack:
+                frame['errors'].append((key, node.exc.func.id))
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign):
+        if self._depth == 1:
+            # Direct child of the module
+            self._globals.extend(target.id for target in node.targets if type(target) is ast.Name)
+        # Once a function has state so do all functions enclosing it, so the
+        # target scan and the marking both stop at the first frame already set
+        func_stack = self._func_stack
+        if (func_stack and not func_stack[-1]['has_state']
+                and any(type(target) is ast.Attribute for target in node.targets)):
+            for frame in reversed(func_stack):
+                if frame['has_state']:
+                    break
+                frame['has_state'] = True
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import):
+        self._imports.append(((self._depth, self._order), [alias.name for alias in node.names]))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        module = node.module or ''
+        self._imports.append(((self._depth, self._order), [f"{module}.{alias.name}" for alias in node.names]))
+
+    # Handlers by exact node type, built once with the class
+    _dispatch = {
+        ast.FunctionDef: visit_FunctionDef,
+        ast.ClassDef: visit_ClassDef,
+        ast.BoolOp: visit_BoolOp,
+        ast.Raise: visit_Raise,
+        ast.Assign: visit_Assign,
+        ast.Import: visit_Import,
+        ast.ImportFrom: visit_ImportFrom,
+        **dict.fromkeys(_BRANCH_NODE_TYPES, _branch),
+    }
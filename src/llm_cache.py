@@ -0,0 +1,233 @@
+"""
+LLM Response Cache for MDTD Test Engine
+Reuses generated tests and responses for identical requests
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .config import Config
+from .serialization import dumps_compact, loads_json
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationCache:
+    """
+    Persistent cache of whole-run LLM results keyed by exact request
+
+    Entries are keyed by the BLAKE2b hash of the canonical request description
+    (model, test flags, functions and scenarios), so a result is only reused
+    for an identical request; any change to the function set misses. The
+    SQLite store runs in WAL mode so concurrent runs can share it.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.db_path = Path(config.cache_dir) / 'llm_runs.sqlite3' if config.cache_dir else None
+        self._lock = threading.Lock()
+
+    async def get(self, prompt: str) -> Optional[Any]:
+        """
+        Look up the cached response for an identical request
+
+        Args:
+            prompt: Canonical description of the request
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        if self.db_path is None:
+            return None
+        return await asyncio.to_thread(self._get_sync, prompt)
+
+    async def put(self, prompt: str, response: Any):
+        """Store a response for a request"""
+        if self.db_path is None:
+            return
+        await asyncio.to_thread(self._put_sync, prompt, response)
+
+    def _get_sync(self, prompt: str) -> Optional[Any]:
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    'SELECT response FROM entries WHERE prompt_hash = ?', (self._hash(prompt),)
+                ).fetchone()
+            return loads_json(row[0]) if row else None
+
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"LLM cache lookup failed: {str(e)}")
+            return None
+
+    def _put_sync(self, prompt: str, response: Any):
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO entries (prompt_hash, response) VALUES (?, ?)',
+                    (self._hash(prompt), dumps_compact(response))
+                )
+
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"LLM cache store failed: {str(e)}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the cache database, committing on success and always closing"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            # WAL lets concurrent runs read the cache while another run writes to it
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries '
+                '(prompt_hash TEXT PRIMARY KEY, response TEXT NOT NULL)'
+            )
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _hash(prompt: str) -> str:
+        return hashlib.blake2b(prompt.encode('utf-8'), digest_size=20).hexdigest()
+
+
+class ResponseCache:
+    """
+    Persistent exact-match cache of individual chat completion responses
+
+    Entries are keyed by the SHA-256 of the full request (model, messages,
+    temperature and token limit). Only near-deterministic requests are
+    cached: sampling at higher temperatures is expected to vary between runs.
+    """
+
+    MAX_CACHED_TEMPERATURE = 0.2
+
+    def __init__(self, config: Config):
+        self.db_path = Path(config.cache_dir) / 'llm_responses.sqlite3' if config.cache_dir else None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, messages: List[dict], temperature: float, max_tokens: int) -> str:
+        """Hash a chat completion request into a cache key"""
+        request = dumps_compact([model, messages, temperature, max_tokens], sort_keys=True)
+        return hashlib.sha256(request.encode('utf-8')).hexdigest()
+
+    def cacheable(self, temperature: float) -> bool:
+        """Whether requests at this temperature may be served from the cache"""
+        return self.db_path is not None and temperature <= self.MAX_CACHED_TEMPERATURE
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up the cached response content for a request key"""
+        if self.db_path is None:
+            return None
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def put(self, key: str, content: str):
+        """Store the response content for a request key"""
+        if self.db_path is None:
+            return
+        await asyncio.to_thread(self._put_sync, key, content)
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute('SELECT content FROM responses WHERE request_hash = ?', (key,)).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache lookup failed: {str(e)}")
+            return None
+
+    def _put_sync(self, key: str, content: str):
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO responses (request_hash, content) VALUES (?, ?)', (key, content)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache store failed: {str(e)}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the cache database, committing on success and always closing"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses '
+                '(request_hash TEXT PRIMARY KEY, content TEXT NOT NULL)'
+            )
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+class RunManifest:
+    """
+    Append-only JSONL record of the LLM requests completed during one run
+
+    Each completed request is appended as soon as it finishes, so a run that
+    is interrupted can be repeated without paying for those requests again.
+    The manifest is discarded once the run completes.
+    """
+
+    def __init__(self, config: Config, run_id: str):
+        self.path = Path(config.cache_dir) / 'runs' / f'{run_id}.jsonl' if config.cache_dir else None
+        self._results: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> int:
+        """
+        Load the results recorded by an earlier attempt at this run
+
+        Returns:
+            Number of recorded results
+        """
+        if self.path is None:
+            return 0
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = loads_json(line)
+                    except ValueError:
+                        # A write cut short by the interruption
+                        continue
+                    self._results[record['key']] = record['result']
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not read run manifest {self.path}: {str(e)}")
+        return len(self._results)
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up the recorded response content for a request key"""
+        return self._results.get(key)
+
+    async def record(self, key: str, content: str):
+        """Append a completed request to the manifest"""
+        self._results[key] = content
+        if self.path is not None:
+            await asyncio.to_thread(self._append, dumps_compact({'key': key, 'result': content}) + '\n')
+
+    def discard(self):
+        """Delete the manifest after the run has completed"""
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+    def _append(self, line: str):
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+        except OSError as e:
+            logger.warning(f"Could not update run manifest {self.path}: {str(e)}")
@@ -3,30 +3,323 @@ LLM Controller for MDTD Test Engine
 Manages communication with OpenAI API for intelligent test generation
 """
 
+import asyncio
+import io
 import json
 import logging
-from dataclasses import asdict
-from typing import Dict, List, Any
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
+import httpx
 import openai
 
 from .config import Config
 from .file_analyzer import FunctionInfo
+from .llm_cache import ResponseCache, RunManifest
+from .serialization import dumps_compact, dumps_json, loads_json
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Prompt text is kept byte-identical across requests and placed before any
+# request-specific details so providers can reuse cached prompt prefixes
+SYSTEM_PROMPT = """You are an expert software test engineer specializing in Model-Driven Test Development (MDTD). 
+You create comprehensive, high-quality test cases that can be executed in web browsers using HTML5 forms.
+
+Your expertise includes:
+- Equivalence partitioning
+- Boundary value analysis
+- Error condition testing
+- State transition testing
+- Performance testing
+- Security testing
+- Web-based test interfaces
+
+Always generate tests that are:
+1. Comprehensive and cover edge cases
+2. Suitable for HTML5 web interfaces
+3. Include clear validation logic
+4. Follow MDTD best practices
+5. Include both positive and negative scenarios"""
+
+LANGUAGE_FOCUS = {
+    'python': "Focus on Python-specific testing patterns and data types.",
+    'java': "Focus on Java-specific testing patterns, exceptions, and object-oriented concepts.",
+    'cpp': "Focus on C++ memory management, pointers, and performance considerations.",
+    'javascript': "Focus on JavaScript async patterns, DOM manipulation, and browser compatibility.",
+    'csharp': "Focus on C# .NET patterns, exceptions, and type safety."
+}
+
+FUNCTION_TEST_INSTRUCTIONS = """Generate comprehensive test cases using MDTD principles for the function described in FUNCTION DETAILS below.
+
+REQUIREMENTS:
+1. Create tests for HTML5 form inputs that can be executed in a web browser
+2. Include equivalence partitioning tests
+3. Include boundary value analysis tests
+4. Include error condition tests
+5. Include state transition tests if applicable
+6. Generate both positive and negative test cases
+7. Include performance considerations
+8. Make tests suitable for display in HTML5 input fields
+
+OUTPUT FORMAT:
+Generate the response as a JSON object with the following structure:
+{"html_test_cases":[{"test_id":"unique_id","test_name":"descriptive_name","category":"equivalence_partition|boundary_value|error_condition|state_transition","input_html":"HTML5 input field code","expected_output":"expected result","test_data":"test input values","validation_script":"JavaScript validation code"}],"test_summary":{"total_tests":0,"categories_covered":[],"complexity_score":0}}
+
+Focus on creating tests that can be displayed and executed in a web interface with HTML5 input fields.
+"""
+
+# Provider errors worth retrying: throttling and transient connectivity problems
+TRANSIENT_LLM_ERRORS: Tuple[Type[BaseException], ...] = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError
+)
+
+# Every generation prompt asks for a single JSON object
+JSON_RESPONSE_FORMAT = {'type': 'json_object'}
+
+# Parameter types that make a function a candidate for security tests
+STRING_PARAMETER_TYPES = frozenset({'string', 'str'})
+
+
+async def retry_with_backoff(
+    operation: Callable[[], Awaitable[T]],
+    retry_on: Tuple[Type[BaseException], ...] = TRANSIENT_LLM_ERRORS,
+    attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0
+) -> T:
+    """
+    Await an operation, retrying transient failures with exponential backoff
+
+    Delays grow as base_delay * 2**attempt (capped at max_delay) with full
+    jitter. Cancellation is never retried.
+
+    Args:
+        operation: Zero-argument callable returning a fresh awaitable per attempt
+        retry_on: Exception types that trigger a retry
+        attempts: Total number of attempts
+        base_delay: Delay before the first retry in seconds
+        max_delay: Upper bound for a single delay in seconds
+
+    Returns:
+        The operation's result
+    """
+    for attempt in range(max(1, attempts)):
+        try:
+            return await operation()
+        except retry_on as e:
+            if attempt + 1 >= attempts:
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            logger.warning(f"Transient LLM error ({type(e).__name__}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the tokens in a text (~4 characters per token)"""
+    return len(text) // 4
+
+
+def _compact_json(value: Any) -> str:
+    """
+    Serialize prompt data without indentation or spacing to save input tokens
+
+    Uses the standard library so non-finite boundary values (such as the
+    numeric template's -inf/inf) reach the prompt as -Infinity/Infinity
+    rather than orjson's null.
+    """
+    return json.dumps(value, separators=(',', ':'))
+
+
+def _extract_json(text: Optional[str]) -> Optional[Any]:
+    """
+    Parse the first JSON object or array embedded in a model reply
+
+    Handles replies wrapped in code fences or surrounded by prose.
+
+    Args:
+        text: Reply content
+
+    Returns:
+        The decoded value, or None if the reply contains no valid JSON document
+    """
+    if not text:
+        return None
+
+    try:
+        return loads_json(text)
+    except json.JSONDecodeError:
+        pass
+
+    decoder = json.JSONDecoder()
+    for index, char in enumerate(text):
+        if char in '{[':
+            try:
+                return decoder.raw_decode(text, index)[0]
+            except json.JSONDecodeError:
+                continue
+    return None
+
+
+class _JsonObjectTracker:
+    """Detects when streamed text that opens with '{' has closed its top-level object"""
+
+    def __init__(self):
+        self.started = False
+        self.rejected = False
+        # Length of the streamed text up to and including the closing brace
+        self.end: Optional[int] = None
+        self._consumed = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> bool:
+        """
+        Consume the next piece of streamed text
+
+        Returns:
+            True once the top-level object is complete
+        """
+        if self.rejected:
+            return False
+
+        for index, char in enumerate(text):
+            if not self.started:
+                if char.isspace():
+                    continue
+                if char != '{':
+                    # Not bare JSON (e.g. a fenced code block): read the whole stream
+                    self.rejected = True
+                    return False
+                self.started = True
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = self._consumed + index + 1
+                    return True
+
+        self._consumed += len(text)
+        return False
+
+
+class RateLimiter:
+    """
+    Proactive request/token-per-minute throttle for provider API calls
+
+    Capacity refills continuously at the configured per-minute rates, and
+    acquire() holds callers until both budgets can cover the next request,
+    so requests are spread out instead of tripping 429 responses.
+    """
+
+    def __init__(self, max_requests_per_minute: int = 0, max_tokens_per_minute: int = 0):
+        self.max_requests_per_minute = max(0, max_requests_per_minute)
+        self.max_tokens_per_minute = max(0, max_tokens_per_minute)
+        self._available_requests = float(self.max_requests_per_minute)
+        self._available_tokens = float(self.max_tokens_per_minute)
+        self._last_update: Optional[float] = None
+        # Serializes waiters so capacity is handed out in arrival order
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured"""
+        return bool(self.max_requests_per_minute or self.max_tokens_per_minute)
+
+    async def acquire(self, estimated_tokens: int):
+        """
+        Wait until capacity exists for one request of the given size, then reserve it
+
+        Args:
+            estimated_tokens: Estimated prompt plus completion tokens for the request
+        """
+        if not self.enabled:
+            return
+
+        # A request larger than the whole budget would otherwise wait forever
+        tokens = min(estimated_tokens, self.max_tokens_per_minute) if self.max_tokens_per_minute else 0
+        loop = asyncio.get_running_loop()
+
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._last_update is not None:
+                    elapsed_minutes = (now - self._last_update) / 60
+                    self._available_requests = min(
+                        float(self.max_requests_per_minute),
+                        self._available_requests + self.max_requests_per_minute * elapsed_minutes
+                    )
+                    self._available_tokens = min(
+                        float(self.max_tokens_per_minute),
+                        self._available_tokens + self.max_tokens_per_minute * elapsed_minutes
+                    )
+                self._last_update = now
+
+                wait = 0.0
+                if self.max_requests_per_minute and self._available_requests < 1:
+                    wait = (1 - self._available_requests) * 60 / self.max_requests_per_minute
+                if self.max_tokens_per_minute and self._available_tokens < tokens:
+                    wait = max(wait, (tokens - self._available_tokens) * 60 / self.max_tokens_per_minute)
+
+                if wait <= 0:
+                    if self.max_requests_per_minute:
+                        self._available_requests -= 1
+                    self._available_tokens -= tokens
+                    return
+
+                await asyncio.sleep(wait)
+
 
 class LLMController:
     """Controls LLM interactions for test generation"""
 
     def __init__(self, config: Config):
         self.config = config
-        self.client = openai.AsyncOpenAI(api_key=config.openai_api_key)
+        # One keep-alive pool sized for the request fan-out, so concurrent
+        # requests reuse connections instead of repeating TCP/TLS handshakes
+        pool_size = max(1, config.max_concurrency) * 2
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+        # retry_with_backoff is the only retry layer; the SDK's own retries would nest inside it
+        self.client = openai.AsyncOpenAI(
+            api_key=config.openai_api_key,
+            http_client=self._http_client,
+            max_retries=0
+        )
+        # Number of requests that fell back to placeholder output (reset by begin_run)
+        self.failed_requests = 0
+        # Number of trivial functions answered from the template without a request
+        self.templated_functions = 0
+        # Bounds in-flight per-function requests
+        self._sem = asyncio.Semaphore(max(1, config.max_concurrency))
+        self._limiter = RateLimiter(config.max_requests_per_minute, config.max_tokens_per_minute)
+        self._response_cache = ResponseCache(config)
+        # Completed requests of the current run, for resuming it (see begin_run)
+        self._manifest: Optional[RunManifest] = None
 
     async def generate_comprehensive_tests(
         self,
         analysis_result: Dict[str, Any],
-        test_scenarios: List[Dict]
+        test_scenarios: List[Dict],
+        function_tests: Optional[List[Dict]] = None
     ) -> Dict[str, Any]:
         """
         Generate comprehensive tests using LLM based on analysis and scenarios
@@ -34,6 +327,7 @@ class LLMController:
         Args:
             analysis_result: Results from file analysis
             test_scenarios: MDTD test scenarios
+            function_tests: Pre-generated per-function tests (see generate_function_tests)
 
         Returns:
             Generated test cases and code
@@ -41,36 +335,48 @@ class LLMController:
         try:
             logger.info("Starting LLM test generation...")
 
-            # Generate tests for each function
-            function_tests = []
-            for function in analysis_result.get('functions', []):
-                func_scenarios = [s for s in test_scenarios if s.get('function') == function.name]
-                test_code = await self._generate_function_tests(function, func_scenarios)
-                function_tests.append({
-                    'function': function.name,
-                    'language': function.language,
-                    'test_code': test_code,
-                    'scenarios': func_scenarios
-                })
-
-            # Generate integration tests
-            integration_tests = await self._generate_integration_tests(analysis_result)
-
-            # Generate performance tests
-            performance_tests = await self._generate_performance_tests(analysis_result)
-
-            # Generate security tests
-            security_tests = await self._generate_security_tests(analysis_result)
+            # Generate tests for each function unless the caller already did
+            if function_tests is None:
+                function_tests = await self.generate_function_tests(
+                    analysis_result.get('functions', []), test_scenarios
+                )
+
+            # Select candidates up front so categories with none are never scheduled
+            functions = analysis_result.get('functions', [])
+            pending = {}
+            if len(functions) >= 2:
+                pending['integration_tests'] = self._generate_integration_tests(functions)
+            if self.config.include_performance_tests:
+                high_complexity_funcs = [f for f in functions if f.complexity > 5]
+                if high_complexity_funcs:
+                    pending['performance_tests'] = self._generate_performance_tests(high_complexity_funcs)
+            if self.config.include_security_tests:
+                functions_with_inputs = [
+                    f for f in functions
+                    if f.parameters and any(p.get('type') in STRING_PARAMETER_TYPES for p in f.parameters)
+                ]
+                if functions_with_inputs:
+                    pending['security_tests'] = self._generate_security_tests(functions_with_inputs)
+
+            # Generate integration, performance and security tests concurrently
+            category_tests = dict(zip(pending, await asyncio.gather(*pending.values())))
+
+            total_test_cases = 0
+            languages_covered = set()
+            for ft in function_tests:
+                total_test_cases += len(ft['scenarios'])
+                languages_covered.add(ft['language'])
 
             return {
                 'function_tests': function_tests,
-                'integration_tests': integration_tests,
-                'performance_tests': performance_tests,
-                'security_tests': security_tests,
+                'integration_tests': category_tests.get('integration_tests', []),
+                'performance_tests': category_tests.get('performance_tests', []),
+                'security_tests': category_tests.get('security_tests', []),
                 'summary': {
                     'total_functions_tested': len(function_tests),
-                    'total_test_cases': sum(len(ft['scenarios']) for ft in function_tests),
-                    'languages_covered': list(set(ft['language'] for ft in function_tests))
+                    'templated_functions': self.templated_functions,
+                    'total_test_cases': total_test_cases,
+                    'languages_covered': list(languages_covered)
                 }
             }
 
@@ -78,6 +384,275 @@ class LLMController:
             logger.error("Error in LLM test generation: {}".format(str(e)))
             raise
 
+    async def generate_function_tests(
+        self,
+        functions: List[FunctionInfo],
+        test_scenarios: List[Dict]
+    ) -> List[Dict]:
+        """
+        Generate test code for each of the given functions
+
+        Args:
+            functions: Functions to generate tests for
+            test_scenarios: MDTD test scenarios (scenarios for other functions are ignored)
+
+        Returns:
+            One function test entry per function
+        """
+        func_scenarios = self._scenarios_per_function(functions, test_scenarios)
+        # Requests run concurrently, bounded by max_concurrency
+        test_codes = await asyncio.gather(*(
+            self._generate_function_tests(function, scenarios)
+            for function, scenarios in zip(functions, func_scenarios)
+        ))
+
+        return [
+            {
+                'function': function.name,
+                'language': function.language,
+                'test_code': test_code,
+                'scenarios': scenarios
+            }
+            for function, scenarios, test_code in zip(functions, func_scenarios, test_codes)
+        ]
+
+    async def generate_batched_function_tests(
+        self,
+        functions: List[FunctionInfo],
+        test_scenarios: List[Dict]
+    ) -> List[Dict]:
+        """
+        Generate test code with several functions packed into each request
+
+        Functions are packed in order into requests of at most
+        ``max_batch_tokens`` estimated prompt plus output tokens, whose
+        combined output budget stays within ``openai_max_tokens``; the
+        requests run concurrently.
+
+        Args:
+            functions: Functions to generate tests for
+            test_scenarios: MDTD test scenarios (scenarios for other functions are ignored)
+
+        Returns:
+            One function test entry per function
+        """
+        func_scenarios = self._scenarios_per_function(functions, test_scenarios)
+
+        batches: List[List[Tuple]] = []
+        batch_tokens = batch_output = 0
+        for function, scenarios in zip(functions, func_scenarios):
+            item = (function, scenarios)
+            if self._is_trivial(function):
+                # Answered from the template without a request
+                batches.append([item])
+                batch_tokens = self.config.max_batch_tokens
+                continue
+            prompt_tokens = self._estimate_tokens(item)
+            output_tokens = self._function_output_budget(prompt_tokens)
+            item_tokens = prompt_tokens + output_tokens
+            if (batches and batch_tokens + item_tokens <= self.config.max_batch_tokens
+                    and batch_output + output_tokens <= self.config.openai_max_tokens):
+                batches[-1].append(item)
+                batch_tokens += item_tokens
+                batch_output += output_tokens
+            else:
+                batches.append([item])
+                batch_tokens = item_tokens
+                batch_output = output_tokens
+
+        async def run(batch: List[Tuple]) -> List[str]:
+            if len(batch) == 1:
+                function, scenarios = batch[0]
+                return [await self._generate_function_tests(function, scenarios)]
+            return await self._generate_batched_function_tests(batch)
+
+        results = await asyncio.gather(*(run(batch) for batch in batches))
+        test_codes = [test_code for batch_codes in results for test_code in batch_codes]
+
+        return [
+            {
+                'function': function.name,
+                'language': function.language,
+                'test_code': test_code,
+                'scenarios': scenarios
+            }
+            for function, scenarios, test_code in zip(functions, func_scenarios, test_codes)
+        ]
+
+    @staticmethod
+    def _scenarios_per_function(functions: List[FunctionInfo], test_scenarios: List[Dict]) -> List[List[Dict]]:
+        """Select each function's scenarios with a single pass over all scenarios"""
+        scenarios_by_function: Dict[str, List[Dict]] = {}
+        for scenario in test_scenarios:
+            scenarios_by_function.setdefault(scenario.get('function'), []).append(scenario)
+        return [scenarios_by_function.get(function.name, []) for function in functions]
+
+    async def submit_batch_file(
+        self,
+        functions: List[FunctionInfo],
+        test_scenarios: List[Dict]
+    ) -> List[Dict]:
+        """
+        Generate per-function tests through the provider's Batch API
+
+        Uploads all requests as one JSONL batch file, polls the batch job every
+        ``batch_poll_interval`` seconds and maps the results back to functions.
+        Falls back to generate_function_tests if the batch cannot be completed.
+
+        Args:
+            functions: Functions to generate tests for
+            test_scenarios: MDTD test scenarios
+
+        Returns:
+            One function test entry per function
+        """
+        if not functions:
+            return []
+
+        scenarios_by_function = self._scenarios_per_function(functions, test_scenarios)
+
+        try:
+            lines = []
+            for index, (function, func_scenarios) in enumerate(zip(functions, scenarios_by_function)):
+                if self._is_trivial(function):
+                    # Answered from the template when results are mapped back
+                    continue
+                prompt = self._create_function_test_prompt(function, func_scenarios)
+                lines.append(dumps_compact({
+                    'custom_id': str(index),
+                    'method': 'POST',
+                    'url': '/v1/chat/completions',
+                    'body': {
+                        'model': self.config.openai_model,
+                        'messages': [
+                            {"role": "system", "content": SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt}
+                        ],
+                        'max_tokens': self._function_output_budget(estimate_tokens(prompt)),
+                        'temperature': self.config.openai_temperature,
+                        **self._response_format_args()
+                    }
+                }))
+
+            if not lines:
+                return await self.generate_function_tests(functions, test_scenarios)
+
+            batch_file = await self.client.files.create(
+                file=('mdtd_batch.jsonl', io.BytesIO("\n".join(lines).encode('utf-8'))),
+                purpose='batch'
+            )
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint='/v1/chat/completions',
+                completion_window='24h'
+            )
+            logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+
+            try:
+                while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+                    await asyncio.sleep(self.config.batch_poll_interval)
+                    batch = await self.client.batches.retrieve(batch.id)
+            except asyncio.CancelledError:
+                # Don't leave an abandoned job running (and billed) on the provider side
+                logger.warning(f"Cancelling batch {batch.id}")
+                try:
+                    await self.client.batches.cancel(batch.id)
+                except Exception as e:
+                    logger.warning(f"Could not cancel batch {batch.id}: {str(e)}")
+                raise
+
+            if batch.status != 'completed' or not batch.output_file_id:
+                raise RuntimeError(f"batch {batch.id} ended with status {batch.status}")
+
+            output = await self.client.files.content(batch.output_file_id)
+            contents = {}
+            for line in output.text.splitlines():
+                if line.strip():
+                    record = loads_json(line)
+                    body = (record.get('response') or {}).get('body') or {}
+                    if body.get('choices'):
+                        contents[record['custom_id']] = body['choices'][0]['message']['content']
+
+        except Exception as e:
+            logger.error(f"Batch API generation failed, using direct requests: {str(e)}")
+            return await self.generate_function_tests(functions, test_scenarios)
+
+        function_tests = []
+        for index, (function, func_scenarios) in enumerate(zip(functions, scenarios_by_function)):
+            test_code = contents.get(str(index))
+            if test_code is None:
+                test_code = await self._generate_function_tests(function, func_scenarios)
+            function_tests.append({
+                'function': function.name,
+                'language': function.language,
+                'test_code': test_code,
+                'scenarios': func_scenarios
+            })
+
+        return function_tests
+
+    def _estimate_tokens(self, item: Tuple) -> int:
+        """Roughly estimate the prompt tokens for a (function, scenarios) request"""
+        function, scenarios = item
+        return estimate_tokens(self._create_function_test_prompt(function, scenarios))
+
+    def _function_output_budget(self, prompt_tokens: int) -> int:
+        """
+        Completion token limit for one function's tests
+
+        Output grows with the scenarios in the prompt, so the limit scales with
+        the prompt size within [256, openai_max_tokens].
+        """
+        return min(self.config.openai_max_tokens, max(256, 2 * prompt_tokens))
+
+    @staticmethod
+    def _category_output_budget(limit: int, candidate_count: int) -> int:
+        """Completion token limit for an aggregate category: ~200 tokens per candidate function"""
+        return min(limit, max(256, 200 * candidate_count))
+
+    async def _generate_batched_function_tests(self, batch: List[Tuple]) -> List[str]:
+        """Generate test code for several functions with a single request"""
+        sections = "\n".join(
+            f"=== FUNCTION {index} ===\n{self._function_details(function, scenarios)}"
+            for index, (function, scenarios) in enumerate(batch)
+        )
+        prompt = FUNCTION_TEST_INSTRUCTIONS + f"""
+The following {len(batch)} sections each give the FUNCTION DETAILS of one function. Handle every function independently.
+
+{sections}
+
+Respond with a single JSON object whose keys are the function numbers ("0" to "{len(batch) - 1}")
+and whose values are the JSON objects requested for each function.
+"""
+
+        try:
+            async with self._sem:
+                content = await self._create_completion(
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=min(
+                        self.config.openai_max_tokens,
+                        sum(self._function_output_budget(self._estimate_tokens(item)) for item in batch)
+                    ),
+                    temperature=self.config.openai_temperature
+                )
+            per_function = _extract_json(content)
+        except Exception as e:
+            logger.warning(f"Batched test generation failed, retrying functions individually: {str(e)}")
+            per_function = {}
+
+        results = []
+        for index, (function, scenarios) in enumerate(batch):
+            tests = per_function.get(str(index)) if isinstance(per_function, dict) else None
+            if tests is None:
+                results.append(await self._generate_function_tests(function, scenarios))
+            else:
+                results.append(dumps_json(tests).decode('utf-8'))
+
+        return results
+
     async def _generate_function_tests(
         self,
         function: FunctionInfo,
@@ -85,128 +660,160 @@ class LLMController:
     ) -> str:
         """Generate test code for a specific function"""
 
+        if self._is_trivial(function):
+            self.templated_functions += 1
+            return self._get_fallback_test(function)
+
         prompt = self._create_function_test_prompt(function, scenarios)
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.config.openai_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": self._get_system_prompt(function.language)
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=self.config.openai_max_tokens,
-                temperature=self.config.openai_temperature
-            )
-
-            return response.choices[0].message.content
+            async with self._sem:
+                content = await self._create_completion(
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": SYSTEM_PROMPT
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    max_tokens=self._function_output_budget(estimate_tokens(prompt)),
+                    temperature=self.config.openai_temperature
+                )
+
+            return content
 
         except Exception as e:
             logger.error(f"Error generating tests for function {function.name}: {str(e)}")
+            self.failed_requests += 1
             return self._get_fallback_test(function)
 
-    def _create_function_test_prompt(self, function: FunctionInfo, scenarios: List[Dict]) -> str:
-        """Create a detailed prompt for function test generation"""
+    async def _create_completion(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float) -> str:
+        """
+        Send a chat completion request once the rate limiter admits it
 
-        function_dict = asdict(function)
+        Replies are requested in JSON object mode when ``openai_json_mode`` is
+        enabled. Transient provider errors
+        are retried with backoff (``llm_retries`` attempts). The response is
+        streamed and reading stops once a JSON object reply is complete.
+        Low-temperature requests are answered from the response cache when an
+        identical request has been made before.
 
-        prompt = f"""
-Generate comprehensive test cases for the following function using MDTD principles:
+        Args:
+            messages: Chat messages for the request
+            max_tokens: Completion token limit
+            temperature: Sampling temperature
 
+        Returns:
+            Content of the first response choice
+        """
+        cacheable = self._response_cache.cacheable(temperature)
+        request_key = None
+        if cacheable or self._manifest is not None:
+            request_key = ResponseCache.key(self.config.openai_model, messages, temperature, max_tokens)
+        if cacheable:
+            cached = await self._response_cache.get(request_key)
+            if cached is not None:
+                return cached
+        if self._manifest is not None:
+            recorded = self._manifest.get(request_key)
+            if recorded is not None:
+                return recorded
+
+        async def attempt() -> str:
+            # Prompt estimate plus the completion budget
+            await self._limiter.acquire(sum(estimate_tokens(m['content']) for m in messages) + max_tokens)
+            stream = await self.client.chat.completions.create(
+                model=self.config.openai_model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+                stream_options={'include_usage': True},
+                **self._response_format_args()
+            )
+
+            # Once a bare JSON response is complete, only the trailing usage chunk is
+            # still awaited; any further output stops reading, so trailing chatter
+            # or runaway output doesn't hold up the caller
+            parts = []
+            tracker = _JsonObjectTracker()
+            complete = False
+            try:
+                async for chunk in stream:
+                    usage = getattr(chunk, 'usage', None)
+                    if usage is not None:
+                        cached_tokens = getattr(getattr(usage, 'prompt_tokens_details', None), 'cached_tokens', None)
+                        if cached_tokens:
+                            logger.debug(f"Provider prompt cache hit: {cached_tokens}/{usage.prompt_tokens} prompt tokens")
+
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        if complete:
+                            if delta.strip():
+                                break
+                            continue
+                        parts.append(delta)
+                        complete = tracker.feed(delta)
+            finally:
+                await stream.close()
+
+            # An empty reply is '' so callers take their usual unparseable-text path
+            return ''.join(parts)[:tracker.end]
+
+        # Each attempt waits for rate limiter capacity again
+        content = await retry_with_backoff(attempt, attempts=self.config.llm_retries, max_delay=60.0)
+
+        if content:
+            if cacheable:
+                await self._response_cache.put(request_key, content)
+            if self._manifest is not None:
+                await self._manifest.record(request_key, content)
+        return content
+
+    def _response_format_args(self) -> Dict[str, Any]:
+        """Request arguments enabling JSON object mode, when configured"""
+        return {'response_format': JSON_RESPONSE_FORMAT} if self.config.openai_json_mode else {}
+
+    def _create_function_test_prompt(self, function: FunctionInfo, scenarios: List[Dict]) -> str:
+        """Create a detailed prompt for function test generation"""
+        return FUNCTION_TEST_INSTRUCTIONS + self._function_details(function, scenarios)
+
+    def _function_details(self, function: FunctionInfo, scenarios: List[Dict]) -> str:
+        """Describe the function-specific part of a test generation prompt"""
+        focus = LANGUAGE_FOCUS.get(function.language)
+        focus_line = f"- Testing Focus: {focus}\n" if focus else ""
+        # The function name is already given above, so don't repeat it per scenario
+        scenario_lines = [
+            {key: value for key, value in scenario.items() if key != 'function'}
+            for scenario in scenarios
+        ]
+
+        return f"""
 FUNCTION DETAILS:
 - Name: {function.name}
 - Language: {function.language}
-- Parameters: {json.dumps(function_dict['parameters'], indent=2)}
+- Parameters: {_compact_json(function.parameters)}
 - Return Type: {function.return_type}
 - Complexity: {function.complexity}
 - Has State: {function.has_state}
 - Error Conditions: {function.error_conditions}
 - Documentation: {function.docstring or 'No documentation available'}
-
+{focus_line}
 TEST SCENARIOS TO IMPLEMENT:
-{json.dumps(scenarios, indent=2)}
-
-REQUIREMENTS:
-1. Create tests for HTML5 form inputs that can be executed in a web browser
-2. Include equivalence partitioning tests
-3. Include boundary value analysis tests
-4. Include error condition tests
-5. Include state transition tests if applicable
-6. Generate both positive and negative test cases
-7. Include performance considerations
-8. Make tests suitable for display in HTML5 input fields
-
-OUTPUT FORMAT:
-Generate the response as a JSON object with the following structure:
-{{
-    "html_test_cases": [
-        {{
-            "test_id": "unique_id",
-            "test_name": "descriptive_name",
-            "category": "equivalence_partition|boundary_value|error_condition|state_transition",
-            "input_html": "HTML5 input field code",
-            "expected_output": "expected result",
-            "test_data": "test input values",
-            "validation_script": "JavaScript validation code"
-        }}
-    ],
-    "test_summary": {{
-        "total_tests": 0,
-        "categories_covered": [],
-        "complexity_score": 0
-    }}
-}}
-
-Focus on creating tests that can be displayed and executed in a web interface with HTML5 input fields.
+{_compact_json(scenario_lines)}
 """
-        return prompt
 
-    def _get_system_prompt(self, language: str) -> str:
-        """Get system prompt based on programming language"""
-        base_prompt = """You are an expert software test engineer specializing in Model-Driven Test Development (MDTD). 
-You create comprehensive, high-quality test cases that can be executed in web browsers using HTML5 forms.
-
-Your expertise includes:
-- Equivalence partitioning
-- Boundary value analysis
-- Error condition testing
-- State transition testing
-- Performance testing
-- Security testing
-- Web-based test interfaces
-
-Always generate tests that are:
-1. Comprehensive and cover edge cases
-2. Suitable for HTML5 web interfaces
-3. Include clear validation logic
-4. Follow MDTD best practices
-5. Include both positive and negative scenarios"""
-
-        language_specific = {
-            'python': "Focus on Python-specific testing patterns and data types.",
-            'java': "Focus on Java-specific testing patterns, exceptions, and object-oriented concepts.",
-            'cpp': "Focus on C++ memory management, pointers, and performance considerations.",
-            'javascript': "Focus on JavaScript async patterns, DOM manipulation, and browser compatibility.",
-            'csharp': "Focus on C# .NET patterns, exceptions, and type safety."
-        }
-
-        return base_prompt + "\n\n" + language_specific.get(language, "")
-
-    async def _generate_integration_tests(self, analysis_result: Dict[str, Any]) -> List[Dict]:
-        """Generate integration tests for multiple components"""
-
-        functions = analysis_result.get('functions', [])
-        if len(functions) < 2:
-            return []
+    async def _generate_integration_tests(self, functions: List[FunctionInfo]) -> List[Dict]:
+        """Generate integration tests for multiple components (at least two functions)"""
 
         prompt = f"""
 Generate integration test scenarios for the following functions:
-{json.dumps([{'name': f.name, 'parameters': f.parameters} for f in functions], indent=2)}
+{_compact_json([{'name': f.name, 'parameters': f.parameters} for f in functions])}
 
 Create tests that verify:
 1. Function interactions
@@ -214,49 +821,32 @@ Create tests that verify:
 3. End-to-end workflows
 4. Error propagation
 
-Output as JSON with HTML5-compatible test cases.
-"""
+Respond with a JSON object {{"test_cases": [...]}} of HTML5-compatible test cases.
+""".strip()
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.config.openai_model,
+            content = await self._create_completion(
                 messages=[
-                    {"role": "system", "content": self._get_system_prompt('integration')},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=1000,
+                max_tokens=self._category_output_budget(1000, len(functions)),
                 temperature=0.3
             )
 
-            # Parse response and return structured data
-            content = response.choices[0].message.content
-            # Try to extract JSON from response
-            try:
-                return json.loads(content)
-            except:
-                return [{'test_name': 'Integration Test', 'description': content}]
+            return self._parse_category_tests(content, 'Integration Test')
 
         except Exception as e:
             logger.error(f"Error generating integration tests: {str(e)}")
+            self.failed_requests += 1
             return []
 
-    async def _generate_performance_tests(self, analysis_result: Dict[str, Any]) -> List[Dict]:
-        """Generate performance test scenarios"""
-
-        if not self.config.include_performance_tests:
-            return []
-
-        high_complexity_funcs = [
-            f for f in analysis_result.get('functions', [])
-            if f.complexity > 5
-        ]
-
-        if not high_complexity_funcs:
-            return []
+    async def _generate_performance_tests(self, high_complexity_funcs: List[FunctionInfo]) -> List[Dict]:
+        """Generate performance test scenarios for high-complexity functions"""
 
         prompt = f"""
 Generate performance test scenarios for these high-complexity functions:
-{json.dumps([{'name': f.name, 'complexity': f.complexity} for f in high_complexity_funcs], indent=2)}
+{_compact_json([{'name': f.name, 'complexity': f.complexity} for f in high_complexity_funcs])}
 
 Create tests that verify:
 1. Execution time under normal load
@@ -264,47 +854,32 @@ Create tests that verify:
 3. Scalability with large inputs
 4. Resource cleanup
 
-Output as JSON with HTML5-compatible test cases including timing measurements.
-"""
+Respond with a JSON object {{"test_cases": [...]}} of HTML5-compatible test cases including timing measurements.
+""".strip()
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.config.openai_model,
+            content = await self._create_completion(
                 messages=[
                     {"role": "system", "content": "You are a performance testing expert. Create web-based performance tests."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=800,
+                max_tokens=self._category_output_budget(800, len(high_complexity_funcs)),
                 temperature=0.2
             )
 
-            content = response.choices[0].message.content
-            try:
-                return json.loads(content)
-            except:
-                return [{'test_name': 'Performance Test', 'description': content}]
+            return self._parse_category_tests(content, 'Performance Test')
 
         except Exception as e:
             logger.error(f"Error generating performance tests: {str(e)}")
+            self.failed_requests += 1
             return []
 
-    async def _generate_security_tests(self, analysis_result: Dict[str, Any]) -> List[Dict]:
-        """Generate security test scenarios"""
-
-        if not self.config.include_security_tests:
-            return []
-
-        functions_with_inputs = [
-            f for f in analysis_result.get('functions', [])
-            if f.parameters and any(p.get('type') in ['string', 'str'] for p in f.parameters)
-        ]
-
-        if not functions_with_inputs:
-            return []
+    async def _generate_security_tests(self, functions_with_inputs: List[FunctionInfo]) -> List[Dict]:
+        """Generate security test scenarios for functions that accept string inputs"""
 
         prompt = f"""
 Generate security test scenarios for these functions that accept string inputs:
-{json.dumps([{'name': f.name, 'parameters': f.parameters} for f in functions_with_inputs], indent=2)}
+{_compact_json([{'name': f.name, 'parameters': f.parameters} for f in functions_with_inputs])}
 
 Create tests that verify protection against:
 1. SQL injection attempts
@@ -313,30 +888,61 @@ Create tests that verify protection against:
 4. Invalid input validation
 5. Authentication bypass
 
-Output as JSON with HTML5-compatible test cases.
-"""
+Respond with a JSON object {{"test_cases": [...]}} of HTML5-compatible test cases.
+""".strip()
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.config.openai_model,
+            content = await self._create_completion(
                 messages=[
                     {"role": "system", "content": "You are a security testing expert. Create web-based security tests."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=800,
+                max_tokens=self._category_output_budget(800, len(functions_with_inputs)),
                 temperature=0.2
             )
 
-            content = response.choices[0].message.content
-            try:
-                return json.loads(content)
-            except:
-                return [{'test_name': 'Security Test', 'description': content}]
+            return self._parse_category_tests(content, 'Security Test')
 
         except Exception as e:
             logger.error(f"Error generating security tests: {str(e)}")
+            self.failed_requests += 1
             return []
 
+    @staticmethod
+    def _parse_category_tests(content: Optional[str], test_name: str) -> List[Dict]:
+        """
+        Extract the test case list from an aggregate category reply
+
+        Args:
+            content: Reply content, normally a {"test_cases": [...]} object
+            test_name: Name for the single description-only test used when no JSON is found
+
+        Returns:
+            Test cases for the category
+        """
+        # Extract JSON even when the reply wraps it in prose or code fences
+        parsed = _extract_json(content)
+        if isinstance(parsed, list):
+            return parsed
+        if isinstance(parsed, dict):
+            if isinstance(parsed.get('test_cases'), list):
+                return parsed['test_cases']
+            # A bare test case rather than the wrapping object
+            return [parsed] if 'test_name' in parsed else []
+        if parsed is not None:
+            return []
+        # e.g. a reply cut off at the token limit
+        return [{'test_name': test_name, 'description': content}]
+
+    def _is_trivial(self, function: FunctionInfo) -> bool:
+        """Whether the template test covers a function as well as generated tests would"""
+        return (
+            self.config.template_trivial_functions
+            and function.complexity <= 1
+            and not function.has_state
+            and not function.error_conditions
+        )
+
     def _get_fallback_test(self, function: FunctionInfo) -> str:
         """Generate a simple fallback test when LLM fails"""
         return f"""
@@ -360,6 +966,35 @@ Output as JSON with HTML5-compatible test cases.
 }}
 """
 
+    async def begin_run(self, run_id: str):
+        """
+        Start recording completed requests so an interrupted run can resume
+
+        Requests already recorded under the same run ID by an earlier,
+        interrupted attempt are answered from that record. The failed and
+        templated request counters are reset, so they describe this run only.
+
+        Args:
+            run_id: Identifier that is equal for repeated attempts at the same run
+        """
+        self.failed_requests = 0
+        self.templated_functions = 0
+        manifest = RunManifest(self.config, run_id)
+        resumed = await asyncio.to_thread(manifest.load)
+        if resumed:
+            logger.info(f"Resuming run {run_id} with {resumed} completed LLM requests")
+        self._manifest = manifest
+
+    async def end_run(self):
+        """Finish the current run and discard its manifest"""
+        if self._manifest is not None:
+            await asyncio.to_thread(self._manifest.discard)
+            self._manifest = None
+
+    async def aclose(self):
+        """Close the API client and its connection pool"""
+        await self.client.close()
+
     async def validate_api_connection(self) -> bool:
         """Validate OpenAI API connection"""
         try:
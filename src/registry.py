@@ -0,0 +1,42 @@
+"""
+Shared subsystem registry for MDTD Test Engine
+Reuses subsystem instances across engines built from equal configurations
+"""
+
+import threading
+from typing import Any, Dict, Tuple, Type, TypeVar
+
+from .config import Config
+
+T = TypeVar('T')
+
+_instances: Dict[Tuple[type, str], Any] = {}
+_lock = threading.Lock()
+
+
+def get_shared(cls: Type[T], config: Config) -> T:
+    """
+    Get the process-wide instance of a subsystem for a configuration
+
+    Only use this for subsystems that are safe to share: they must not keep
+    per-run state or objects bound to a particular event loop.
+
+    Args:
+        cls: Subsystem class, constructed as ``cls(config)`` on first use
+        config: Configuration; equal configurations share one instance
+
+    Returns:
+        The shared subsystem instance
+    """
+    key = (cls, config.cache_key())
+    with _lock:
+        instance = _instances.get(key)
+        if instance is None:
+            instance = _instances[key] = cls(config)
+    return instance
+
+
+def clear_shared():
+    """Drop all shared instances (e.g. after changing configuration in place)"""
+    with _lock:
+        _instances.clear()
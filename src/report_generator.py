@@ -3,14 +3,161 @@ Report Generator for MDTD Test Engine
 Creates comprehensive reports from test execution results
 """
 
+import asyncio
+import functools
 import logging
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
 from .config import Config
+from .serialization import LazyList
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds of the low, medium and high complexity buckets (above is very_high)
+COMPLEXITY_BUCKET_BOUNDS = (3, 7, 10)
+COMPLEXITY_BUCKET_NAMES = ('low', 'medium', 'high', 'very_high')
+
+# Lower bounds of the D, C, B and A quality grades (below is F)
+QUALITY_GRADE_BOUNDS = (60, 70, 80, 90)
+QUALITY_GRADES = ('F', 'D', 'C', 'B', 'A')
+
+# Fixed-point metrics are stored as integer multiples of 1 / METRIC_SCALE
+METRIC_SCALE = 100
+
+# Recommendation action items (shared, immutable)
+COMPLEXITY_ACTION_ITEMS = (
+    'Refactor complex functions into smaller, more manageable units',
+    'Extract common logic into separate helper functions',
+    'Consider using design patterns to reduce complexity'
+)
+DOCUMENTATION_ACTION_ITEMS = (
+    'Add docstrings to all public functions',
+    'Document complex algorithms and business logic',
+    'Include parameter and return value descriptions'
+)
+ERROR_HANDLING_ACTION_ITEMS = (
+    'Add try-catch blocks for potential failure points',
+    'Validate input parameters',
+    'Provide meaningful error messages',
+    'Log errors appropriately'
+)
+TEST_COVERAGE_ACTION_ITEMS = (
+    'Implement the generated test cases',
+    'Add edge case testing',
+    'Include negative test scenarios',
+    'Set up automated test execution'
+)
+
+# FunctionInfo fields read for each function details appendix row, in one attrgetter call
+_function_detail_values = attrgetter(
+    'name', 'language', 'complexity', 'parameters', 'return_type', 'docstring', 'error_conditions', 'line_number'
+)
+
+# Maximum number of function names listed per recommendation
+AFFECTED_FUNCTIONS_LIMIT = 10
+
+# Executive summary key findings, filled from the summary overview
+KEY_FINDINGS_TEMPLATES = (
+    "Analyzed {functions_analyzed} functions across {languages_detected} programming languages",
+    "Generated {test_suites_generated} comprehensive test suites using MDTD principles",
+    "Average cyclomatic complexity: {average_complexity}",
+    "Test coverage includes: equivalence partitioning, boundary value analysis, error conditions"
+)
+
+
+def _summarize_counts(counts: Iterable[int], threshold: int) -> Tuple[float, int, int]:
+    """Reduce a stream of counts in one pass
+
+    Args:
+        counts: Non-negative counts (parameters, base classes, methods, ...)
+        threshold: Counts above this value are tallied separately
+
+    Returns:
+        Tuple of (average, maximum, number above threshold)
+    """
+    total = n = maximum = above = 0
+    for count in counts:
+        total += count
+        n += 1
+        if count > maximum:
+            maximum = count
+        if count > threshold:
+            above += 1
+    return total / max(n, 1), maximum, above
+
+
+@dataclass(slots=True)
+class FunctionStats:
+    """Per-function aggregates shared by the quality metrics, gathered in one pass"""
+
+    count: int = 0
+    complexity_sum: int = 0
+    complexity_min: int = 0
+    complexity_max: int = 0
+    documented: int = 0
+    with_error_handling: int = 0
+    stateless: int = 0
+    # Complexity <= 5
+    simple: int = 0
+    # Names of functions with complexity > 10, in order
+    high_complexity_names: List[str] = field(default_factory=list)
+    # First AFFECTED_FUNCTIONS_LIMIT names of functions without a docstring / without error handling
+    undocumented_names: List[str] = field(default_factory=list)
+    unhandled_names: List[str] = field(default_factory=list)
+    # Function counts per COMPLEXITY_BUCKET_NAMES entry
+    complexity_buckets: List[int] = field(default_factory=lambda: [0] * len(COMPLEXITY_BUCKET_NAMES))
+
+    @classmethod
+    def from_functions(cls, functions: List) -> 'FunctionStats':
+        """Aggregate a list of FunctionInfo objects"""
+        stats = cls(count=len(functions))
+        if not functions:
+            return stats
+
+        complexity_sum = documented = with_error_handling = stateless = simple = 0
+        complexity_min = complexity_max = functions[0].complexity
+        high_complexity_names = stats.high_complexity_names
+        undocumented_names = stats.undocumented_names
+        unhandled_names = stats.unhandled_names
+        complexity_buckets = stats.complexity_buckets
+
+        for func in functions:
+            complexity = func.complexity
+            complexity_sum += complexity
+            complexity_buckets[bisect_left(COMPLEXITY_BUCKET_BOUNDS, complexity)] += 1
+            if complexity < complexity_min:
+                complexity_min = complexity
+            elif complexity > complexity_max:
+                complexity_max = complexity
+            if complexity <= 5:
+                simple += 1
+            elif complexity > 10:
+                high_complexity_names.append(func.name)
+            if func.docstring:
+                documented += 1
+            elif len(undocumented_names) < AFFECTED_FUNCTIONS_LIMIT:
+                undocumented_names.append(func.name)
+            if func.error_conditions:
+                with_error_handling += 1
+            elif len(unhandled_names) < AFFECTED_FUNCTIONS_LIMIT:
+                unhandled_names.append(func.name)
+            if not func.has_state:
+                stateless += 1
+
+        stats.complexity_sum = complexity_sum
+        stats.complexity_min = complexity_min
+        stats.complexity_max = complexity_max
+        stats.documented = documented
+        stats.with_error_handling = with_error_handling
+        stats.stateless = stateless
+        stats.simple = simple
+        return stats
+
 
 class ReportGenerator:
     """Generates comprehensive reports from test results"""
@@ -31,15 +178,47 @@ class ReportGenerator:
         try:
             logger.info("Generating comprehensive test report...")
 
+            # Shared sub-analyses are computed once and passed to every section that
+            # needs them (this instance is shared, so nothing is cached on it)
+            source_analysis = data.get('source_analysis', {})
+            functions = source_analysis.get('functions', [])
+
+            # Empty inputs (no functions, classes, scenarios or tests) skip the worker
+            # threads, whose dispatch would cost more than the sections themselves
+            has_content = bool(
+                functions or source_analysis.get('classes')
+                or data.get('test_scenarios') or data.get('generated_tests')
+            )
+
+            stats = (
+                await asyncio.to_thread(FunctionStats.from_functions, functions)
+                if functions else FunctionStats()
+            )
+
+            # Independent sections run concurrently; the summary and recommendations
+            # depend on their results and are built afterwards
+            sections = (
+                (self._analyze_source_code, source_analysis, stats),
+                (self._analyze_test_coverage, data),
+                (self._analyze_test_execution, data),
+                (self._calculate_quality_metrics, source_analysis, stats),
+                (self._generate_appendices, data)
+            )
+            if has_content:
+                section_results = await asyncio.gather(*(asyncio.to_thread(*section) for section in sections))
+            else:
+                section_results = [section[0](*section[1:]) for section in sections]
+            source_code, test_coverage, test_execution, quality_metrics, appendices = section_results
+
             report = {
                 'metadata': self._generate_metadata(),
-                'executive_summary': self._generate_executive_summary(data),
-                'source_analysis': self._analyze_source_code(data.get('source_analysis', {})),
-                'test_coverage': self._analyze_test_coverage(data),
-                'test_execution': self._analyze_test_execution(data),
-                'quality_metrics': self._calculate_quality_metrics(data),
-                'recommendations': self._generate_recommendations(data),
-                'appendices': self._generate_appendices(data)
+                'executive_summary': self._generate_executive_summary(data, source_analysis, stats, quality_metrics),
+                'source_analysis': source_code,
+                'test_coverage': test_coverage,
+                'test_execution': test_execution,
+                'quality_metrics': quality_metrics,
+                'recommendations': self._generate_recommendations(source_analysis, stats, test_coverage),
+                'appendices': appendices
             }
 
             logger.info("Report generation completed")
@@ -51,43 +230,54 @@ class ReportGenerator:
 
     def _generate_metadata(self) -> Dict[str, Any]:
         """Generate report metadata"""
-        return {
+        metadata = {
             'generated_at': datetime.now().isoformat(),
             'generator_version': '1.0.0',
             'report_type': 'MDTD Test Analysis Report',
             'format_version': '2023.1'
         }
-
-    def _generate_executive_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if self.config.report_fixed_point_metrics:
+            metadata['metric_scale'] = METRIC_SCALE
+        return metadata
+
+    def _metric(self, value: float) -> Union[float, int]:
+        """Round a metric to 2 decimal places, or to integer hundredths in fixed-point mode"""
+        if self.config.report_fixed_point_metrics:
+            return int(round(value * METRIC_SCALE))
+        return round(value, 2)
+
+    def _generate_executive_summary(
+        self,
+        data: Dict[str, Any],
+        source_analysis: Dict[str, Any],
+        stats: FunctionStats,
+        quality_metrics: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """Generate executive summary"""
-        source_analysis = data.get('source_analysis', {})
         generated_tests = data.get('generated_tests', {})
 
-        functions_analyzed = len(source_analysis.get('functions', []))
+        functions_analyzed = stats.count
         test_suites_generated = len(generated_tests.get('function_tests', []))
         languages_detected = len(source_analysis.get('language_distribution', {}))
 
         complexity_metrics = source_analysis.get('complexity_metrics', {})
         avg_complexity = complexity_metrics.get('average_complexity', 0)
 
+        overview = {
+            'functions_analyzed': functions_analyzed,
+            'test_suites_generated': test_suites_generated,
+            'languages_detected': languages_detected,
+            'average_complexity': round(avg_complexity, 2)
+        }
+
         return {
-            'overview': {
-                'functions_analyzed': functions_analyzed,
-                'test_suites_generated': test_suites_generated,
-                'languages_detected': languages_detected,
-                'average_complexity': round(avg_complexity, 2)
-            },
-            'key_findings': [
-                f"Analyzed {functions_analyzed} functions across {languages_detected} programming languages",
-                f"Generated {test_suites_generated} comprehensive test suites using MDTD principles",
-                f"Average cyclomatic complexity: {round(avg_complexity, 2)}",
-                f"Test coverage includes: equivalence partitioning, boundary value analysis, error conditions"
-            ],
-            'quality_assessment': self._assess_overall_quality(data),
-            'risk_assessment': self._assess_risks(data)
+            'overview': overview,
+            'key_findings': [template.format_map(overview) for template in KEY_FINDINGS_TEMPLATES],
+            'quality_assessment': self._assess_overall_quality(quality_metrics),
+            'risk_assessment': self._assess_risks(source_analysis, stats)
         }
 
-    def _analyze_source_code(self, source_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_source_code(self, source_analysis: Dict[str, Any], stats: FunctionStats) -> Dict[str, Any]:
         """Analyze source code quality and characteristics"""
         functions = source_analysis.get('functions', [])
         classes = source_analysis.get('classes', [])
@@ -98,11 +288,11 @@ class ReportGenerator:
 
         # Function analysis
         function_analysis = {
-            'total_functions': len(functions),
-            'complexity_distribution': self._analyze_complexity_distribution(functions),
+            'total_functions': stats.count,
+            'complexity_distribution': self._analyze_complexity_distribution(stats),
             'parameter_analysis': self._analyze_parameters(functions),
             'return_type_analysis': self._analyze_return_types(functions),
-            'error_handling_analysis': self._analyze_error_handling(functions)
+            'error_handling_analysis': self._analyze_error_handling(functions, stats)
         }
 
         # Class analysis
@@ -117,7 +307,7 @@ class ReportGenerator:
             'function_analysis': function_analysis,
             'class_analysis': class_analysis,
             'complexity_metrics': complexity_metrics,
-            'code_quality_indicators': self._calculate_code_quality_indicators(source_analysis)
+            'code_quality_indicators': self._calculate_code_quality_indicators(source_analysis, stats)
         }
 
     def _analyze_test_coverage(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -126,10 +316,7 @@ class ReportGenerator:
         test_scenarios = data.get('test_scenarios', [])
 
         # Coverage by category
-        category_coverage = {}
-        for scenario in test_scenarios:
-            category = scenario.get('category', 'unknown')
-            category_coverage[category] = category_coverage.get(category, 0) + 1
+        category_coverage = dict(Counter(scenario.get('category', 'unknown') for scenario in test_scenarios))
 
         # Coverage by function
         function_tests = generated_tests.get('function_tests', [])
@@ -154,7 +341,7 @@ class ReportGenerator:
             'coverage_summary': {
                 'total_test_scenarios': len(test_scenarios),
                 'functions_with_tests': len([f for f in function_coverage.values() if f > 0]),
-                'average_tests_per_function': round(sum(function_coverage.values()) / max(len(function_coverage), 1), 2)
+                'average_tests_per_function': self._metric(sum(function_coverage.values()) / max(len(function_coverage), 1))
             }
         }
 
@@ -185,43 +372,39 @@ class ReportGenerator:
             }
         }
 
-    def _calculate_quality_metrics(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_quality_metrics(self, source_analysis: Dict[str, Any], stats: FunctionStats) -> Dict[str, Any]:
         """Calculate various quality metrics"""
-        source_analysis = data.get('source_analysis', {})
-        functions = source_analysis.get('functions', [])
-
-        if not functions:
+        if not stats.count:
             return {}
 
-        # Complexity metrics
-        complexities = [f.complexity for f in functions]
+        percent_per_function = 100.0 / stats.count
 
         # Documentation metrics
-        documented_functions = len([f for f in functions if f.docstring])
-        documentation_coverage = documented_functions / len(functions) * 100
+        documented_functions = stats.documented
+        documentation_coverage = documented_functions * percent_per_function
 
         # Error handling metrics
-        functions_with_error_handling = len([f for f in functions if f.error_conditions])
-        error_handling_coverage = functions_with_error_handling / len(functions) * 100
+        functions_with_error_handling = stats.with_error_handling
+        error_handling_coverage = functions_with_error_handling * percent_per_function
 
         # Testability metrics
         test_opportunities = source_analysis.get('test_opportunities', [])
-        testability_score = self._calculate_testability_score(functions, test_opportunities)
+        testability_score = self._calculate_testability_score(stats, test_opportunities)
 
         return {
             'complexity_metrics': {
-                'average_complexity': round(sum(complexities) / len(complexities), 2),
-                'max_complexity': max(complexities),
-                'min_complexity': min(complexities),
-                'high_complexity_functions': [f.name for f in functions if f.complexity > 10]
+                'average_complexity': self._metric(stats.complexity_sum / stats.count),
+                'max_complexity': stats.complexity_max,
+                'min_complexity': stats.complexity_min,
+                'high_complexity_functions': stats.high_complexity_names
             },
             'documentation_metrics': {
-                'documentation_coverage': round(documentation_coverage, 2),
+                'documentation_coverage': self._metric(documentation_coverage),
                 'documented_functions': documented_functions,
-                'total_functions': len(functions)
+                'total_functions': stats.count
             },
             'error_handling_metrics': {
-                'error_handling_coverage': round(error_handling_coverage, 2),
+                'error_handling_coverage': self._metric(error_handling_coverage),
                 'functions_with_error_handling': functions_with_error_handling
             },
             'testability_metrics': {
@@ -230,13 +413,16 @@ class ReportGenerator:
             }
         }
 
-    def _generate_recommendations(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_recommendations(
+        self,
+        source_analysis: Dict[str, Any],
+        stats: FunctionStats,
+        test_coverage: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         """Generate actionable recommendations"""
         recommendations = []
 
-        source_analysis = data.get('source_analysis', {})
         complexity_metrics = source_analysis.get('complexity_metrics', {})
-        functions = source_analysis.get('functions', [])
 
         # Complexity recommendations
         high_complexity_funcs = complexity_metrics.get('high_complexity_functions', [])
@@ -246,63 +432,42 @@ class ReportGenerator:
                 'priority': 'High',
                 'title': 'Reduce Cyclomatic Complexity',
                 'description': f'Found {len(high_complexity_funcs)} functions with high cyclomatic complexity (>10)',
-                'action_items': [
-                    'Refactor complex functions into smaller, more manageable units',
-                    'Extract common logic into separate helper functions',
-                    'Consider using design patterns to reduce complexity'
-                ],
+                'action_items': COMPLEXITY_ACTION_ITEMS,
                 'affected_functions': high_complexity_funcs
             })
 
         # Documentation recommendations
-        undocumented_functions = [f for f in functions if not f.docstring]
-        if len(undocumented_functions) > len(functions) * 0.3:  # More than 30% undocumented
+        undocumented_count = stats.count - stats.documented
+        if undocumented_count > stats.count * 0.3:  # More than 30% undocumented
             recommendations.append({
                 'category': 'Documentation',
                 'priority': 'Medium',
                 'title': 'Improve Code Documentation',
-                'description': f'{len(undocumented_functions)} functions lack documentation',
-                'action_items': [
-                    'Add docstrings to all public functions',
-                    'Document complex algorithms and business logic',
-                    'Include parameter and return value descriptions'
-                ],
-                'affected_functions': [f.name for f in undocumented_functions[:10]]  # Show first 10
+                'description': f'{undocumented_count} functions lack documentation',
+                'action_items': DOCUMENTATION_ACTION_ITEMS,
+                'affected_functions': stats.undocumented_names
             })
 
         # Error handling recommendations
-        functions_without_error_handling = [f for f in functions if not f.error_conditions]
-        if len(functions_without_error_handling) > len(functions) * 0.5:  # More than 50% without error handling
+        unhandled_count = stats.count - stats.with_error_handling
+        if unhandled_count > stats.count * 0.5:  # More than 50% without error handling
             recommendations.append({
                 'category': 'Error Handling',
                 'priority': 'High',
                 'title': 'Implement Comprehensive Error Handling',
-                'description': f'{len(functions_without_error_handling)} functions lack proper error handling',
-                'action_items': [
-                    'Add try-catch blocks for potential failure points',
-                    'Validate input parameters',
-                    'Provide meaningful error messages',
-                    'Log errors appropriately'
-                ],
-                'affected_functions': [f.name for f in functions_without_error_handling[:10]]
+                'description': f'{unhandled_count} functions lack proper error handling',
+                'action_items': ERROR_HANDLING_ACTION_ITEMS,
+                'affected_functions': stats.unhandled_names
             })
 
         # Testing recommendations
-        generated_tests = data.get('generated_tests', {})
-        test_coverage = self._analyze_test_coverage(data)
-
-        if test_coverage.get('coverage_summary', {}).get('average_tests_per_function', 0) < 3:
+        if test_coverage.get('coverage_summary', {}).get('average_tests_per_function', 0) < self._metric(3):
             recommendations.append({
                 'category': 'Test Coverage',
                 'priority': 'Medium',
                 'title': 'Increase Test Coverage',
                 'description': 'Functions have insufficient test coverage',
-                'action_items': [
-                    'Implement the generated test cases',
-                    'Add edge case testing',
-                    'Include negative test scenarios',
-                    'Set up automated test execution'
-                ]
+                'action_items': TEST_COVERAGE_ACTION_ITEMS
             })
 
         return recommendations
@@ -317,22 +482,9 @@ class ReportGenerator:
         }
 
     # Helper methods for detailed analysis
-    def _analyze_complexity_distribution(self, functions: List) -> Dict[str, int]:
+    def _analyze_complexity_distribution(self, stats: FunctionStats) -> Dict[str, int]:
         """Analyze distribution of cyclomatic complexity"""
-        distribution = {'low': 0, 'medium': 0, 'high': 0, 'very_high': 0}
-
-        for func in functions:
-            complexity = func.complexity
-            if complexity <= 3:
-                distribution['low'] += 1
-            elif complexity <= 7:
-                distribution['medium'] += 1
-            elif complexity <= 10:
-                distribution['high'] += 1
-            else:
-                distribution['very_high'] += 1
-
-        return distribution
+        return dict(zip(COMPLEXITY_BUCKET_NAMES, stats.complexity_buckets))
 
     def _analyze_parameters(self, functions: List) -> Dict[str, Any]:
         """Analyze function parameters"""
@@ -343,55 +495,49 @@ class ReportGenerator:
                 'functions_with_many_params': 0
             }
 
-        param_counts = [len(f.parameters) for f in functions]
+        # Only the counts matter here; reduce them without touching the parameter dicts
+        average, maximum, many = _summarize_counts(map(len, map(attrgetter('parameters'), functions)), 5)
 
         return {
-            'average_parameters': round(sum(param_counts) / max(len(param_counts), 1), 2),
-            'max_parameters': max(param_counts) if param_counts else 0,
-            'functions_with_many_params': len([c for c in param_counts if c > 5])
+            'average_parameters': self._metric(average),
+            'max_parameters': maximum,
+            'functions_with_many_params': many
         }
 
     def _analyze_return_types(self, functions: List) -> Dict[str, int]:
         """Analyze return types distribution"""
-        return_types = {}
-        for func in functions:
-            ret_type = func.return_type or 'unknown'
-            return_types[ret_type] = return_types.get(ret_type, 0) + 1
-        return return_types
+        return dict(Counter(func.return_type or 'unknown' for func in functions))
 
-    def _analyze_error_handling(self, functions: List) -> Dict[str, Any]:
+    def _analyze_error_handling(self, functions: List, stats: FunctionStats) -> Dict[str, Any]:
         """Analyze error handling patterns"""
-        error_types = {}
-        for func in functions:
-            for error in func.error_conditions:
-                error_types[error] = error_types.get(error, 0) + 1
+        error_types = Counter(error for func in functions for error in func.error_conditions)
 
         return {
-            'common_error_types': error_types,
-            'functions_with_error_handling': len([f for f in functions if f.error_conditions])
+            'common_error_types': dict(error_types),
+            'functions_with_error_handling': stats.with_error_handling
         }
 
     def _analyze_inheritance(self, classes: List) -> Dict[str, Any]:
         """Analyze class inheritance patterns"""
-        inheritance_depths = [len(cls.inheritance) for cls in classes]
+        average, maximum, inheriting = _summarize_counts(map(len, map(attrgetter('inheritance'), classes)), 0)
 
         return {
-            'average_inheritance_depth': round(sum(inheritance_depths) / max(len(inheritance_depths), 1), 2),
-            'max_inheritance_depth': max(inheritance_depths) if inheritance_depths else 0,
-            'classes_with_inheritance': len([d for d in inheritance_depths if d > 0])
+            'average_inheritance_depth': self._metric(average),
+            'max_inheritance_depth': maximum,
+            'classes_with_inheritance': inheriting
         }
 
     def _analyze_method_distribution(self, classes: List) -> Dict[str, Any]:
         """Analyze method distribution in classes"""
-        method_counts = [len(cls.methods) for cls in classes]
+        average, maximum, many = _summarize_counts(map(len, map(attrgetter('methods'), classes)), 10)
 
         return {
-            'average_methods_per_class': round(sum(method_counts) / max(len(method_counts), 1), 2),
-            'max_methods_in_class': max(method_counts) if method_counts else 0,
-            'classes_with_many_methods': len([c for c in method_counts if c > 10])
+            'average_methods_per_class': self._metric(average),
+            'max_methods_in_class': maximum,
+            'classes_with_many_methods': many
         }
 
-    def _calculate_code_quality_indicators(self, source_analysis: Dict) -> Dict[str, Any]:
+    def _calculate_code_quality_indicators(self, source_analysis: Dict, stats: FunctionStats) -> Dict[str, Any]:
         """Calculate overall code quality indicators"""
         functions = source_analysis.get('functions', [])
         complexity_metrics = source_analysis.get('complexity_metrics', {})
@@ -403,58 +549,40 @@ class ReportGenerator:
         avg_complexity = complexity_metrics.get('average_complexity', 0)
         complexity_score = max(0, 100 - (avg_complexity * 5))  # Penalty for high complexity
 
-        documented_ratio = len([f for f in functions if f.docstring]) / len(functions)
-        documentation_score = documented_ratio * 100
-
-        error_handling_ratio = len([f for f in functions if f.error_conditions]) / len(functions)
-        error_handling_score = error_handling_ratio * 100
+        percent_per_function = 100.0 / stats.count
+        documentation_score = stats.documented * percent_per_function
+        error_handling_score = stats.with_error_handling * percent_per_function
 
         overall_score = (complexity_score + documentation_score + error_handling_score) / 3
 
         return {
-            'overall_quality_score': round(overall_score, 2),
-            'complexity_score': round(complexity_score, 2),
-            'documentation_score': round(documentation_score, 2),
-            'error_handling_score': round(error_handling_score, 2),
+            'overall_quality_score': self._metric(overall_score),
+            'complexity_score': self._metric(complexity_score),
+            'documentation_score': self._metric(documentation_score),
+            'error_handling_score': self._metric(error_handling_score),
             'quality_grade': self._get_quality_grade(overall_score)
         }
 
     def _get_quality_grade(self, score: float) -> str:
         """Convert quality score to letter grade"""
-        if score >= 90:
-            return 'A'
-        elif score >= 80:
-            return 'B'
-        elif score >= 70:
-            return 'C'
-        elif score >= 60:
-            return 'D'
-        else:
-            return 'F'
+        return QUALITY_GRADES[bisect_right(QUALITY_GRADE_BOUNDS, score)]
 
-    def _calculate_testability_score(self, functions: List, test_opportunities: List) -> float:
+    def _calculate_testability_score(self, stats: FunctionStats, test_opportunities: List) -> Union[float, int]:
         """Calculate testability score"""
-        if not functions:
+        if not stats.count:
             return 0
 
-        # Factors that improve testability
-        pure_functions = len([f for f in functions if not f.has_state])
-        documented_functions = len([f for f in functions if f.docstring])
-        simple_functions = len([f for f in functions if f.complexity <= 5])
-
-        # Calculate score
-        testability_factors = [
-            pure_functions / len(functions),  # Pure functions are easier to test
-            documented_functions / len(functions),  # Documentation helps understand expected behavior
-            simple_functions / len(functions),  # Simple functions are easier to test
-        ]
-
-        return round(sum(testability_factors) / len(testability_factors) * 100, 2)
+        # Factors that improve testability, averaged as percentages of all functions
+        testability_factors = (
+            stats.stateless,  # Pure functions are easier to test
+            stats.documented,  # Documentation helps understand expected behavior
+            stats.simple,  # Simple functions are easier to test
+        )
 
-    def _assess_overall_quality(self, data: Dict[str, Any]) -> str:
-        """Assess overall code quality"""
-        quality_metrics = self._calculate_quality_metrics(data)
+        return self._metric(sum(testability_factors) * (100.0 / (len(testability_factors) * stats.count)))
 
+    def _assess_overall_quality(self, quality_metrics: Dict[str, Any]) -> str:
+        """Assess overall code quality from the calculated quality metrics"""
         if not quality_metrics:
             return "Insufficient data for quality assessment"
 
@@ -471,11 +599,10 @@ class ReportGenerator:
         else:
             return "Critical - Major refactoring required"
 
-    def _assess_risks(self, data: Dict[str, Any]) -> List[str]:
+    def _assess_risks(self, source_analysis: Dict[str, Any], stats: FunctionStats) -> List[str]:
         """Assess potential risks based on analysis"""
         risks = []
 
-        source_analysis = data.get('source_analysis', {})
         complexity_metrics = source_analysis.get('complexity_metrics', {})
 
         # Complexity risks
@@ -483,38 +610,40 @@ class ReportGenerator:
         if len(high_complexity_funcs) > 0:
             risks.append(f"High complexity functions ({len(high_complexity_funcs)}) increase maintenance risk")
 
-        # Documentation risks
-        functions = source_analysis.get('functions', [])
-        if functions:
-            undocumented_ratio = len([f for f in functions if not f.docstring]) / len(functions)
+        if stats.count:
+            # Documentation risks
+            undocumented_ratio = (stats.count - stats.documented) / stats.count
             if undocumented_ratio > 0.5:
                 risks.append("Poor documentation coverage increases knowledge transfer risk")
 
-        # Error handling risks
-        if functions:
-            no_error_handling_ratio = len([f for f in functions if not f.error_conditions]) / len(functions)
+            # Error handling risks
+            no_error_handling_ratio = (stats.count - stats.with_error_handling) / stats.count
             if no_error_handling_ratio > 0.7:
                 risks.append("Inadequate error handling increases system reliability risk")
 
         return risks
 
-    def _create_function_details_appendix(self, data: Dict[str, Any]) -> List[Dict]:
-        """Create detailed function information appendix"""
+    def _create_function_details_appendix(self, data: Dict[str, Any]) -> LazyList:
+        """Create detailed function information appendix (entries are built when serialized)"""
         functions = data.get('source_analysis', {}).get('functions', [])
-
-        return [
-            {
-                'name': func.name,
-                'language': func.language,
-                'complexity': func.complexity,
-                'parameters': func.parameters,
-                'return_type': func.return_type,
-                'has_documentation': bool(func.docstring),
-                'error_conditions': func.error_conditions,
-                'line_number': func.line_number
-            }
-            for func in functions
-        ]
+        return LazyList(lambda: map(self._function_details, functions), len(functions))
+
+    @staticmethod
+    def _function_details(func) -> Dict[str, Any]:
+        """Describe one function for the details appendix"""
+        name, language, complexity, parameters, return_type, docstring, error_conditions, line_number = (
+            _function_detail_values(func)
+        )
+        return {
+            'name': name,
+            'language': language,
+            'complexity': complexity,
+            'parameters': parameters,
+            'return_type': return_type,
+            'has_documentation': bool(docstring),
+            'error_conditions': error_conditions,
+            'line_number': line_number
+        }
 
     def _create_test_scenarios_appendix(self, data: Dict[str, Any]) -> List[Dict]:
         """Create test scenarios details appendix"""
@@ -534,6 +663,11 @@ class ReportGenerator:
 
     def _create_configuration_appendix(self) -> Dict[str, Any]:
         """Create configuration details appendix"""
+        return self._configuration_appendix
+
+    @functools.cached_property
+    def _configuration_appendix(self) -> Dict[str, Any]:
+        """Configuration details, built once per generator since they only depend on the config"""
         return {
             'supported_languages': list(self.config.supported_languages.keys()),
             'test_categories': self.config.test_categories,
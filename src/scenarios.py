@@ -0,0 +1,53 @@
+"""
+Scenario containers for MDTD Test Engine
+Column-oriented view over MDTD test scenario records
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True)
+class ScenarioColumns:
+    """
+    Struct-of-arrays view of MDTD test scenarios
+
+    Each field holds one column, aligned by index with ``records`` (the
+    original scenario dicts, which stay the public representation). Scans
+    that only need a column or two, such as grouping by function, read the
+    dense lists instead of doing a dict lookup per scenario.
+    """
+    types: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    functions: List[str] = field(default_factory=list)
+    parameters: List[Optional[str]] = field(default_factory=list)
+    records: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> 'ScenarioColumns':
+        """Build the columns for a list of scenario dicts"""
+        return cls(
+            types=[r.get('type') for r in records],
+            categories=[r.get('category') for r in records],
+            functions=[r.get('function') for r in records],
+            parameters=[r.get('parameter') for r in records],
+            records=records
+        )
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Return the scenario dicts in their original order"""
+        return self.records
+
+    def group_by_function(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Group scenario dicts by function name, preserving order within each group"""
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for function, record in zip(self.functions, self.records):
+            groups.setdefault(function, []).append(record)
+        return groups
+
+    def of_type(self, scenario_type: str) -> List[Dict[str, Any]]:
+        """Select the scenario dicts of one MDTD type"""
+        return [r for t, r in zip(self.types, self.records) if t == scenario_type]
+
+    def __len__(self) -> int:
+        return len(self.records)
@@ -0,0 +1,242 @@
+"""
+JSON serialization helpers for MDTD Test Engine
+Uses orjson when available and falls back to the standard library
+"""
+
+import dataclasses
+import json
+import math
+from collections.abc import Mapping
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Fields written to source_analysis.json, read with a single attrgetter call per object
+FUNCTION_FIELDS = (
+    'name', 'parameters', 'return_type', 'docstring', 'complexity', 'line_number',
+    'language', 'visibility', 'is_static', 'has_state', 'error_conditions'
+)
+CLASS_FIELDS = ('attributes', 'inheritance', 'language', 'line_number')
+_function_values = attrgetter(*FUNCTION_FIELDS)
+_class_values = attrgetter(*CLASS_FIELDS)
+
+
+class LazyList:
+    """
+    Sized, re-iterable sequence whose items are built only when iterated
+
+    Lets large report sections be handed around without materializing them;
+    dumps_json builds the items while the document is encoded.
+    """
+
+    __slots__ = ('_factory', '_length')
+
+    def __init__(self, factory: Callable[[], Iterable[Any]], length: int):
+        self._factory = factory
+        self._length = length
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._factory())
+
+    def __len__(self) -> int:
+        return self._length
+
+
+def _default(obj: Any) -> Any:
+    """Convert objects the JSON encoder does not handle natively"""
+    if isinstance(obj, LazyList):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """
+    Whether an object holds an infinite or NaN float anywhere inside it
+
+    orjson encodes those as null, which would make boundary values such as
+    -inf/inf indistinguishable from None, so such payloads use the standard
+    library instead (which writes -Infinity/Infinity/NaN).
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if type(value) is float:
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, Mapping):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, LazyList)):
+            stack.extend(value)
+        elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+            stack.extend(getattr(value, f.name) for f in dataclasses.fields(value))
+    return False
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize an object to indented UTF-8 JSON
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None and not _has_non_finite(obj):
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=_default
+        )
+    # Raw UTF-8 like orjson, so documents read the same whichever encoder wrote them
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode('utf-8')
+
+
+def dumps_compact(obj: Any, sort_keys: bool = False) -> str:
+    """
+    Serialize an object to compact JSON text (no indentation or spacing)
+
+    Args:
+        obj: Object to serialize
+        sort_keys: Sort object keys, for output used as a stable key
+
+    Returns:
+        JSON text
+
+    Non-finite floats survive a round trip:
+
+    >>> loads_json(dumps_compact([float('-inf'), 0, float('inf')]))
+    [-inf, 0, inf]
+    """
+    if orjson is not None and not _has_non_finite(obj):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option, default=_default).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys, default=_default)
+
+
+def loads_json(data: Any) -> Any:
+    """
+    Parse a JSON document from str or bytes
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the -Infinity/Infinity/NaN tokens json.dumps writes,
+            # so let the standard library decide; its error is a JSONDecodeError too
+            pass
+    return json.loads(data)
+
+
+def write_json(path: Path, obj: Any):
+    """Serialize an object and write it to a JSON file"""
+    path.write_bytes(dumps_json(obj))
+
+
+def serialize_function(function) -> Dict[str, Any]:
+    """Convert a FunctionInfo into a JSON-serializable dict"""
+    return dict(zip(FUNCTION_FIELDS, _function_values(function)))
+
+
+def serialize_class(cls) -> Dict[str, Any]:
+    """Convert a ClassInfo into a JSON-serializable dict"""
+    return {
+        'name': cls.name,
+        'methods': [m.name for m in cls.methods],
+        **dict(zip(CLASS_FIELDS, _class_values(cls)))
+    }
+
+
+def _dumps_nested(obj: Any, level: int) -> bytes:
+    """Serialize an object indented to sit ``level`` levels deep in a document"""
+    # Encoded JSON never contains raw newlines inside strings, so this only re-indents
+    return dumps_json(obj).replace(b'\n', b'\n' + b'  ' * level)
+
+
+def _write_json_array(f: BinaryIO, items: Iterable[Any], level: int):
+    """Write a JSON array one element at a time without materializing it"""
+    item_prefix = b'\n' + b'  ' * (level + 1)
+    f.write(b'[')
+    empty = True
+    for item in items:
+        f.write(item_prefix if empty else b',' + item_prefix)
+        f.write(_dumps_nested(item, level + 1))
+        empty = False
+    f.write(b']' if empty else b'\n' + b'  ' * level + b']')
+
+
+def _write_json_value(f: BinaryIO, value: Any, level: int):
+    """Write a value, descending into dicts so LazyList sections are streamed item by item"""
+    if isinstance(value, LazyList):
+        _write_json_array(f, value, level)
+    elif isinstance(value, dict) and value:
+        key_prefix = b'\n' + b'  ' * (level + 1)
+        f.write(b'{')
+        for i, (key, item) in enumerate(value.items()):
+            f.write(b',' + key_prefix if i else key_prefix)
+            f.write(dumps_json(str(key)) + b': ')
+            _write_json_value(f, item, level + 1)
+        f.write(b'\n' + b'  ' * level + b'}')
+    else:
+        f.write(_dumps_nested(value, level))
+
+
+def write_json_stream(path: Path, obj: Any):
+    """
+    Serialize an object to a JSON file, streaming its LazyList sections
+
+    Produces the same document as write_json, but large lazy sections (such as
+    report appendices) are encoded and written one item at a time instead of
+    being held in memory as a single encoded buffer.
+
+    Args:
+        path: Output file path
+        obj: Object to serialize
+    """
+    with open(path, 'wb') as f:
+        _write_json_value(f, obj, 0)
+
+
+def write_analysis_json(path: Path, analysis: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Stream an analysis result to a JSON file in a single pass
+
+    Functions and classes are converted and written one at a time, so no
+    serializable copy of the whole analysis is held in memory.
+
+    Args:
+        path: Output file path
+        analysis: Results from FileAnalyzer.analyze
+
+    Returns:
+        Tuple of (function count, class count)
+    """
+    function_count = class_count = 0
+    with open(path, 'wb') as f:
+        f.write(b'{')
+        for i, (key, value) in enumerate(analysis.items()):
+            f.write(b',\n  ' if i else b'\n  ')
+            f.write(dumps_json(str(key)) + b': ')
+            if key == 'functions':
+                _write_json_array(f, map(serialize_function, value), level=1)
+                function_count = len(value)
+            elif key == 'classes':
+                _write_json_array(f, map(serialize_class, value), level=1)
+                class_count = len(value)
+            else:
+                f.write(_dumps_nested(value, 1))
+        f.write(b'\n}' if analysis else b'}')
+
+    return function_count, class_count
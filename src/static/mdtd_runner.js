@@ -0,0 +1,697 @@
+// Global variables
+let testResults = [];
+const testResultIndex = new Map();
+let currentSuite = null;
+let executionStats = {
+    passed: 0,
+    failed: 0,
+    skipped: 0,
+    total: 0
+};
+
+// Element IDs are stable once the page is rendered, so lookups are cached
+const elCache = new Map();
+
+function byId(id) {
+    let el = elCache.get(id);
+    if (!el) {
+        el = document.getElementById(id);
+        if (el) elCache.set(id, el);
+    }
+    return el;
+}
+
+const resultTemplate = (r) => `
+        <h4>Test Results</h4>
+        <div class="result-content">
+            <strong>Status:</strong> <span class="status-${r.success ? 'passed' : 'failed'}">
+                ${r.success ? 'PASSED' : 'FAILED'}
+            </span>
+
+            <strong>Message:</strong> ${r.result}
+
+            <strong>Execution Time:</strong> ${r.executionTime}ms
+
+            <strong>Timestamp:</strong> ${new Date(r.timestamp).toLocaleString()}
+
+            ${r.details ? `<strong>Details:</strong> ${JSON.stringify(r.details, null, 2)}` : ''}
+        </div>
+    `;
+
+// The test suites are rendered once with the page, so their forms are queried once
+let allTestForms = null;
+
+function getAllTestForms() {
+    if (!allTestForms) allTestForms = document.querySelectorAll('.test-form');
+    return allTestForms;
+}
+
+// Initialize the interface
+document.addEventListener('DOMContentLoaded', function() {
+    showDashboard();
+    initializeCharts();
+    hljs.highlightAll();
+});
+
+// Navigation functions
+function showDashboard() {
+    hideAllSections();
+    document.getElementById('dashboard').style.display = 'block';
+    setActiveNavItem('dashboard');
+}
+
+function showTestSuite(suiteId) {
+    hideAllSections();
+    document.getElementById(`suite-${suiteId}`).style.display = 'block';
+    currentSuite = suiteId;
+}
+
+function showResults() {
+    hideAllSections();
+    document.getElementById('results-panel').style.display = 'block';
+    scheduleChartUpdate();
+    updateResultsTable();
+}
+
+function hideAllSections() {
+    // Hide dashboard
+    const dashboard = document.getElementById('dashboard');
+    if (dashboard) dashboard.style.display = 'none';
+
+    // Hide all test suites
+    const suites = document.querySelectorAll('.test-suite-container');
+    suites.forEach(suite => suite.style.display = 'none');
+
+    // Hide results panel
+    const results = document.getElementById('results-panel');
+    if (results) results.style.display = 'none';
+}
+
+function setActiveNavItem(itemId) {
+    // Remove active class from all nav items
+    document.querySelectorAll('.nav-link').forEach(link => {
+        link.classList.remove('active');
+    });
+
+    // Add active class to current item
+    const activeLink = document.querySelector(`a[href="#${itemId}"]`);
+    if (activeLink) activeLink.classList.add('active');
+}
+
+// Test execution functions
+function executeTest(testId, event) {
+    if (event) event.preventDefault();
+    runTest(testId);
+    return false;
+}
+
+// Resolves once the test's result has been displayed and counted
+function runTest(testId) {
+    const testContainer = byId(`test-${testId}`);
+    const resultsDiv = byId(`results-${testId}`);
+
+    if (!testContainer || !resultsDiv) {
+        console.error(`Test elements not found for ID: ${testId}`);
+        return Promise.resolve(null);
+    }
+
+    // Show loading state
+    testContainer.classList.add('test-running');
+    resultsDiv.style.display = 'block';
+    resultsDiv.innerHTML = '<div class="spinner"></div>Executing test...';
+
+    return new Promise(resolve => {
+        // Simulate test execution with delay
+        setTimeout(() => {
+            const finish = (result) => {
+                displayTestResult(testId, result);
+                updateExecutionStats(result);
+                testContainer.classList.remove('test-running');
+                resolve(result);
+            };
+            const fail = (error) => finish({
+                success: false,
+                error: error.message,
+                timestamp: new Date().toISOString()
+            });
+
+            try {
+                validateInWorker(collectTestInput(testId)).then(finish, fail);
+            } catch (error) {
+                fail(error);
+            }
+        }, 1000 + Math.random() * 2000); // Random delay 1-3 seconds
+    });
+}
+
+function collectTestInput(testId) {
+    // Get test container and form data
+    const testContainer = byId(`test-${testId}`);
+    const form = testContainer.querySelector('.test-form');
+    const formData = new FormData(form);
+
+    return {
+        testId: testId,
+        testName: testContainer.querySelector('.test-title').textContent,
+        category: testContainer.querySelector('.test-category').textContent,
+        testData: Object.fromEntries(formData.entries())
+    };
+}
+
+// Runs without DOM access so it can execute inside a worker
+function performTestExecution(input) {
+    const testData = input.testData;
+
+    // Perform mock validation based on category
+    const startTime = performance.now();
+    let result;
+
+    switch (input.category) {
+        case 'equivalence_partition':
+            result = validateEquivalencePartition(testData);
+            break;
+        case 'boundary_value':
+            result = validateBoundaryValue(testData);
+            break;
+        case 'error_condition':
+            result = validateErrorCondition(testData);
+            break;
+        case 'performance':
+            result = validatePerformance(testData);
+            break;
+        case 'security':
+            result = validateSecurity(testData);
+            break;
+        default:
+            result = validateGeneral(testData);
+    }
+
+    const endTime = performance.now();
+    const executionTime = endTime - startTime;
+
+    return {
+        testId: input.testId,
+        testName: input.testName,
+        category: input.category,
+        success: result.success,
+        result: result.message,
+        testData: testData,
+        executionTime: Math.round(executionTime * 100) / 100,
+        timestamp: new Date().toISOString(),
+        details: result.details || {}
+    };
+}
+
+// Validation runs off the UI thread in a small worker pool built from the
+// same functions; falls back to the main thread where workers are unavailable
+const workerPool = [];
+const pendingValidations = new Map();
+let nextWorker = 0;
+let nextRequestId = 0;
+let workersUnavailable = false;
+
+function createWorkerPool() {
+    const workerSrc = [
+        performTestExecution,
+        validateEquivalencePartition,
+        validateBoundaryValue,
+        validateErrorCondition,
+        validatePerformance,
+        validateSecurity,
+        validateGeneral
+    ].map(String).join('\n') + `
+self.onmessage = (e) => {
+    const { id, input } = e.data;
+    try {
+        self.postMessage({ id, result: performTestExecution(input) });
+    } catch (error) {
+        self.postMessage({ id, error: error.message });
+    }
+};`;
+    const url = URL.createObjectURL(new Blob([workerSrc], { type: 'text/javascript' }));
+    const size = Math.max(1, navigator.hardwareConcurrency || 2);
+
+    for (let i = 0; i < size; i++) {
+        const worker = new Worker(url);
+        worker.onmessage = (e) => {
+            const { id, result, error } = e.data;
+            const pending = pendingValidations.get(id);
+            if (!pending) return;
+            pendingValidations.delete(id);
+            if (error) {
+                pending.reject(new Error(error));
+            } else {
+                pending.resolve(result);
+            }
+        };
+        worker.onerror = () => {
+            // The worker could not start (e.g. blocked by CSP); finish on the main thread
+            workersUnavailable = true;
+            for (const [id, pending] of pendingValidations) {
+                pendingValidations.delete(id);
+                try {
+                    pending.resolve(performTestExecution(pending.input));
+                } catch (error) {
+                    pending.reject(error);
+                }
+            }
+        };
+        workerPool.push(worker);
+    }
+}
+
+function validateInWorker(input) {
+    if (!workersUnavailable && workerPool.length === 0) {
+        try {
+            createWorkerPool();
+        } catch (error) {
+            workersUnavailable = true;
+        }
+    }
+    if (workersUnavailable || workerPool.length === 0) {
+        return Promise.resolve().then(() => performTestExecution(input));
+    }
+
+    const id = nextRequestId++;
+    const worker = workerPool[nextWorker];
+    nextWorker = (nextWorker + 1) % workerPool.length;
+
+    return new Promise((resolve, reject) => {
+        pendingValidations.set(id, { input, resolve, reject });
+        worker.postMessage({ id, input });
+    });
+}
+
+// Validation functions for different test categories
+function validateEquivalencePartition(testData) {
+    const hasValidInputs = Object.values(testData).some(value => value && value.trim());
+    return {
+        success: hasValidInputs,
+        message: hasValidInputs ? 'Equivalence partition test passed' : 'No valid inputs provided',
+        details: { inputCount: Object.keys(testData).length }
+    };
+}
+
+function validateBoundaryValue(testData) {
+    const numericValues = Object.values(testData).filter(value => !isNaN(value) && value !== '');
+    const hasValidBoundaries = numericValues.length >= 2;
+    return {
+        success: hasValidBoundaries,
+        message: hasValidBoundaries ? 'Boundary value test passed' : 'Insufficient boundary values provided',
+        details: { boundaryCount: numericValues.length }
+    };
+}
+
+function validateErrorCondition(testData) {
+    const hasErrorInputs = Object.values(testData).some(value => 
+        value === '' || value === 'null' || value === 'undefined' || value.includes('<script>')
+    );
+    return {
+        success: hasErrorInputs,
+        message: hasErrorInputs ? 'Error condition test passed' : 'No error conditions triggered',
+        details: { errorInputsFound: hasErrorInputs }
+    };
+}
+
+function validatePerformance(testData) {
+    const iterations = parseInt(testData.iterations) || 1;
+    const timeout = parseInt(testData.timeout) || 5000;
+    const executionTime = Math.random() * 1000; // Mock execution time
+
+    const success = executionTime < timeout;
+    return {
+        success: success,
+        message: success ? `Performance test passed (${executionTime.toFixed(2)}ms)` : 'Performance test failed - timeout exceeded',
+        details: { 
+            iterations: iterations,
+            executionTime: executionTime,
+            timeout: timeout
+        }
+    };
+}
+
+function validateSecurity(testData) {
+    const securityThreats = Object.values(testData).filter(value => 
+        value.includes('<script>') || 
+        value.includes('DROP TABLE') || 
+        value.includes('SELECT * FROM') ||
+        value.length > 10000
+    );
+
+    const success = securityThreats.length === 0;
+    return {
+        success: success,
+        message: success ? 'Security test passed - no threats detected' : `Security test failed - ${securityThreats.length} threats detected`,
+        details: { threatsDetected: securityThreats.length }
+    };
+}
+
+function validateGeneral(testData) {
+    const hasInputs = Object.keys(testData).length > 0;
+    return {
+        success: hasInputs,
+        message: hasInputs ? 'General test passed' : 'No test data provided',
+        details: { inputFields: Object.keys(testData).length }
+    };
+}
+
+function displayTestResult(testId, result) {
+    const resultsDiv = byId(`results-${testId}`);
+    const testContainer = byId(`test-${testId}`);
+
+    // Update result display
+    resultsDiv.className = `test-results ${result.success ? 'success' : 'failure'}`;
+
+    resultsDiv.innerHTML = resultTemplate(result);
+
+    // Store result for reporting
+    testResults.push(result);
+    testResultIndex.set(result.testId, result);
+    detailsCache.delete(result.testId);
+}
+
+function updateExecutionStats(result) {
+    if (result.success) {
+        executionStats.passed++;
+    } else {
+        executionStats.failed++;
+    }
+    executionStats.total++;
+
+    // Update dashboard counters
+    updateDashboardCounters();
+}
+
+function updateDashboardCounters() {
+    const passedElement = byId('passed-count');
+    const failedElement = byId('failed-count');
+    const skippedElement = byId('skipped-count');
+
+    if (passedElement) passedElement.textContent = executionStats.passed;
+    if (failedElement) failedElement.textContent = executionStats.failed;
+    if (skippedElement) skippedElement.textContent = executionStats.skipped;
+}
+
+// Utility functions
+function resetTest(testId) {
+    const testContainer = byId(`test-${testId}`);
+    const form = testContainer.querySelector('.test-form');
+    const resultsDiv = byId(`results-${testId}`);
+
+    form.reset();
+    resultsDiv.style.display = 'none';
+    testContainer.classList.remove('test-running');
+}
+
+function generateValue(category, input) {
+    switch (category) {
+        case 'equivalence_partition':
+            if (input.type === 'number') {
+                return Math.floor(Math.random() * 100);
+            }
+            return 'test_value_' + Math.floor(Math.random() * 100);
+        case 'boundary_value':
+            if (input.type === 'number') {
+                return input.name.includes('min') ? 0 : 100;
+            }
+            return undefined;
+        case 'error_condition':
+            if (input.name.includes('null')) {
+                return '';
+            } else if (input.name.includes('invalid')) {
+                return 'invalid_data_type';
+            }
+            return undefined;
+        default:
+            return 'sample_data';
+    }
+}
+
+function generateTestData(testId) {
+    const testContainer = byId(`test-${testId}`);
+    const category = testContainer.querySelector('.test-category').textContent;
+    const inputs = testContainer.querySelectorAll('input, textarea, select');
+
+    // Read phase: collect everything needed before touching any values
+    const meta = Array.from(inputs, input => ({ el: input, type: input.type, name: input.name }));
+    const values = meta.map(m => generateValue(category, m));
+
+    // Write phase: assign values without interleaved reads
+    for (let k = 0; k < meta.length; k++) {
+        if (values[k] !== undefined) {
+            meta[k].el.value = values[k];
+        }
+    }
+}
+
+function runAllTests() {
+    const testForms = getAllTestForms();
+    let testIndex = 0;
+
+    const progressCard = document.getElementById('progress-card');
+    const progressBar = document.getElementById('progress-bar');
+    const progressText = document.getElementById('progress-text');
+    const progressPercentage = document.getElementById('progress-percentage');
+
+    progressCard.style.display = 'block';
+
+    // Progress writes are coalesced and flushed once per animation frame
+    let pending = null;
+    let frameRequested = false;
+
+    function applyProgress() {
+        frameRequested = false;
+        if (!pending) return;
+        progressBar.style.width = pending.width;
+        progressText.textContent = pending.text;
+        progressPercentage.textContent = pending.pct;
+        pending = null;
+    }
+
+    function scheduleProgress(width, text, pct) {
+        pending = { width, text, pct };
+        if (!frameRequested) {
+            frameRequested = true;
+            requestAnimationFrame(applyProgress);
+        }
+    }
+
+    const total = testForms.length;
+    const runs = [];
+    let completed = 0;
+
+    function reportCompletion() {
+        completed++;
+        const progress = (completed / total) * 100;
+        scheduleProgress(
+            progress + '%',
+            `Completed ${completed} of ${total} tests`,
+            Math.round(progress) + '%'
+        );
+    }
+
+    function finishRun() {
+        // Only report completion once every started test has produced its result
+        Promise.allSettled(runs).then(() => {
+            scheduleProgress('100%', 'All tests completed', '100%');
+            setTimeout(() => {
+                progressCard.style.display = 'none';
+                showResults();
+            }, 2000);
+        });
+    }
+
+    function runNextTest() {
+        if (testIndex >= total) {
+            finishRun();
+            return;
+        }
+
+        const form = testForms[testIndex];
+        const testContainer = form.closest('.test-case-container');
+        const testId = testContainer.id.replace('test-', '');
+
+        runs.push(runTest(testId).finally(reportCompletion));
+        testIndex++;
+
+        Promise.resolve().then(() => requestAnimationFrame(runNextTest));
+    }
+
+    scheduleProgress('0%', `Running ${total} tests`, '0%');
+    runNextTest();
+}
+
+function runSuiteTests(suiteId) {
+    const suite = document.getElementById(`suite-${suiteId}`);
+    const testForms = suite.querySelectorAll('.test-form');
+
+    // One scheduler walks the forms in order instead of a timer per form
+    let index = 0;
+
+    function step() {
+        if (index >= testForms.length) return;
+        const testContainer = testForms[index++].closest('.test-case-container');
+        const testId = testContainer.id.replace('test-', '');
+        executeTest(testId);
+        requestAnimationFrame(() => setTimeout(step, 1500));
+    }
+
+    step();
+}
+
+function resetSuite(suiteId) {
+    const suite = document.getElementById(`suite-${suiteId}`);
+    const testContainers = suite.querySelectorAll('.test-case-container');
+
+    testContainers.forEach(container => {
+        const testId = container.id.replace('test-', '');
+        resetTest(testId);
+    });
+}
+
+// Chart initialization and updates
+let resultsChart;
+
+function initializeCharts() {
+    const ctx = document.getElementById('resultsChart');
+    if (ctx) {
+        resultsChart = new Chart(ctx, {
+            type: 'doughnut',
+            data: {
+                labels: ['Passed', 'Failed', 'Skipped'],
+                datasets: [{
+                    data: [0, 0, 0],
+                    backgroundColor: ['#28a745', '#dc3545', '#ffc107']
+                }]
+            },
+            options: {
+                responsive: true,
+                plugins: {
+                    legend: {
+                        position: 'bottom'
+                    }
+                }
+            }
+        });
+    }
+}
+
+// Stat changes within the same frame collapse into a single, unanimated redraw
+let chartDirty = false;
+
+function scheduleChartUpdate() {
+    if (!resultsChart || chartDirty) return;
+    chartDirty = true;
+    requestAnimationFrame(() => {
+        // Update the existing array so Chart.js keeps its dataset bookkeeping
+        const data = resultsChart.data.datasets[0].data;
+        data[0] = executionStats.passed;
+        data[1] = executionStats.failed;
+        data[2] = executionStats.skipped;
+        resultsChart.update('none');
+        chartDirty = false;
+    });
+}
+
+function updateResultsTable() {
+    const tbody = document.querySelector('#results-table tbody');
+    if (!tbody) return;
+
+    // Build the rows off-document from elements (no HTML parsing) and swap
+    // them in with a single mutation
+    const fragment = document.createDocumentFragment();
+    for (const result of testResults) {
+        const nameCell = document.createElement('td');
+        nameCell.textContent = result.testName;
+
+        const categoryBadge = document.createElement('span');
+        categoryBadge.className = 'badge bg-secondary';
+        categoryBadge.textContent = result.category;
+        const categoryCell = document.createElement('td');
+        categoryCell.appendChild(categoryBadge);
+
+        const status = document.createElement('span');
+        status.className = `status-${result.success ? 'passed' : 'failed'}`;
+        status.textContent = result.success ? 'PASSED' : 'FAILED';
+        const statusCell = document.createElement('td');
+        statusCell.appendChild(status);
+
+        const timeCell = document.createElement('td');
+        timeCell.textContent = `${result.executionTime}ms`;
+
+        const viewButton = document.createElement('button');
+        viewButton.className = 'btn btn-sm btn-outline-info';
+        viewButton.textContent = 'View';
+        viewButton.addEventListener('click', () => showTestDetails(result.testId));
+        const detailsCell = document.createElement('td');
+        detailsCell.appendChild(viewButton);
+
+        const row = document.createElement('tr');
+        row.append(nameCell, categoryCell, statusCell, timeCell, detailsCell);
+        fragment.appendChild(row);
+    }
+    tbody.replaceChildren(fragment);
+}
+
+// Pretty-printed details are built on first view and reused until the test is re-run
+const detailsCache = new Map();
+let detailsModal = null;
+
+function showTestDetails(testId) {
+    const result = testResultIndex.get(testId);
+    if (!result) return;
+
+    let details = detailsCache.get(testId);
+    if (details === undefined) {
+        details = JSON.stringify(result, null, 2);
+        detailsCache.set(testId, details);
+    }
+
+    const modalElement = byId('test-details-modal');
+    if (!modalElement || typeof bootstrap === 'undefined') {
+        alert(`Test Details:\n\n${details}`);
+        return;
+    }
+
+    byId('test-details-content').textContent = details;
+    if (!detailsModal) detailsModal = new bootstrap.Modal(modalElement);
+    detailsModal.show();
+}
+
+// Export functions
+function exportResults() {
+    // Serialize each result separately; the Blob joins the parts without
+    // materializing one large intermediate string
+    const parts = ['{"executionStats":', JSON.stringify(executionStats), ',"testResults":['];
+    testResults.forEach((result, i) => {
+        parts.push((i ? ',' : '') + JSON.stringify(result));
+    });
+    parts.push('],"timestamp":', JSON.stringify(new Date().toISOString()), '}');
+
+    const blob = new Blob(parts, {
+        type: 'application/json'
+    });
+
+    const url = URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = url;
+    a.download = `test-results-${new Date().toISOString().split('T')[0]}.json`;
+    document.body.appendChild(a);
+    a.click();
+    document.body.removeChild(a);
+    URL.revokeObjectURL(url);
+}
+
+function generateReport() {
+    // This would generate a comprehensive report
+    alert('Report generation feature would be implemented here');
+}
+
+// Update size display for range inputs
+function updateSizeDisplay(testId) {
+    const range = document.getElementById(`data-size-${testId}`);
+    const display = document.getElementById(`size-display-${testId}`);
+    if (range && display) {
+        display.textContent = range.value;
+    }
+}
@@ -10,6 +10,7 @@ from datetime import datetime
 import logging
 
 from .config import Config
+from .serialization import loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +106,8 @@ class TestGenerator:
             'test_count': len(test_cases),
             'test_cases': test_cases,
             'html_forms': html_forms,
+            # Page-ready markup for all forms, joined once here for the web interface
+            'forms_html': ''.join(form['html'] for form in html_forms),
             'categories': list(set(tc.get('category', 'unknown') for tc in test_cases))
         }
 
@@ -115,7 +118,7 @@ class TestGenerator:
 
         try:
             # Try to parse as JSON first
-            parsed = json.loads(test_code)
+            parsed = loads_json(test_code)
             if isinstance(parsed, dict) and 'html_test_cases' in parsed:
                 test_cases = parsed['html_test_cases']
             elif isinstance(parsed, list):
@@ -489,7 +492,8 @@ class TestGenerator:
             'type': 'integration',
             'test_count': len(integration_tests),
             'test_cases': integration_tests,
-            'html_forms': []  # Would be implemented similar to function tests
+            'html_forms': [],  # Would be implemented similar to function tests
+            'forms_html': ''
         }
 
     async def _create_performance_test_suite(self, performance_tests: List[Dict]) -> Dict:
@@ -500,7 +504,8 @@ class TestGenerator:
             'type': 'performance',
             'test_count': len(performance_tests),
             'test_cases': performance_tests,
-            'html_forms': []
+            'html_forms': [],
+            'forms_html': ''
         }
 
     async def _create_security_test_suite(self, security_tests: List[Dict]) -> Dict:
@@ -511,5 +516,6 @@ class TestGenerator:
             'type': 'security',
             'test_count': len(security_tests),
             'test_cases': security_tests,
-            'html_forms': []
+            'html_forms': [],
+            'forms_html': ''
         }
@@ -3,71 +3,23 @@ Web Interface Generator for MDTD Test Engine
 Creates HTML5 web interfaces for interactive test execution
 """
 
-import json
-from typing import Dict, List, Any
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime
+from html import escape
+import hashlib
+import io
 import logging
+import shutil
+from pathlib import Path
 
 from .config import Config
+from .serialization import dumps_compact
 
 logger = logging.getLogger(__name__)
 
-
-class WebInterface:
-    """Creates interactive web interfaces for test execution"""
-
-    def __init__(self, config: Config):
-        self.config = config
-
-    async def create_test_interface(self, web_test_cases: Dict[str, Any]) -> str:
-        """
-        Create a complete HTML5 interface for test execution
-
-        Args:
-            web_test_cases: Web-compatible test cases from TestGenerator
-
-        Returns:
-            Complete HTML page as string
-        """
-        try:
-            logger.info("Creating HTML5 test interface...")
-
-            # Generate HTML components
-            html_head = self._generate_html_head()
-            html_body = self._generate_html_body(web_test_cases)
-            css_styles = self._generate_css_styles()
-            javascript_code = self._generate_javascript_code()
-
-            # Combine into complete HTML page
-            complete_html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    {html_head}
-    <style>
-        {css_styles}
-    </style>
-</head>
-<body>
-    {html_body}
-    
-    <script>
-        {javascript_code}
-    </script>
-</body>
-</html>
-"""
-
-            logger.info("HTML5 interface created successfully")
-            return complete_html
-
-        except Exception as e:
-            logger.error("Error creating web interface: {}".format(str(e)))
-            raise
-
-    def _generate_html_head(self) -> str:
-        """Generate HTML head section"""
-        return """
+# Head content: metadata and CDN stylesheets/scripts
+HTML_HEAD = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>AI-Assisted MDTD Test Engineering Interface</title>
@@ -86,253 +38,8 @@ class WebInterface:
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
 """
 
-    def _generate_html_body(self, web_test_cases: Dict[str, Any]) -> str:
-        """Generate HTML body with test interface"""
-
-        metadata = web_test_cases.get('metadata', {})
-        test_suites = web_test_cases.get('test_suites', [])
-
-        # Generate navigation
-        navigation = self._generate_navigation(test_suites)
-
-        # Generate dashboard
-        dashboard = self._generate_dashboard(metadata, test_suites)
-
-        # Generate test suites
-        test_suites_html = self._generate_test_suites_html(test_suites)
-
-        # Generate results panel
-        results_panel = self._generate_results_panel()
-
-        return f"""
-    <div class="container-fluid">
-        <!-- Header -->
-        <header class="bg-primary text-white py-3 mb-4">
-            <div class="container">
-                <div class="row align-items-center">
-                    <div class="col">
-                        <h1 class="mb-0">
-                            <i class="fas fa-robot me-2"></i>
-                            AI-Assisted MDTD Test Engineering
-                        </h1>
-                        <p class="mb-0 opacity-75">Model-Driven Test Development Interface</p>
-                    </div>
-                    <div class="col-auto">
-                        <button class="btn btn-light" onclick="exportResults()">
-                            <i class="fas fa-download me-1"></i> Export Results
-                        </button>
-                    </div>
-                </div>
-            </div>
-        </header>
-        
-        <!-- Navigation -->
-        {navigation}
-        
-        <!-- Main Content -->
-        <div class="container">
-            <div class="row">
-                <!-- Sidebar -->
-                <div class="col-md-3">
-                    {dashboard}
-                </div>
-                
-                <!-- Test Content -->
-                <div class="col-md-9">
-                    {test_suites_html}
-                </div>
-            </div>
-        </div>
-        
-        <!-- Results Panel -->
-        {results_panel}
-        
-        <!-- Footer -->
-        <footer class="bg-dark text-white text-center py-3 mt-5">
-            <p class="mb-0">Generated on {metadata.get('generated_at', datetime.now().isoformat())}</p>
-        </footer>
-    </div>
-    
-    <!-- Bootstrap JS -->
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-"""
-
-    def _generate_navigation(self, test_suites: List[Dict]) -> str:
-        """Generate navigation menu"""
-
-        nav_items = []
-        for suite in test_suites:
-            suite_id = suite.get('suite_id', '')
-            suite_name = suite.get('suite_name', 'Unknown Suite')
-            test_count = suite.get('test_count', 0)
-
-            nav_items.append(f"""
-                <li class="nav-item">
-                    <a class="nav-link" href="#suite-{suite_id}" onclick="showTestSuite('{suite_id}')">
-                        {suite_name} <span class="badge bg-secondary">{test_count}</span>
-                    </a>
-                </li>
-            """)
-
-        return f"""
-        <nav class="navbar navbar-expand-lg navbar-light bg-light mb-4">
-            <div class="container">
-                <ul class="navbar-nav me-auto">
-                    <li class="nav-item">
-                        <a class="nav-link active" href="#dashboard" onclick="showDashboard()">
-                            <i class="fas fa-tachometer-alt me-1"></i> Dashboard
-                        </a>
-                    </li>
-                    {''.join(nav_items)}
-                    <li class="nav-item">
-                        <a class="nav-link" href="#results" onclick="showResults()">
-                            <i class="fas fa-chart-bar me-1"></i> Results
-                        </a>
-                    </li>
-                </ul>
-            </div>
-        </nav>
-"""
-
-    def _generate_dashboard(self, metadata: Dict, test_suites: List[Dict]) -> str:
-        """Generate dashboard with statistics"""
-
-        total_tests = sum(suite.get('test_count', 0) for suite in test_suites)
-        languages = list(set(suite.get('language', 'unknown') for suite in test_suites if suite.get('language')))
-        categories = []
-        for suite in test_suites:
-            categories.extend(suite.get('categories', []))
-        unique_categories = list(set(categories))
-
-        return f"""
-        <div class="card mb-4" id="dashboard">
-            <div class="card-header">
-                <h5 class="mb-0">
-                    <i class="fas fa-info-circle me-2"></i>Test Overview
-                </h5>
-            </div>
-            <div class="card-body">
-                <div class="row text-center mb-3">
-                    <div class="col">
-                        <div class="border rounded p-2">
-                            <h3 class="text-primary mb-0">{len(test_suites)}</h3>
-                            <small>Test Suites</small>
-                        </div>
-                    </div>
-                    <div class="col">
-                        <div class="border rounded p-2">
-                            <h3 class="text-success mb-0">{total_tests}</h3>
-                            <small>Total Tests</small>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="mb-3">
-                    <h6>Languages Detected:</h6>
-                    <div class="d-flex flex-wrap gap-1">
-                        {' '.join(f'<span class="badge bg-primary">{lang}</span>' for lang in languages)}
-                    </div>
-                </div>
-                
-                <div class="mb-3">
-                    <h6>Test Categories:</h6>
-                    <div class="d-flex flex-wrap gap-1">
-                        {' '.join(f'<span class="badge bg-secondary">{cat}</span>' for cat in unique_categories)}
-                    </div>
-                </div>
-                
-                <div class="d-grid gap-2">
-                    <button class="btn btn-success" onclick="runAllTests()">
-                        <i class="fas fa-play me-1"></i> Run All Tests
-                    </button>
-                    <button class="btn btn-outline-primary" onclick="generateReport()">
-                        <i class="fas fa-file-alt me-1"></i> Generate Report
-                    </button>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Progress Card -->
-        <div class="card mb-4" id="progress-card" style="display: none;">
-            <div class="card-header">
-                <h6 class="mb-0">Test Execution Progress</h6>
-            </div>
-            <div class="card-body">
-                <div class="progress mb-2">
-                    <div class="progress-bar" role="progressbar" id="progress-bar" style="width: 0%"></div>
-                </div>
-                <div class="d-flex justify-content-between">
-                    <span id="progress-text">Ready to start</span>
-                    <span id="progress-percentage">0%</span>
-                </div>
-            </div>
-        </div>
-"""
-
-    def _generate_test_suites_html(self, test_suites: List[Dict]) -> str:
-        """Generate HTML for all test suites"""
-
-        suites_html = []
-
-        for suite in test_suites:
-            suite_html = self._generate_single_test_suite(suite)
-            suites_html.append(suite_html)
-
-        return ''.join(suites_html)
-
-    def _generate_single_test_suite(self, suite: Dict) -> str:
-        """Generate HTML for a single test suite"""
-
-        suite_id = suite.get('suite_id', '')
-        suite_name = suite.get('suite_name', 'Test Suite')
-        function_name = suite.get('function_name', '')
-        language = suite.get('language', 'unknown')
-        test_count = suite.get('test_count', 0)
-        html_forms = suite.get('html_forms', [])
-
-        # Generate test forms
-        forms_html = []
-        for form_data in html_forms:
-            forms_html.append(form_data.get('html', ''))
-
-        return f"""
-        <div class="test-suite-container mb-5" id="suite-{suite_id}" style="display: none;">
-            <div class="card">
-                <div class="card-header">
-                    <div class="row align-items-center">
-                        <div class="col">
-                            <h4 class="mb-0">{suite_name}</h4>
-                            <div class="mt-1">
-                                <span class="badge bg-info me-2">{language}</span>
-                                <span class="badge bg-secondary">{test_count} tests</span>
-                                {f'<span class="badge bg-success">Function: {function_name}</span>' if function_name else ''}
-                            </div>
-                        </div>
-                        <div class="col-auto">
-                            <div class="btn-group">
-                                <button class="btn btn-outline-primary btn-sm" onclick="runSuiteTests('{suite_id}')">
-                                    <i class="fas fa-play me-1"></i> Run Suite
-                                </button>
-                                <button class="btn btn-outline-secondary btn-sm" onclick="resetSuite('{suite_id}')">
-                                    <i class="fas fa-undo me-1"></i> Reset
-                                </button>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="card-body">
-                    <div class="test-cases-container">
-                        {''.join(forms_html)}
-                    </div>
-                </div>
-            </div>
-        </div>
-"""
-
-    def _generate_results_panel(self) -> str:
-        """Generate results panel for displaying test outcomes"""
-        return """
+# Results panel shown after tests run, plus the modal used for per-test details
+RESULTS_PANEL = """
         <div class="results-panel" id="results-panel" style="display: none;">
             <div class="container mt-4">
                 <div class="card">
@@ -395,33 +102,151 @@ class WebInterface:
                 </div>
             </div>
         </div>
+
+        <div class="modal fade" id="test-details-modal" tabindex="-1" aria-hidden="true">
+            <div class="modal-dialog modal-lg modal-dialog-scrollable">
+                <div class="modal-content">
+                    <div class="modal-header">
+                        <h5 class="modal-title">Test Details</h5>
+                        <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+                    </div>
+                    <div class="modal-body">
+                        <pre id="test-details-content"></pre>
+                    </div>
+                </div>
+            </div>
+        </div>
 """
 
-    def _generate_css_styles(self) -> str:
-        """Generate CSS styles for the interface"""
-        return """
-        /* Custom styles for MDTD Test Interface */
-        
-        body {
-            background-color: #f8f9fa;
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        }
-        
-        .test-case-container {
-            border: 1px solid #dee2e6;
-            border-radius: 0.5rem;
-            padding: 1.5rem;
-            margin-bottom: 2rem;
-            background: white;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            transition: box-shadow 0.3s ease;
-        }
+# Number of rendered pages kept per WebInterface for regenerating identical test cases
+INTERFACE_CACHE_SIZE = 16
+
+# Static body text from the end of the test suites up to the footer timestamp,
+# including the results panel, and the text after the timestamp
+SUITES_TO_FOOTER = """
+                </div>
+            </div>
+        </div>
         
-        .test-case-container:hover {
-            box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-        }
+        <!-- Results Panel -->
+        """ + RESULTS_PANEL + """
         
-        .test-header {
+        <!-- Footer -->
+        <footer class="bg-dark text-white text-center py-3 mt-5">
+            <p class="mb-0">Generated on """
+FOOTER_END = """</p>
+        </footer>
+    </div>
+    
+    <!-- Bootstrap JS -->
+    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+"""
+
+# Navigation entry for one test suite, filled with already-escaped values
+NAV_ITEM = """
+                <li class="nav-item">
+                    <a class="nav-link" href="#suite-{suite_id}" onclick="showTestSuite({suite_id_js})">
+                        {suite_name} <span class="badge bg-secondary">{test_count}</span>
+                    </a>
+                </li>
+            """
+
+# Dashboard badges, filled with an already-escaped language or category
+LANGUAGE_BADGE = '<span class="badge bg-primary">{}</span>'
+CATEGORY_BADGE = '<span class="badge bg-secondary">{}</span>'
+
+# Opening markup of a test suite card, up to its forms, with and without the
+# function badge (filled with str.format; the values are already escaped)
+SUITE_HEADER_WITH_FUNCTION = """
+        <div class="test-suite-container mb-5" id="suite-{suite_id}" style="display: none;">
+            <div class="card">
+                <div class="card-header">
+                    <div class="row align-items-center">
+                        <div class="col">
+                            <h4 class="mb-0">{suite_name}</h4>
+                            <div class="mt-1">
+                                <span class="badge bg-info me-2">{language}</span>
+                                <span class="badge bg-secondary">{test_count} tests</span>
+                                <span class="badge bg-success">Function: {function_name}</span>
+                            </div>
+                        </div>
+                        <div class="col-auto">
+                            <div class="btn-group">
+                                <button class="btn btn-outline-primary btn-sm" onclick="runSuiteTests({suite_id_js})">
+                                    <i class="fas fa-play me-1"></i> Run Suite
+                                </button>
+                                <button class="btn btn-outline-secondary btn-sm" onclick="resetSuite({suite_id_js})">
+                                    <i class="fas fa-undo me-1"></i> Reset
+                                </button>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="card-body">
+                    <div class="test-cases-container">
+                        """
+SUITE_HEADER = """
+        <div class="test-suite-container mb-5" id="suite-{suite_id}" style="display: none;">
+            <div class="card">
+                <div class="card-header">
+                    <div class="row align-items-center">
+                        <div class="col">
+                            <h4 class="mb-0">{suite_name}</h4>
+                            <div class="mt-1">
+                                <span class="badge bg-info me-2">{language}</span>
+                                <span class="badge bg-secondary">{test_count} tests</span>
+                                
+                            </div>
+                        </div>
+                        <div class="col-auto">
+                            <div class="btn-group">
+                                <button class="btn btn-outline-primary btn-sm" onclick="runSuiteTests({suite_id_js})">
+                                    <i class="fas fa-play me-1"></i> Run Suite
+                                </button>
+                                <button class="btn btn-outline-secondary btn-sm" onclick="resetSuite({suite_id_js})">
+                                    <i class="fas fa-undo me-1"></i> Reset
+                                </button>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="card-body">
+                    <div class="test-cases-container">
+                        """
+# Closing markup of a test suite card
+SUITE_FOOTER = """
+                    </div>
+                </div>
+            </div>
+        </div>
+"""
+
+# Interface styles
+CSS_STYLES = """
+        /* Custom styles for MDTD Test Interface */
+        
+        body {
+            background-color: #f8f9fa;
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        }
+        
+        .test-case-container {
+            border: 1px solid #dee2e6;
+            border-radius: 0.5rem;
+            padding: 1.5rem;
+            margin-bottom: 2rem;
+            background: white;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            transition: box-shadow 0.3s ease;
+        }
+        
+        .test-case-container:hover {
+            box-shadow: 0 4px 8px rgba(0,0,0,0.15);
+        }
+        
+        .test-header {
             display: flex;
             justify-content: between;
             align-items: center;
@@ -602,489 +427,344 @@ class WebInterface:
         }
 """
 
-    def _generate_javascript_code(self) -> str:
-        """Generate JavaScript code for interface functionality"""
-        return """
-        // Global variables
-        let testResults = [];
-        let currentSuite = null;
-        let executionStats = {
-            passed: 0,
-            failed: 0,
-            skipped: 0,
-            total: 0
-        };
-        
-        // Initialize the interface
-        document.addEventListener('DOMContentLoaded', function() {
-            showDashboard();
-            initializeCharts();
-            hljs.highlightAll();
-        });
-        
-        // Navigation functions
-        function showDashboard() {
-            hideAllSections();
-            document.getElementById('dashboard').style.display = 'block';
-            setActiveNavItem('dashboard');
-        }
-        
-        function showTestSuite(suiteId) {
-            hideAllSections();
-            document.getElementById(`suite-${suiteId}`).style.display = 'block';
-            currentSuite = suiteId;
-        }
-        
-        function showResults() {
-            hideAllSections();
-            document.getElementById('results-panel').style.display = 'block';
-            updateResultsChart();
-        }
-        
-        function hideAllSections() {
-            // Hide dashboard
-            const dashboard = document.getElementById('dashboard');
-            if (dashboard) dashboard.style.display = 'none';
-            
-            // Hide all test suites
-            const suites = document.querySelectorAll('.test-suite-container');
-            suites.forEach(suite => suite.style.display = 'none');
-            
-            // Hide results panel
-            const results = document.getElementById('results-panel');
-            if (results) results.style.display = 'none';
-        }
-        
-        function setActiveNavItem(itemId) {
-            // Remove active class from all nav items
-            document.querySelectorAll('.nav-link').forEach(link => {
-                link.classList.remove('active');
-            });
-            
-            // Add active class to current item
-            const activeLink = document.querySelector(`a[href="#${itemId}"]`);
-            if (activeLink) activeLink.classList.add('active');
-        }
-        
-        // Test execution functions
-        function executeTest(testId, event) {
-            if (event) event.preventDefault();
-            
-            const testContainer = document.getElementById(`test-${testId}`);
-            const resultsDiv = document.getElementById(`results-${testId}`);
-            
-            if (!testContainer || !resultsDiv) {
-                console.error(`Test elements not found for ID: ${testId}`);
-                return false;
-            }
-            
-            // Show loading state
-            testContainer.classList.add('test-running');
-            resultsDiv.style.display = 'block';
-            resultsDiv.innerHTML = '<div class="spinner"></div>Executing test...';
-            
-            // Simulate test execution with delay
-            setTimeout(() => {
-                try {
-                    const result = performTestExecution(testId);
-                    displayTestResult(testId, result);
-                    updateExecutionStats(result);
-                } catch (error) {
-                    const errorResult = {
-                        success: false,
-                        error: error.message,
-                        timestamp: new Date().toISOString()
-                    };
-                    displayTestResult(testId, errorResult);
-                    updateExecutionStats(errorResult);
-                } finally {
-                    testContainer.classList.remove('test-running');
-                }
-            }, 1000 + Math.random() * 2000); // Random delay 1-3 seconds
-            
-            return false;
-        }
-        
-        function performTestExecution(testId) {
-            // Get test container and form data
-            const testContainer = document.getElementById(`test-${testId}`);
-            const form = testContainer.querySelector('.test-form');
-            const formData = new FormData(form);
-            const testData = Object.fromEntries(formData.entries());
-            
-            // Get test metadata
-            const testTitle = testContainer.querySelector('.test-title').textContent;
-            const testCategory = testContainer.querySelector('.test-category').textContent;
-            
-            // Perform mock validation based on category
-            const startTime = performance.now();
-            let result;
-            
-            switch (testCategory) {
-                case 'equivalence_partition':
-                    result = validateEquivalencePartition(testData);
-                    break;
-                case 'boundary_value':
-                    result = validateBoundaryValue(testData);
-                    break;
-                case 'error_condition':
-                    result = validateErrorCondition(testData);
-                    break;
-                case 'performance':
-                    result = validatePerformance(testData);
-                    break;
-                case 'security':
-                    result = validateSecurity(testData);
-                    break;
-                default:
-                    result = validateGeneral(testData);
-            }
-            
-            const endTime = performance.now();
-            const executionTime = endTime - startTime;
-            
-            return {
-                testId: testId,
-                testName: testTitle,
-                category: testCategory,
-                success: result.success,
-                result: result.message,
-                testData: testData,
-                executionTime: Math.round(executionTime * 100) / 100,
-                timestamp: new Date().toISOString(),
-                details: result.details || {}
-            };
-        }
-        
-        // Validation functions for different test categories
-        function validateEquivalencePartition(testData) {
-            const hasValidInputs = Object.values(testData).some(value => value && value.trim());
-            return {
-                success: hasValidInputs,
-                message: hasValidInputs ? 'Equivalence partition test passed' : 'No valid inputs provided',
-                details: { inputCount: Object.keys(testData).length }
-            };
-        }
-        
-        function validateBoundaryValue(testData) {
-            const numericValues = Object.values(testData).filter(value => !isNaN(value) && value !== '');
-            const hasValidBoundaries = numericValues.length >= 2;
-            return {
-                success: hasValidBoundaries,
-                message: hasValidBoundaries ? 'Boundary value test passed' : 'Insufficient boundary values provided',
-                details: { boundaryCount: numericValues.length }
-            };
-        }
-        
-        function validateErrorCondition(testData) {
-            const hasErrorInputs = Object.values(testData).some(value => 
-                value === '' || value === 'null' || value === 'undefined' || value.includes('<script>')
-            );
-            return {
-                success: hasErrorInputs,
-                message: hasErrorInputs ? 'Error condition test passed' : 'No error conditions triggered',
-                details: { errorInputsFound: hasErrorInputs }
-            };
-        }
-        
-        function validatePerformance(testData) {
-            const iterations = parseInt(testData.iterations) || 1;
-            const timeout = parseInt(testData.timeout) || 5000;
-            const executionTime = Math.random() * 1000; // Mock execution time
-            
-            const success = executionTime < timeout;
-            return {
-                success: success,
-                message: success ? `Performance test passed (${executionTime.toFixed(2)}ms)` : 'Performance test failed - timeout exceeded',
-                details: { 
-                    iterations: iterations,
-                    executionTime: executionTime,
-                    timeout: timeout
-                }
-            };
-        }
-        
-        function validateSecurity(testData) {
-            const securityThreats = Object.values(testData).filter(value => 
-                value.includes('<script>') || 
-                value.includes('DROP TABLE') || 
-                value.includes('SELECT * FROM') ||
-                value.length > 10000
-            );
-            
-            const success = securityThreats.length === 0;
-            return {
-                success: success,
-                message: success ? 'Security test passed - no threats detected' : `Security test failed - ${securityThreats.length} threats detected`,
-                details: { threatsDetected: securityThreats.length }
-            };
-        }
-        
-        function validateGeneral(testData) {
-            const hasInputs = Object.keys(testData).length > 0;
-            return {
-                success: hasInputs,
-                message: hasInputs ? 'General test passed' : 'No test data provided',
-                details: { inputFields: Object.keys(testData).length }
-            };
+# Client-side test runner, shipped as a static file next to each generated page
+STATIC_DIR = Path(__file__).parent / 'static'
+RUNNER_SCRIPT = 'mdtd_runner.js'
+
+
+def _js_string_attr(value: Any) -> str:
+    """
+    Encode a value as a JS string literal for an inline event handler attribute
+
+    HTML escaping alone is undone by the browser before the handler runs, so
+    the value is first encoded as a JSON string (a valid JS literal) and the
+    result is then HTML-escaped for the attribute.
+    """
+    return escape(dumps_compact(str(value)))
+
+
+def _interface_key(web_test_cases: Dict[str, Any]) -> bytes:
+    """Digest of the test cases a page is rendered from, ignoring the generation time"""
+    metadata = web_test_cases.get('metadata', {})
+    if 'generated_at' in metadata:
+        web_test_cases = {
+            **web_test_cases,
+            'metadata': {key: value for key, value in metadata.items() if key != 'generated_at'}
         }
-        
-        function displayTestResult(testId, result) {
-            const resultsDiv = document.getElementById(`results-${testId}`);
-            const testContainer = document.getElementById(`test-${testId}`);
-            
-            // Update result display
-            resultsDiv.className = `test-results ${result.success ? 'success' : 'failure'}`;
-            
-            const resultHtml = `
-                <h4>Test Results</h4>
-                <div class="result-content">
-                    <strong>Status:</strong> <span class="status-${result.success ? 'passed' : 'failed'}">
-                        ${result.success ? 'PASSED' : 'FAILED'}
-                    </span>
-                    
-                    <strong>Message:</strong> ${result.result}
-                    
-                    <strong>Execution Time:</strong> ${result.executionTime}ms
-                    
-                    <strong>Timestamp:</strong> ${new Date(result.timestamp).toLocaleString()}
-                    
-                    ${result.details ? `<strong>Details:</strong> ${JSON.stringify(result.details, null, 2)}` : ''}
+    return hashlib.blake2b(dumps_compact(web_test_cases, sort_keys=True).encode('utf-8'), digest_size=16).digest()
+
+
+class WebInterface:
+    """Creates interactive web interfaces for test execution"""
+
+    # Static page text around the body, cached per class (see _page_scaffolding)
+    _scaffolding: Optional[Tuple[str, bytes]] = None
+
+    def __init__(self, config: Config):
+        self.config = config
+        # Encoded pages up to the footer timestamp, keyed by _interface_key (LRU order)
+        self._rendered: 'OrderedDict[bytes, bytes]' = OrderedDict()
+
+    def create_test_interface(self, web_test_cases: Dict[str, Any]) -> bytes:
+        """
+        Create a complete HTML5 interface for test execution
+
+        Args:
+            web_test_cases: Web-compatible test cases from TestGenerator
+
+        Returns:
+            Complete HTML page, UTF-8 encoded and ready to write
+        """
+        try:
+            logger.info("Creating HTML5 test interface...")
+
+            page_prefix, page_closing = self._page_scaffolding()
+            metadata = web_test_cases.get('metadata', {})
+
+            # The page up to the footer timestamp depends only on the test cases, so
+            # regenerating an interface for the same cases reuses the rendered text
+            key = _interface_key(web_test_cases)
+            page_head = self._rendered.get(key)
+            if page_head is None:
+                # Every section writes into one buffer, so large suites are never
+                # assembled into intermediate strings and copied again
+                buf = io.StringIO()
+                buf.write(page_prefix)
+                self._write_html_body(buf, web_test_cases)
+                page_head = buf.getvalue().encode('utf-8')
+                self._rendered[key] = page_head
+                if len(self._rendered) > INTERFACE_CACHE_SIZE:
+                    self._rendered.popitem(last=False)
+            else:
+                self._rendered.move_to_end(key)
+
+            # Only fall back to the current time when the test cases carry none
+            generated_at = metadata['generated_at'] if 'generated_at' in metadata else datetime.now().isoformat()
+            generated_at = escape(str(generated_at))
+
+            logger.info("HTML5 interface created successfully")
+            return b''.join((page_head, generated_at.encode('utf-8'), page_closing))
+
+        except Exception as e:
+            logger.error("Error creating web interface: {}".format(str(e)))
+            raise
+
+    def _page_scaffolding(self) -> Tuple[str, bytes]:
+        """
+        Get the static page text around the body, composed once per class
+
+        The text is stored on the concrete class rather than the instance, so every
+        WebInterface shares it, while subclasses that override the head, styles or
+        script sections get their own copy.
+
+        Returns:
+            Tuple of (doctype, head and styles up to <body>; encoded footer end and
+            closing scripts that follow the footer timestamp)
+        """
+        cls = type(self)
+        scaffolding = cls.__dict__.get('_scaffolding')
+        if scaffolding is None:
+            scaffolding = (
+                f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    {self._generate_html_head()}
+    <style>
+        {self._generate_css_styles()}
+    </style>
+</head>
+<body>
+    """,
+                (FOOTER_END + f"""
+    
+    <script src="{RUNNER_SCRIPT}"></script>
+</body>
+</html>
+""").encode('utf-8')
+            )
+            cls._scaffolding = scaffolding
+        return scaffolding
+
+    def _generate_html_head(self) -> str:
+        """Generate HTML head section"""
+        return HTML_HEAD
+
+    def _write_html_body(self, buf: io.StringIO, web_test_cases: Dict[str, Any]):
+        """Write HTML body with test interface, up to the footer timestamp"""
+
+        metadata = web_test_cases.get('metadata', {})
+        test_suites = web_test_cases.get('test_suites', [])
+
+        buf.write("""
+    <div class="container-fluid">
+        <!-- Header -->
+        <header class="bg-primary text-white py-3 mb-4">
+            <div class="container">
+                <div class="row align-items-center">
+                    <div class="col">
+                        <h1 class="mb-0">
+                            <i class="fas fa-robot me-2"></i>
+                            AI-Assisted MDTD Test Engineering
+                        </h1>
+                        <p class="mb-0 opacity-75">Model-Driven Test Development Interface</p>
+                    </div>
+                    <div class="col-auto">
+                        <button class="btn btn-light" onclick="exportResults()">
+                            <i class="fas fa-download me-1"></i> Export Results
+                        </button>
+                    </div>
                 </div>
-            `;
-            
-            resultsDiv.innerHTML = resultHtml;
-            
-            // Store result for reporting
-            testResults.push(result);
-        }
-        
-        function updateExecutionStats(result) {
-            if (result.success) {
-                executionStats.passed++;
-            } else {
-                executionStats.failed++;
-            }
-            executionStats.total++;
-            
-            // Update dashboard counters
-            updateDashboardCounters();
-        }
-        
-        function updateDashboardCounters() {
-            const passedElement = document.getElementById('passed-count');
-            const failedElement = document.getElementById('failed-count');
-            const skippedElement = document.getElementById('skipped-count');
-            
-            if (passedElement) passedElement.textContent = executionStats.passed;
-            if (failedElement) failedElement.textContent = executionStats.failed;
-            if (skippedElement) skippedElement.textContent = executionStats.skipped;
-        }
-        
-        // Utility functions
-        function resetTest(testId) {
-            const testContainer = document.getElementById(`test-${testId}`);
-            const form = testContainer.querySelector('.test-form');
-            const resultsDiv = document.getElementById(`results-${testId}`);
-            
-            form.reset();
-            resultsDiv.style.display = 'none';
-            testContainer.classList.remove('test-running');
-        }
+            </div>
+        </header>
         
-        function generateTestData(testId) {
-            const testContainer = document.getElementById(`test-${testId}`);
-            const category = testContainer.querySelector('.test-category').textContent;
-            const inputs = testContainer.querySelectorAll('input, textarea, select');
-            
-            inputs.forEach(input => {
-                switch (category) {
-                    case 'equivalence_partition':
-                        if (input.type === 'number') {
-                            input.value = Math.floor(Math.random() * 100);
-                        } else {
-                            input.value = 'test_value_' + Math.floor(Math.random() * 100);
-                        }
-                        break;
-                    case 'boundary_value':
-                        if (input.type === 'number') {
-                            input.value = input.name.includes('min') ? 0 : 100;
-                        }
-                        break;
-                    case 'error_condition':
-                        if (input.name.includes('null')) {
-                            input.value = '';
-                        } else if (input.name.includes('invalid')) {
-                            input.value = 'invalid_data_type';
-                        }
-                        break;
-                    default:
-                        input.value = 'sample_data';
-                }
-            });
-        }
+        <!-- Navigation -->
+        """)
+        self._write_navigation(buf, test_suites)
+        buf.write("""
         
-        function runAllTests() {
-            const allTestForms = document.querySelectorAll('.test-form');
-            let testIndex = 0;
-            
-            const progressCard = document.getElementById('progress-card');
-            const progressBar = document.getElementById('progress-bar');
-            const progressText = document.getElementById('progress-text');
-            const progressPercentage = document.getElementById('progress-percentage');
-            
-            progressCard.style.display = 'block';
-            
-            function runNextTest() {
-                if (testIndex >= allTestForms.length) {
-                    progressText.textContent = 'All tests completed';
-                    setTimeout(() => {
-                        progressCard.style.display = 'none';
-                        showResults();
-                    }, 2000);
-                    return;
-                }
+        <!-- Main Content -->
+        <div class="container">
+            <div class="row">
+                <!-- Sidebar -->
+                <div class="col-md-3">
+                    """)
+        self._write_dashboard(buf, metadata, test_suites)
+        buf.write("""
+                </div>
                 
-                const form = allTestForms[testIndex];
-                const testContainer = form.closest('.test-case-container');
-                const testId = testContainer.id.replace('test-', '');
+                <!-- Test Content -->
+                <div class="col-md-9">
+                    """)
+        self._write_test_suites_html(buf, test_suites)
+        buf.write(SUITES_TO_FOOTER)
+
+    def _write_navigation(self, buf: io.StringIO, test_suites: List[Dict]):
+        """Write navigation menu"""
+        buf.write("""
+        <nav class="navbar navbar-expand-lg navbar-light bg-light mb-4">
+            <div class="container">
+                <ul class="navbar-nav me-auto">
+                    <li class="nav-item">
+                        <a class="nav-link active" href="#dashboard" onclick="showDashboard()">
+                            <i class="fas fa-tachometer-alt me-1"></i> Dashboard
+                        </a>
+                    </li>
+                    """)
+        for suite in test_suites:
+            get = suite.get
+            raw_suite_id = get('suite_id', '')
+            suite_id = escape(str(raw_suite_id))
+            suite_name = escape(str(get('suite_name', 'Unknown Suite')))
+            test_count = get('test_count', 0)
+            buf.write(NAV_ITEM.format(
+                suite_id=suite_id,
+                suite_id_js=_js_string_attr(raw_suite_id),
+                suite_name=suite_name,
+                test_count=test_count
+            ))
+        buf.write("""
+                    <li class="nav-item">
+                        <a class="nav-link" href="#results" onclick="showResults()">
+                            <i class="fas fa-chart-bar me-1"></i> Results
+                        </a>
+                    </li>
+                </ul>
+            </div>
+        </nav>
+""")
+
+    def _write_dashboard(self, buf: io.StringIO, metadata: Dict, test_suites: List[Dict]):
+        """Write dashboard with statistics"""
+
+        # Totals, languages and categories gathered in one pass over the suites
+        total_tests = 0
+        languages = set()
+        unique_categories = set()
+        for suite in test_suites:
+            get = suite.get
+            total_tests += get('test_count', 0)
+            language = get('language')
+            if language:
+                languages.add(language)
+            unique_categories.update(get('categories', ()))
+
+        buf.write(f"""
+        <div class="card mb-4" id="dashboard">
+            <div class="card-header">
+                <h5 class="mb-0">
+                    <i class="fas fa-info-circle me-2"></i>Test Overview
+                </h5>
+            </div>
+            <div class="card-body">
+                <div class="row text-center mb-3">
+                    <div class="col">
+                        <div class="border rounded p-2">
+                            <h3 class="text-primary mb-0">{len(test_suites)}</h3>
+                            <small>Test Suites</small>
+                        </div>
+                    </div>
+                    <div class="col">
+                        <div class="border rounded p-2">
+                            <h3 class="text-success mb-0">{total_tests}</h3>
+                            <small>Total Tests</small>
+                        </div>
+                    </div>
+                </div>
                 
-                const progress = ((testIndex + 1) / allTestForms.length) * 100;
-                progressBar.style.width = progress + '%';
-                progressText.textContent = `Running test ${testIndex + 1} of ${allTestForms.length}`;
-                progressPercentage.textContent = Math.round(progress) + '%';
+                <div class="mb-3">
+                    <h6>Languages Detected:</h6>
+                    <div class="d-flex flex-wrap gap-1">
+                        """)
+        buf.write(' '.join(map(LANGUAGE_BADGE.format, map(escape, map(str, languages)))))
+        buf.write("""
+                    </div>
+                </div>
                 
-                executeTest(testId);
-                testIndex++;
+                <div class="mb-3">
+                    <h6>Test Categories:</h6>
+                    <div class="d-flex flex-wrap gap-1">
+                        """)
+        buf.write(' '.join(map(CATEGORY_BADGE.format, map(escape, map(str, unique_categories)))))
+        buf.write("""
+                    </div>
+                </div>
                 
-                setTimeout(runNextTest, 2000);
-            }
-            
-            runNextTest();
-        }
-        
-        function runSuiteTests(suiteId) {
-            const suite = document.getElementById(`suite-${suiteId}`);
-            const testForms = suite.querySelectorAll('.test-form');
-            
-            testForms.forEach((form, index) => {
-                setTimeout(() => {
-                    const testContainer = form.closest('.test-case-container');
-                    const testId = testContainer.id.replace('test-', '');
-                    executeTest(testId);
-                }, index * 1500);
-            });
-        }
-        
-        function resetSuite(suiteId) {
-            const suite = document.getElementById(`suite-${suiteId}`);
-            const testContainers = suite.querySelectorAll('.test-case-container');
-            
-            testContainers.forEach(container => {
-                const testId = container.id.replace('test-', '');
-                resetTest(testId);
-            });
-        }
-        
-        // Chart initialization and updates
-        let resultsChart;
-        
-        function initializeCharts() {
-            const ctx = document.getElementById('resultsChart');
-            if (ctx) {
-                resultsChart = new Chart(ctx, {
-                    type: 'doughnut',
-                    data: {
-                        labels: ['Passed', 'Failed', 'Skipped'],
-                        datasets: [{
-                            data: [0, 0, 0],
-                            backgroundColor: ['#28a745', '#dc3545', '#ffc107']
-                        }]
-                    },
-                    options: {
-                        responsive: true,
-                        plugins: {
-                            legend: {
-                                position: 'bottom'
-                            }
-                        }
-                    }
-                });
-            }
-        }
-        
-        function updateResultsChart() {
-            if (resultsChart) {
-                resultsChart.data.datasets[0].data = [
-                    executionStats.passed,
-                    executionStats.failed,
-                    executionStats.skipped
-                ];
-                resultsChart.update();
-            }
-            
-            // Update results table
-            updateResultsTable();
-        }
-        
-        function updateResultsTable() {
-            const tbody = document.querySelector('#results-table tbody');
-            if (!tbody) return;
-            
-            tbody.innerHTML = '';
-            
-            testResults.forEach(result => {
-                const row = tbody.insertRow();
-                row.innerHTML = `
-                    <td>${result.testName}</td>
-                    <td><span class="badge bg-secondary">${result.category}</span></td>
-                    <td><span class="status-${result.success ? 'passed' : 'failed'}">${result.success ? 'PASSED' : 'FAILED'}</span></td>
-                    <td>${result.executionTime}ms</td>
-                    <td><button class="btn btn-sm btn-outline-info" onclick="showTestDetails('${result.testId}')">View</button></td>
-                `;
-            });
-        }
-        
-        function showTestDetails(testId) {
-            const result = testResults.find(r => r.testId === testId);
-            if (result) {
-                alert(`Test Details:\n\n${JSON.stringify(result, null, 2)}`);
-            }
-        }
-        
-        // Export functions
-        function exportResults() {
-            const exportData = {
-                executionStats: executionStats,
-                testResults: testResults,
-                timestamp: new Date().toISOString()
-            };
-            
-            const blob = new Blob([JSON.stringify(exportData, null, 2)], {
-                type: 'application/json'
-            });
-            
-            const url = URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = `test-results-${new Date().toISOString().split('T')[0]}.json`;
-            document.body.appendChild(a);
-            a.click();
-            document.body.removeChild(a);
-            URL.revokeObjectURL(url);
-        }
-        
-        function generateReport() {
-            // This would generate a comprehensive report
-            alert('Report generation feature would be implemented here');
-        }
+                <div class="d-grid gap-2">
+                    <button class="btn btn-success" onclick="runAllTests()">
+                        <i class="fas fa-play me-1"></i> Run All Tests
+                    </button>
+                    <button class="btn btn-outline-primary" onclick="generateReport()">
+                        <i class="fas fa-file-alt me-1"></i> Generate Report
+                    </button>
+                </div>
+            </div>
+        </div>
         
-        // Update size display for range inputs
-        function updateSizeDisplay(testId) {
-            const range = document.getElementById(`data-size-${testId}`);
-            const display = document.getElementById(`size-display-${testId}`);
-            if (range && display) {
-                display.textContent = range.value;
-            }
-        }
-"""
+        <!-- Progress Card -->
+        <div class="card mb-4" id="progress-card" style="display: none;">
+            <div class="card-header">
+                <h6 class="mb-0">Test Execution Progress</h6>
+            </div>
+            <div class="card-body">
+                <div class="progress mb-2">
+                    <div class="progress-bar" role="progressbar" id="progress-bar" style="width: 0%"></div>
+                </div>
+                <div class="d-flex justify-content-between">
+                    <span id="progress-text">Ready to start</span>
+                    <span id="progress-percentage">0%</span>
+                </div>
+            </div>
+        </div>
+""")
+
+    def _write_test_suites_html(self, buf: io.StringIO, test_suites: List[Dict]):
+        """Write HTML for all test suites"""
+        for suite in test_suites:
+            self._write_single_test_suite(buf, suite)
+
+    def _write_single_test_suite(self, buf: io.StringIO, suite: Dict):
+        """Write HTML for a single test suite"""
+
+        # Suite fields come from analyzed source code, so they are escaped before
+        # being placed in element text or attribute values
+        get = suite.get
+        raw_suite_id = get('suite_id', '')
+        suite_id = escape(str(raw_suite_id))
+        suite_name = escape(str(get('suite_name', 'Test Suite')))
+        function_name = escape(str(get('function_name', '')))
+        language = escape(str(get('language', 'unknown')))
+        test_count = get('test_count', 0)
+
+        header = SUITE_HEADER_WITH_FUNCTION if function_name else SUITE_HEADER
+        buf.write(header.format(
+            suite_id=suite_id,
+            suite_id_js=_js_string_attr(raw_suite_id),
+            suite_name=suite_name,
+            language=language,
+            test_count=test_count,
+            function_name=function_name
+        ))
+
+        # Test forms are joined once by TestGenerator; suites built elsewhere
+        # may only carry the individual forms
+        forms_html = get('forms_html')
+        if forms_html is not None:
+            buf.write(forms_html)
+        else:
+            for form_data in get('html_forms', []):
+                buf.write(form_data.get('html', ''))
+        buf.write(SUITE_FOOTER)
+
+    def _generate_css_styles(self) -> str:
+        """Generate CSS styles for the interface"""
+        return CSS_STYLES
+
+    def copy_static_assets(self, output_dir: Path):
+        """
+        Copy the files referenced by the generated page into its directory
+
+        Args:
+            output_dir: Directory the HTML interface is written to
+        """
+        shutil.copyfile(STATIC_DIR / RUNNER_SCRIPT, output_dir / RUNNER_SCRIPT)